@@ -0,0 +1,23 @@
+import sys
+from datetime import datetime
+sys.path.append( '../modules' )
+from load_data import LoadData
+from backfill import Backfill
+from config import username, token
+
+if __name__ == '__main__':
+
+    # Instantiate Module for Loading & Preprocessing Data (pulls the latest UFS-WM logs' history)
+    data_wrapper = LoadData(username, token)
+
+    # Backfill a year of logs' history split into 2-week shards, processed by a worker per CPU.
+    # Shards completed under dataframes/backfill are kept, thus re-running the script retries only the failed shards.
+    backfill = Backfill('ufs-repo', log_dir='/tests/logs', rev='HEAD', shard_dir='dataframes/backfill')
+    failed = backfill.run(since=datetime(2023, 3, 1), until=datetime(2024, 3, 1), shard_days=14)
+
+    # Merge the shards into a single deduplicated dataset, once all shards completed
+    if failed:
+        print(f'{len(failed)} shard(s) failed. Re-run to retry them.')
+    else:
+        records_df = backfill.merge(data_wrapper)
+        print(f'Backfilled {len(records_df)} test records of {records_df.Commit.nunique()} commits.')
@@ -0,0 +1,28 @@
+import sys
+sys.path.append( '../modules' )
+from load_data import LoadData
+from run_diff import RunDiff, run_frame
+from config import username, token
+
+# Runs to compare: Commit hashes, branches (e.g. 'origin/develop') or any revision (e.g. 'HEAD~3')
+base_rev, head_rev = 'HEAD~1', 'HEAD'
+
+# Instantiate Module for Loading & Preprocessing Data
+data_wrapper = LoadData(username, token, refresh='auto')
+
+# Runs by date: Latest commit before the date (e.g. '2024-03-01')
+# base_rev = data_wrapper.my_local_repo.git.rev_list('-1', '--before=2024-03-01', 'origin/develop')
+
+# Parse the logs of each run & compare their test metrics
+runs = {}
+for rev in (base_rev, head_rev):
+    data_wrapper.read_commit_logs(rev, log_dir='/tests/logs')
+    data_wrapper.preprocess()
+    runs[rev] = run_frame(data_wrapper.record_store.to_df())
+run_diff = RunDiff(runs[base_rev], runs[head_rev], base_label=base_rev, head_label=head_rev)
+print(run_diff.summary())
+print(run_diff.delta_df.head(20))
+
+# Save the delta table & its HTML summary
+run_diff.delta_df.to_pickle("dataframes/run_diff_df.pkl")
+run_diff.save_html("dataframes/run_diff.html")
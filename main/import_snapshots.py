@@ -0,0 +1,11 @@
+import sys
+import os
+sys.path.append( '../modules' )
+from history_db import HistoryDB
+
+# One-time import of the dated snapshot folders' dataframes into the history database
+if not os.path.exists("dataframes"):
+    os.mkdir("dataframes")
+history_db = HistoryDB("dataframes/history.db")
+history_db.import_snapshots('../results')
+history_db.close()
@@ -1,27 +1,53 @@
 import sys
 sys.path.append( '../modules' )
 from load_data import LoadData
+from http_log_source import HTTPLogSource
 from generate_plots import GeneratePlots
 from config import username, token
 
 # Instantiate Module for Loading & Preprocessing Data
-data_wrapper = LoadData(username, token)
-data_wrapper.read_latest_logs(log_dir='/tests/logs')
+# Set max_memory_mb (e.g. 512) to process large log corpora w/ bounded memory
+# Set selection (e.g. log_selection.LogSelection(platforms=['Hera', 'Derecho'], frameworks=['Regression Testing'])) to only read & parse the selected logs
+# Set http_logs to True to download only the logs over HTTP rather than cloning & pulling the UFS-WM repo
+http_logs = False
+log_source = HTTPLogSource(token, branch='develop', log_dir='/tests/logs') if http_logs else None
+data_wrapper = LoadData(username, token, max_memory_mb=None, selection=None, log_source=log_source)
+if http_logs:
+    data_wrapper.read_http_logs()
+    log_source.close()
+else:
+    data_wrapper.read_latest_logs(log_dir='/tests/logs')
 data_wrapper.preprocess()
 data_wrapper.map_metrics()
 wall_time_df, test_sz_df = data_wrapper.generate_df()
-wall_time_pivot_df = data_wrapper.generate_pivot_df(wall_time_df,
-                                                    independent_feature_name='Wall Time (min)')
-test_sz_pivot_df = data_wrapper.generate_pivot_df(test_sz_df,
-                                                  independent_feature_name='Max Resident Set Size (MB)')
+
+# Sparse pivot of all metrics & the dense wall time & test size pivot tables (saved as before)
+pivot = data_wrapper.generate_sparse_pivot(wall_time_df, test_sz_df)
+wall_time_pivot_df = pivot.dense('Wall Time (min)')
+test_sz_pivot_df = pivot.dense('Max Resident Set Size (MB)')
+data_wrapper.save_as_pkl(wall_time_pivot_df, "Wall Time (min)_pivot_df")
+data_wrapper.save_as_pkl(test_sz_pivot_df, "Max Resident Set Size (MB)_pivot_df")
+
+# Queue wait (wall + wait time - run time) distribution per platform-to-compiler
+queue_wait_df = data_wrapper.generate_queue_wait_df(wall_time_df)
+
+# Run time factor per platform-to-compiler & expected run time per test (w/o queue wait)
+speed_df, speed_model = data_wrapper.generate_speed_df(pivot)
 
 # Instantiate Module for Plotting Data
+# Set to True to generate a single HTML report rather than the PDFs per plot
+html_report = False
 plt_wrapper = GeneratePlots(wall_time_df, test_sz_df)
-plt_wrapper.generate_stacked_barplots(x_font_sz=18, 
-                                      y_font_sz=14,
-                                      fontname='Helvetica', 
-                                      txt_color='#000000', 
-                                      bg_color='#FFFFFF')
-plt_wrapper.generate_barplots_platform()
-plt_wrapper.generate_histogramplots(test_sz_pivot_df)
-
+if html_report:
+    plt_wrapper.generate_html_report(test_sz_pivot_df)
+else:
+    plt_wrapper.generate_stacked_barplots(x_font_sz=18, 
+                                          y_font_sz=14,
+                                          fontname='Helvetica', 
+                                          txt_color='#000000', 
+                                          bg_color='#FFFFFF')
+    # Plot per metric per test framework w/ a subplot per platform, paged by 4 platforms (set faceted=False for a plot per platform)
+    plt_wrapper.generate_barplots_platform(faceted=True)
+    plt_wrapper.generate_histogramplots(test_sz_pivot_df)
+    plt_wrapper.generate_queue_wait_plots(queue_wait_df)
+    plt_wrapper.generate_speed_factor_plots(speed_df)
@@ -0,0 +1,16 @@
+import sys
+sys.path.append( '../modules' )
+from load_data import LoadData
+from watch_logs import WatchLogs
+from config import username, token
+
+# Instantiate Module for Loading & Preprocessing Data w/o pulling, since
+# the watch mode fetches the remote & processes only the new commits made to the logs
+data_wrapper = LoadData(username, token, refresh=False)
+
+# Serve the latest test metrics & pipeline timing to the monitoring stack (http://127.0.0.1:9101/metrics)
+data_wrapper.metrics_exporter.serve(port=9101)
+
+# Poll remote every 5 mins.
+watch_wrapper = WatchLogs(data_wrapper, log_dir='/tests/logs')
+watch_wrapper.run(interval=300)
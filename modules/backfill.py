@@ -0,0 +1,266 @@
+import os
+import time
+import pickle
+import pandas as pd
+from time import mktime
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from git import Repo
+from load_data import LoadData
+from record_store import TestRecordStore
+
+# Columns identifying a test record across shards (e.g. commits re-read by a retried shard)
+RECORD_KEY_COLS = ['Commit', 'Test_Framework_Type', 'Filename_Description', 'Test_Description']
+
+
+def backfill_shard(repo_dir, log_dir, rev, start, end, shard_path, selection=None):
+    """
+    Worker parsing the logs changed by the commits of a time shard. Each worker opens its
+    own git blob reader & parser, such that shards are processed independently.
+
+    Args:
+        repo_dir (str): Directory of the local UFS-WM repository.
+
+        log_dir (str): Relative directory of the where the logs files are located in repository.
+
+        rev (str): Revision whose (first-parent) history is backfilled (e.g. 'HEAD', 'origin/develop').
+
+        start (datetime): Start of the shard (inclusive).
+
+        end (datetime): End of the shard (exclusive).
+
+        shard_path (str): Pickle file to save the shard's test records, output file postings,
+                          flaky test counts & parsed logs (commit hash, filename, date & path) as.
+
+        selection (LogSelection): [Optional] Platforms, compilers, test framework types &
+                                  tests to select.
+
+    Return (int): Number of test records of the shard.
+
+    Note:
+    - The shard's file is replaced atomically once all of its commits are parsed. A shard
+    whose file exists is complete & is not reprocessed.
+
+    """
+    repo = Repo(repo_dir)
+    log_dir = log_dir.strip('/')
+    data_wrapper = LoadData.offline(selection, file_index_path=None)
+
+    # Commits of the shard touching the logs, oldest first
+    commits = repo.iter_commits(rev, first_parent=True, paths=log_dir,
+                                since=start.isoformat(), until=end.isoformat())
+    records, flaky_logs, logs = [], [], []
+    for commit in reversed(list(commits)):
+        if not start <= datetime.fromtimestamp(commit.committed_date) < end:
+            continue
+        commit_date = datetime.fromtimestamp(mktime(time.localtime(commit.committed_date)))
+
+        # Logs changed by the commit (all logs of the root commit)
+        if commit.parents:
+            changed = repo.git.diff('--name-only', commit.parents[0].hexsha, commit.hexsha, '--', log_dir)
+        else:
+            changed = repo.git.ls_tree('-r', '--name-only', commit.hexsha, '--', log_dir)
+        data_wrapper.log_files_corpus = {}
+        for log_path in changed.split('\n'):
+            log_fn = os.path.basename(log_path)
+            if not log_fn or not data_wrapper.is_relevant_log(log_fn):
+                continue
+            if selection is not None and not selection.accepts_log(log_fn):
+                continue
+            try:
+                blob = commit.tree / log_path
+            except KeyError:
+                # Log deleted by the commit
+                continue
+
+            # Blob's text as featured w/in 'git show' (w/o its trailing newline)
+            txt = blob.data_stream.read().decode(errors='replace')
+            data_wrapper.log_files_corpus[(log_fn, commit_date)] = txt[:-1] if txt.endswith('\n') else txt
+            logs.append((commit.hexsha, log_fn, commit_date, log_path))
+        if not data_wrapper.log_files_corpus:
+            continue
+        data_wrapper.preprocess()
+        records.append(data_wrapper.record_store.to_df())
+        flaky_logs.extend(data_wrapper.flaky_logs)
+
+    records_df = pd.concat(records, ignore_index=True) if records else TestRecordStore().to_df()
+    tmp_path = shard_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'records': records_df, 'postings': list(data_wrapper.file_index.items()), 'flaky_logs': flaky_logs, 'logs': logs}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, shard_path)
+
+    return len(records_df)
+
+
+class Backfill():
+    """
+    Parallel backfill of the test metrics featured within the history of the UFS-WM logs.
+
+    A range of commits is split into time shards, each parsed by an independent worker
+    process. The shards' test records are merged into a single deduplicated dataset. Shards
+    are persisted as they complete, such that re-running a backfill only processes the
+    shards which failed (or were not yet processed).
+
+    """
+    def __init__(self, repo_dir='ufs-repo', log_dir='/tests/logs', rev='HEAD', shard_dir='dataframes/backfill', n_workers=None, selection=None):
+        """
+        Args:
+            repo_dir (str): Directory of the local UFS-WM repository (see LoadData).
+
+            log_dir (str): Relative directory of the where the logs files are located in repository.
+
+            rev (str): Revision whose (first-parent) history is backfilled.
+
+            shard_dir (str): Directory to save the shards' results to.
+
+            n_workers (int): [Optional] Number of worker processes. Default: Number of CPUs.
+
+            selection (LogSelection): [Optional] Platforms, compilers, test framework types &
+                                      tests to select.
+
+        """
+        self.repo_dir = repo_dir
+        self.log_dir = log_dir
+        self.rev = rev
+        self.shard_dir = shard_dir
+        if not os.path.exists(self.shard_dir):
+            os.makedirs(self.shard_dir)
+        self.n_workers = n_workers or os.cpu_count()
+        self.selection = selection
+
+    @staticmethod
+    def shards(since, until, shard_days=30):
+        """
+        Args:
+            since (datetime): Start of the backfill.
+
+            until (datetime): End of the backfill.
+
+            shard_days (int): Days of commits per shard.
+
+        Return (list): (Start, end) of each shard.
+
+        """
+        shards = []
+        start = since
+        while start < until:
+            end = min(start + timedelta(days=shard_days), until)
+            shards.append((start, end))
+            start = end
+
+        return shards
+
+    def shard_path(self, shard):
+        """
+        Args:
+            shard (tuple): (Start, end) of the shard.
+
+        Return (str): Pickle file of the shard's results.
+
+        """
+        start, end = shard
+
+        return os.path.join(self.shard_dir, f"shard_{start:%Y%m%d%H%M%S}_{end:%Y%m%d%H%M%S}.pkl")
+
+    def run(self, since, until=None, shard_days=30):
+        """
+        Process the shards of the backfill in parallel. Completed shards are skipped.
+
+        Args:
+            since (datetime): Start of the backfill.
+
+            until (datetime): [Optional] End of the backfill. Default: Now.
+
+            shard_days (int): Days of commits per shard.
+
+        Return (list): Shards which failed. Re-run the backfill to retry them.
+
+        """
+        until = until or datetime.now()
+        pending = [shard for shard in self.shards(since, until, shard_days) if not os.path.exists(self.shard_path(shard))]
+        failed = []
+        with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+            futures = {pool.submit(backfill_shard, self.repo_dir, self.log_dir, self.rev, start, end,
+                                   self.shard_path((start, end)), self.selection): (start, end)
+                       for start, end in pending}
+            for future in as_completed(futures):
+                start, end = futures[future]
+                try:
+                    n_records = future.result()
+                    print(f'Shard {start:%Y-%m-%d} - {end:%Y-%m-%d}: {n_records} test records.')
+                except Exception as e:
+                    print(f'Shard {start:%Y-%m-%d} - {end:%Y-%m-%d} failed: {e!r}')
+                    failed.append((start, end))
+
+        return sorted(failed)
+
+    def merge(self, data_wrapper=None, records_path="dataframes/backfill_records.pkl"):
+        """
+        Merge the test records of all completed shards into a single deduplicated dataset.
+
+        Args:
+            data_wrapper (LoadData): [Optional] Instance whose output file index, summary aggregates,
+                                     flaky test index & history database are updated w/ the merged records
+                                     & whose log archive is updated w/ the shards' raw logs.
+
+            records_path (str): Pickle file to save the merged test records as.
+
+        Return (pd.DataFrame): Test records (see TestRecordStore.to_df) ordered by commit.
+
+        """
+        records, postings, flaky_logs, logs = [], [], [], []
+        for shard_fn in sorted(os.listdir(self.shard_dir)):
+            if not (shard_fn.startswith('shard_') and shard_fn.endswith('.pkl')) or shard_fn.endswith('_index.pkl'):
+                continue
+            with open(os.path.join(self.shard_dir, shard_fn), 'rb') as f:
+                shard = pickle.load(f)
+            records.append(shard['records'])
+            postings.append(shard['postings'])
+            flaky_logs.extend(shard.get('flaky_logs', []))
+            logs.extend(shard.get('logs', []))
+        records_df = pd.concat(records, ignore_index=True) if records else TestRecordStore().to_df()
+        records_df = records_df.drop_duplicates(subset=RECORD_KEY_COLS, keep='last')
+        records_df = records_df.sort_values(by='Commit', kind='stable').reset_index(drop=True)
+        records_df.to_pickle(records_path)
+
+        if data_wrapper is not None:
+            for shard_postings in postings:
+                if isinstance(shard_postings, dict):
+                    # Shards saved w/ a list of postings per filename
+                    shard_postings = [(fn,) + posting for fn, fn_postings in shard_postings.items() for posting in fn_postings]
+                for posting in shard_postings:
+                    data_wrapper.file_index.add(*posting)
+            data_wrapper.file_index.save()
+            record_store = TestRecordStore.from_df(records_df)
+            data_wrapper.aggregates.update(record_store)
+            data_wrapper.aggregates.save()
+            data_wrapper.history_db.ingest(record_store)
+            for log_key, rows in flaky_logs:
+                data_wrapper.flaky_index.add_rows(log_key, rows)
+            data_wrapper.flaky_index.save()
+            self.archive_logs(data_wrapper.log_archive, logs)
+
+        return records_df
+
+    def archive_logs(self, log_archive, logs):
+        """
+        Archive the raw logs parsed by the shards, read from the local repo one commit at a time.
+
+        Args:
+            log_archive (LogArchive): Archive of the raw logs.
+
+            logs (list): (Commit hash, log filename, commit date, path of the log) per parsed log.
+
+        Return (int): Number of new blobs archived.
+
+        """
+        repo = Repo(self.repo_dir)
+        logs_by_commit = {}
+        for commit_sha, log_fn, commit_date, log_path in sorted(logs, key=lambda log: log[2]):
+            logs_by_commit.setdefault(commit_sha, []).append((log_fn, commit_date, log_path))
+        n_blobs = 0
+        for commit_sha, commit_logs in logs_by_commit.items():
+            n_blobs += log_archive.add_many((commit_sha, log_fn, commit_date, repo.git.show(f'{commit_sha}:{log_path}'))
+                                            for log_fn, commit_date, log_path in commit_logs)
+
+        return n_blobs
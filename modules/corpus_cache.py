@@ -0,0 +1,238 @@
+import os
+import sys
+import time
+import hashlib
+from collections import OrderedDict
+
+
+class CorpusCache():
+    """
+    In-process LRU cache of the UFS-WM logs' text keyed by (commit hash, log path).
+
+    The cache is bounded by the memory of the cached text & commit walks. Least recently
+    used logs (then walks) are evicted once the ceiling is exceeded & evicted logs are
+    optionally spilled to disk, such that switching between recently viewed commits does
+    not re-extract their logs from git. Spilled logs are bounded by their own ceiling.
+
+    """
+    def __init__(self, max_memory_mb=256, spill_dir=None, max_spill_mb=1024):
+        """
+        Args:
+            max_memory_mb (float): Ceiling of the cached text & commit walks (MB).
+
+            spill_dir (str): [Optional] Directory to spill evicted logs to. If None,
+                             evicted logs are dropped.
+
+            max_spill_mb (float): Ceiling of the spilled logs (MB). The oldest spilled
+                                  logs are deleted once it is exceeded.
+
+        """
+        self.max_bytes = max_memory_mb * (2**20)
+        self.max_spill_bytes = max_spill_mb * (2**20)
+        self.spill_dir = spill_dir
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits, self.misses = 0, 0
+
+        # Spilled log files (oldest first) w/ their size, incl. the files spilled by previous sessions
+        self.spilled = OrderedDict()
+        self.spill_nbytes = 0
+        if self.spill_dir is not None:
+            if not os.path.exists(self.spill_dir):
+                os.makedirs(self.spill_dir)
+            for entry in sorted(os.scandir(self.spill_dir), key=lambda entry: entry.stat().st_mtime):
+                if entry.is_file() and entry.name.endswith('.log'):
+                    self.spilled[entry.path] = entry.stat().st_size
+                    self.spill_nbytes += entry.stat().st_size
+
+        # Commits walked per (refs, days of commits, date) w/ their size & time of the last pull from remote
+        self.commit_walks = OrderedDict()
+        self.walk_nbytes = {}
+        self.last_refresh = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries or (self.spill_dir is not None and os.path.exists(self._spill_path(key)))
+
+    def _spill_path(self, key):
+        """
+        Args:
+            key (tuple): (Commit hash, log path).
+
+        Return (str): File of the spilled log.
+
+        """
+        sha, log_path = key
+
+        return os.path.join(self.spill_dir, f"{sha}_{hashlib.md5(log_path.encode()).hexdigest()}.log")
+
+    def put(self, key, txt):
+        """
+        Cache a log as the most recently used. Least recently used logs are evicted
+        until the cache is under its ceiling.
+
+        Args:
+            key (tuple): (Commit hash, log path).
+
+            txt (str): Text of the log.
+
+        Return: None
+
+        """
+        if key in self.entries:
+            self.nbytes -= sys.getsizeof(self.entries.pop(key))
+        self.entries[key] = txt
+        self.nbytes += sys.getsizeof(txt)
+        self._evict()
+
+        return
+
+    def _evict(self):
+        """
+        Evict the least recently used logs, then the oldest commit walks, until the cache is
+        under its ceiling. The most recently used log & walk are kept.
+
+        """
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            evicted_key, evicted_txt = self.entries.popitem(last=False)
+            self.nbytes -= sys.getsizeof(evicted_txt)
+            if self.spill_dir is not None:
+                self._spill(evicted_key, evicted_txt)
+        while self.nbytes > self.max_bytes and len(self.commit_walks) > 1:
+            evicted_key, _ = self.commit_walks.popitem(last=False)
+            self.nbytes -= self.walk_nbytes.pop(evicted_key)
+
+        return
+
+    def _spill(self, key, txt):
+        """
+        Spill an evicted log to disk. The oldest spilled logs are deleted until the spilled
+        logs are under their ceiling.
+
+        """
+        spill_path = self._spill_path(key)
+        if spill_path not in self.spilled:
+            tmp_path = spill_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(txt)
+            os.replace(tmp_path, spill_path)
+            self.spilled[spill_path] = os.path.getsize(spill_path)
+            self.spill_nbytes += self.spilled[spill_path]
+        while self.spill_nbytes > self.max_spill_bytes and self.spilled:
+            self._unspill(next(iter(self.spilled)))
+
+        return
+
+    def _unspill(self, spill_path):
+        """
+        Delete a spilled log (e.g. once promoted back to memory).
+
+        """
+        self.spill_nbytes -= self.spilled.pop(spill_path, 0)
+        if os.path.exists(spill_path):
+            os.remove(spill_path)
+
+        return
+
+    def get(self, key, loader=None):
+        """
+        Args:
+            key (tuple): (Commit hash, log path).
+
+            loader (function): [Optional] Function reading the log on a miss (e.g. from git).
+
+        Return (str): Text of the log. None if it is neither cached nor loaded.
+
+        """
+        txt = self.entries.get(key)
+        if txt is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return txt
+
+        # Logs spilled to disk are promoted back to memory (& their file deleted)
+        self.misses += 1
+        if self.spill_dir is not None and os.path.exists(self._spill_path(key)):
+            with open(self._spill_path(key)) as f:
+                txt = f.read()
+            self._unspill(self._spill_path(key))
+        elif loader is not None:
+            txt = loader()
+        if txt is not None:
+            self.put(key, txt)
+
+        return txt
+
+    def walk_commits(self, key, walker):
+        """
+        Memoize the commits walked w/in the history. Walks are counted against the
+        ceiling of the cache & the least recently used walks are evicted.
+
+        Args:
+            key (tuple): Key of the walk (e.g. (refs, days of commits, date)).
+
+            walker (function): Function walking the history on a miss.
+
+        Return: Result of the walk.
+
+        """
+        if key not in self.commit_walks:
+            self.commit_walks[key] = walker()
+            self.walk_nbytes[key] = _nbytes(self.commit_walks[key])
+            self.nbytes += self.walk_nbytes[key]
+        self.commit_walks.move_to_end(key)
+        walk = self.commit_walks[key]
+        self._evict()
+
+        return walk
+
+    def is_warm(self, max_age_sec=900):
+        """
+        Args:
+            max_age_sec (int): Maximum N number of seconds since the last pull from remote.
+
+        Return (bool): True if logs are cached & the remote was pulled within the last N seconds.
+
+        """
+        return len(self) > 0 and self.last_refresh is not None and time.time() - self.last_refresh < max_age_sec
+
+
+def _nbytes(obj):
+    """
+    Args:
+        obj: Object of nested dicts, lists, tuples & scalars (e.g. a commit walk).
+
+    Return (int): Approximate memory of the object (bytes).
+
+    """
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(_nbytes(k) + _nbytes(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(_nbytes(v) for v in obj)
+
+    return sys.getsizeof(obj)
+
+
+# Cache shared across the LoadData instances of a session (e.g. notebooks)
+_shared_cache = None
+
+
+def shared_cache(max_memory_mb=256, spill_dir=None, max_spill_mb=1024):
+    """
+    Args:
+        max_memory_mb (float): Ceiling of the cached text & commit walks (MB), if the cache is created.
+
+        spill_dir (str): [Optional] Directory to spill evicted logs to, if the cache is created.
+
+        max_spill_mb (float): Ceiling of the spilled logs (MB), if the cache is created.
+
+    Return (CorpusCache): Cache shared within the process.
+
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = CorpusCache(max_memory_mb, spill_dir, max_spill_mb)
+
+    return _shared_cache
@@ -0,0 +1,169 @@
+import os
+import pickle
+from bisect import bisect_left, insort
+
+
+class OutputFileIndex():
+    """
+    Inverted index of the output files compared & moved by the UFS-WM tests.
+
+    Maps each output filename (e.g. 'sfcf024.nc', 'RESTART/20210323.060000.coupler.res')
+    to the tests, platforms & commits which compared or moved the file & the
+    resulting status.
+
+    """
+    def __init__(self, index_path="dataframes/output_file_index.pkl"):
+        """
+        Args:
+            index_path (str): Pickle file to load & persist the index. Previously
+                              persisted postings are loaded, such that the index
+                              grows incrementally across runs. If None, the index
+                              is not persisted (e.g. within the backfill workers).
+
+        """
+        self.index_path = index_path
+
+        # Filename -> status per (test, platform, commit, action) & sorted filenames for prefix queries,
+        # both persisted such that they are not rebuilt from the postings on load
+        # Note: Postings are keyed within their filename, such that duplicates are skipped w/o a separate set of keys
+        self.postings = {}
+        self.sorted_fns = []
+        self.changed = False
+        if self.index_path is not None and os.path.exists(self.index_path):
+            with open(self.index_path, 'rb') as f:
+                index = pickle.load(f)
+            if isinstance(index, dict):
+                # Index saved w/ its postings only
+                index = (index, sorted(index), None)
+            self.postings, self.sorted_fns = index[:2]
+
+            # Index saved w/ a list of postings per filename (& their keys)
+            if len(index) > 2:
+                self.postings = {fn: {p[:4]: p[4] for p in fn_postings} for fn, fn_postings in self.postings.items()}
+
+    def add(self, fn, test, platform, commit, action, status):
+        """
+        Add a posting of an output file. Postings already featured within
+        the index (e.g. re-parsed commits) are ignored.
+
+        Args:
+            fn (str): Output filename.
+
+            test (str): Name of test.
+
+            platform (str): Name of platform (as parsed from the log's filename).
+
+            commit (datetime, str): Commit date (or hash) of the log.
+
+            action (str): 'Compared' or 'Moved'.
+
+            status (str): Status of the compared or moved file (e.g. 'OK').
+
+        Return: None
+
+        """
+        fn_postings = self.postings.get(fn)
+        if fn_postings is None:
+            fn_postings = self.postings[fn] = {}
+            insort(self.sorted_fns, fn)
+        key = (test, platform, commit, action)
+        if key in fn_postings:
+            return
+        fn_postings[key] = status
+        self.changed = True
+
+        return
+
+    def add_tests(self, platform, commit, compared_files, moved_files):
+        """
+        Add the postings of all compared & moved files featured within a log.
+
+        Args:
+            platform (str): Name of platform (as parsed from the log's filename).
+
+            commit (datetime, str): Commit date (or hash) of the log.
+
+            compared_files (dict): Compared files & status per test.
+
+            moved_files (dict): Moved files & status per test.
+
+        Return: None
+
+        """
+        for action, files_per_test in (('Compared', compared_files), ('Moved', moved_files)):
+            for test, files in files_per_test.items():
+                for fn, status in files.items():
+                    self.add(fn, test, platform, commit, action, status)
+
+        return
+
+    def lookup(self, fn, status=None, action=None):
+        """
+        Tests, platforms & commits featuring an output file.
+
+        Args:
+            fn (str): Output filename.
+
+            status (str): [Optional] Keep only postings w/ this status (e.g. 'OK').
+                          If prefixed w/ '!' (e.g. '!OK'), only postings w/o this
+                          status are kept.
+
+            action (str): [Optional] Keep only 'Compared' or 'Moved' postings.
+
+        Return (list): Postings of (test, platform, commit, action, status).
+
+        """
+        postings = [key + (fn_status,) for key, fn_status in self.postings.get(fn, {}).items()]
+        if action is not None:
+            postings = [p for p in postings if p[3] == action]
+        if status is not None and status.startswith('!'):
+            postings = [p for p in postings if p[4] != status[1:]]
+        elif status is not None:
+            postings = [p for p in postings if p[4] == status]
+
+        return postings
+
+    def items(self):
+        """
+        Return (generator): (Output filename, test, platform, commit, action, status) per posting.
+
+        """
+        for fn, fn_postings in self.postings.items():
+            for key, status in fn_postings.items():
+                yield (fn,) + key + (status,)
+
+    def prefix(self, fn_prefix):
+        """
+        Output filenames starting w/ a given prefix (e.g. 'RESTART/', 'sfcf0').
+
+        Args:
+            fn_prefix (str): Prefix of the output filename.
+
+        Return (list): Sorted output filenames featuring the prefix.
+
+        """
+        idx = bisect_left(self.sorted_fns, fn_prefix)
+        fns = []
+        while idx < len(self.sorted_fns) and self.sorted_fns[idx].startswith(fn_prefix):
+            fns.append(self.sorted_fns[idx])
+            idx += 1
+
+        return fns
+
+    def save(self):
+        """
+        Persist index as pickle file. The index is only saved if postings were added since it was loaded or saved.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        if self.index_path is None or not self.changed:
+            return
+        with open(self.index_path, 'wb') as f:
+            pickle.dump((self.postings, self.sorted_fns), f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.changed = False
+
+        return
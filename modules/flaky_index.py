@@ -0,0 +1,227 @@
+import os
+import re
+import heapq
+import pickle
+import pandas as pd
+from record_store import split_test, time_to_sec
+
+# Times (MM:SS) of an attempt featured within the Regression Test log lines (e.g. "[05:12, 03:40]")
+_ATTEMPT_TIME_RE = re.compile(r'\[(\d+):(\d+), (\d+):(\d+)\]')
+
+
+def attempt_sec(line):
+    """
+    Args:
+        line (str): Line of a test's attempt within a Regression Test log.
+
+    Return (float): Wall + wait & run time of the attempt (s). 0 if no time is featured (e.g. "[, ]").
+
+    """
+    m = _ATTEMPT_TIME_RE.search(line)
+    if m is None:
+        return 0.0
+    wallnwait_min, wallnwait_sec, run_min, run_sec = (int(x) for x in m.groups())
+
+    return float(60*(wallnwait_min + run_min) + wallnwait_sec + run_sec)
+
+
+class FlakyIndex():
+    """
+    Incrementally maintained index of the flaky tests (i.e. tests re-ran or failing to compare)
+    per (framework, platform, compiler, test) across all ingested logs.
+
+    Each ingested log only adds its counts to the entries of its tests, such that a test is
+    looked up in constant time & the most expensive flaky tests are ranked over the full
+    history w/o re-reading the logs.
+
+    """
+    # Fields of each entry
+    FIELDS = ('Runs', 'Retries', 'Failed_Compares', 'Wasted_Time', 'Last_Flaky')
+
+    def __init__(self, index_path="dataframes/flaky_index.pkl"):
+        """
+        Args:
+            index_path (str): Pickle file to load & persist the index. If None, the index is not persisted
+                              (e.g. within the backfill workers).
+
+        """
+        self.index_path = index_path
+
+        # [runs, retries, failed compares, wasted wall time (s), commit of the latest flaky run] per
+        # (framework, platform, compiler, test) & the logs already counted
+        self.entries = {}
+        self.ingested = set()
+        if self.index_path is not None and os.path.exists(self.index_path):
+            with open(self.index_path, 'rb') as f:
+                self.entries, self.ingested = pickle.load(f)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def log_rows(commit, log_details):
+        """
+        Counts of the tests featured within a parsed log.
+
+        Args:
+            commit (datetime, str): Commit date (or hash) of the log.
+
+            log_details (dict): Parsed log details (see LoadData.preprocess).
+
+        Return (tuple, list): Key of the log & (framework, platform, compiler, test, retries, failed
+        compares, wasted wall time (s)) per test.
+
+        """
+        framework = log_details["Test_Framework_Type"]
+        pf = log_details["Platform"]
+        tries = log_details.get("Unique_Test_Tries", {})
+        failed_compares = log_details.get("Unique_Test_Failed_Compares", {})
+        failed_time = log_details.get("Unique_Test_Failed_Time", {})
+
+        # Tests which passed, failed to compare or were re-ran
+        tests = dict.fromkeys(log_details["Unique_Tests"])
+        tests.update(dict.fromkeys(failed_compares))
+        rows = []
+        for test_desc in tests:
+            platform, test, compiler = split_test(framework, pf, test_desc)
+            retries = max(int(tries.get(test_desc, 1)) - 1, 0)
+            rows.append((framework, platform, compiler, test, retries,
+                         int(failed_compares.get(test_desc, 0)), time_to_sec(failed_time.get(test_desc, 0))))
+
+        return (str(commit), framework, pf), rows
+
+    def add_rows(self, log_key, rows):
+        """
+        Count the tests of a log. Logs already counted are skipped.
+
+        Args:
+            log_key (tuple): Key of the log (see log_rows).
+
+            rows (list): Counts per test of the log (see log_rows).
+
+        Return: None
+
+        """
+        if log_key in self.ingested:
+            return
+        self.ingested.add(log_key)
+        commit = log_key[0]
+        for framework, platform, compiler, test, retries, failed_compares, wasted_sec in rows:
+            entry = self.entries.get((framework, platform, compiler, test))
+            if entry is None:
+                entry = self.entries[(framework, platform, compiler, test)] = [0, 0, 0, 0.0, '']
+            entry[0] += 1
+            entry[1] += retries
+            entry[2] += failed_compares
+            entry[3] += wasted_sec
+            if (retries or failed_compares) and commit > entry[4]:
+                entry[4] = commit
+
+        return
+
+    def add_log(self, commit, log_details):
+        """
+        Count the tests of a parsed log. Logs already counted are skipped.
+
+        Args:
+            commit (datetime, str): Commit date (or hash) of the log.
+
+            log_details (dict): Parsed log details (see LoadData.preprocess).
+
+        Return: None
+
+        """
+        self.add_rows(*self.log_rows(commit, log_details))
+
+        return
+
+    def lookup(self, framework, platform, compiler, test):
+        """
+        Args:
+            framework (str): Test framework type (e.g. 'Regression Testing').
+
+            platform (str): Platform (e.g. 'Hera').
+
+            compiler (str): Compiler (e.g. 'intel'). '' for the Operation Req. Tests.
+
+            test (str): Name of test (as featured within the generated dataframes).
+
+        Return (dict): Runs, retries, failed compares, wasted wall time (s) & commit of the latest
+        flaky run of the test. None if the test was never ingested.
+
+        """
+        entry = self.entries.get((framework, platform, compiler, test))
+        if entry is None:
+            return None
+
+        return dict(zip(self.FIELDS, entry))
+
+    def top_k(self, k=10, by='Wasted_Time', framework=None, platform=None):
+        """
+        Most expensive flaky tests across the full history.
+
+        Args:
+            k (int): Number of tests.
+
+            by (str): Field to rank by ('Wasted_Time', 'Retries' or 'Failed_Compares').
+
+            framework (str): [Optional] Test framework type to select.
+
+            platform (str): [Optional] Platform to select.
+
+        Return (pd.DataFrame): Flaky tests ranked by the field (see to_df).
+
+        """
+        field_idx = self.FIELDS.index(by)
+        items = ((key, entry) for key, entry in self.entries.items()
+                 if (entry[1] or entry[2]) and (framework is None or key[0] == framework) and (platform is None or key[1] == platform))
+
+        return self._frame(heapq.nlargest(k, items, key=lambda item: item[1][field_idx]))
+
+    def to_df(self):
+        """
+        Return (pd.DataFrame): Entries of all tests, w/ the retry rate & the wasted wall time in mins.
+
+        """
+        return self._frame(self.entries.items())
+
+    @staticmethod
+    def _frame(items):
+        items = list(items)
+        df = pd.DataFrame([key + tuple(entry) for key, entry in items],
+                          columns=['Test_Framework_Type', 'Platform', 'Compiler', 'Test', 'Runs', 'Retries',
+                                   'Failed_Compares', 'Wasted Wall Time (min)', 'Last_Flaky'])
+        df['Wasted Wall Time (min)'] = df['Wasted Wall Time (min)']/60
+        df['Retry Rate'] = df['Retries']/df['Runs'].where(df['Runs'] > 0)
+
+        return df
+
+    def platform_summary(self):
+        """
+        Return (pd.DataFrame): Runs, flaky tests, retries, failed compares & wasted wall time (min) per
+        test framework type, platform & compiler, most wasted first.
+
+        """
+        df = self.to_df()
+        df['Flaky_Tests'] = (df['Retries'] > 0) | (df['Failed_Compares'] > 0)
+        df = df.groupby(['Test_Framework_Type', 'Platform', 'Compiler'])[['Runs', 'Flaky_Tests', 'Retries', 'Failed_Compares', 'Wasted Wall Time (min)']].sum()
+        df['Retry Rate'] = df['Retries']/df['Runs'].where(df['Runs'] > 0)
+
+        return df.sort_values('Wasted Wall Time (min)', ascending=False)
+
+    def save(self):
+        """
+        Persist index as pickle file.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        if self.index_path is None:
+            return
+        with open(self.index_path, 'wb') as f:
+            pickle.dump((self.entries, self.ingested), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return
@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
+from plotly.offline import get_plotlyjs
 from colormap import rgb2hex, rgb2hls, hls2rgb
 from dash_bootstrap_templates import load_figure_template
 templates = ["bootstrap",
@@ -119,7 +120,7 @@ class GeneratePlots():
             
         return
         
-    def generate_stacked_barplots(self, x_font_sz=9, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+    def generate_stacked_barplots(self, x_font_sz=9, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF', large_data=False, top_n=12, page_size=100):
         """
         Generates the stacked bar plots of the relevant log metrics per platform-to-compiler.
 
@@ -133,10 +134,28 @@ class GeneratePlots():
             txt_color (str): Hex color for font.
 
             bg_color (str): Hex color for plot background.
+
+            large_data (bool): If True, generates the paged stacked bar plots of
+                               the pre-aggregated metrics (see stacked_barplot_pages).
+
+            top_n (int): Number of platform-to-compilers featured individually
+                         if large_data is True.
+
+            page_size (int): Number of tests per plot if large_data is True.
             
         Return: None
 
         """
+        if large_data:
+            for df, metric, fn in ((self.wall_time_df, 'Wall Time (min)', 'test_wall_times_stacked'),
+                                   (self.test_sz_df, 'Max Resident Set Size (MB)', 'test_resident_sizes_stacked')):
+                figs = self.stacked_barplot_pages(df, metric, top_n, page_size, x_font_sz, y_font_sz, fontname, txt_color, bg_color)
+                for page, fig in enumerate(figs, 1):
+                    fig.write_image(f"plot_results/{fn}_p{page}.pdf")
+            print('Bar plots saved to local.')
+
+            return
+
         # Stacked bar plots for Wall Time vs Regression Test vs Platform-to-Compiler
         fig = px.bar(self.wall_time_df,
                      x=self.wall_time_df["Test"],
@@ -234,7 +253,196 @@ class GeneratePlots():
 
         return
 
-    def generate_barplots_platform(self, x_font_sz=14, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+    def stacked_barplot_pages(self, df, metric, top_n=12, page_size=100, x_font_sz=9, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+        """
+        Generates the stacked bar plots of a log metric per platform-to-compiler for large
+        numbers of tests & platform-to-compilers.
+
+        The metric is pre-aggregated per test per platform-to-compiler, such that each
+        platform-to-compiler is a single trace of one bar per test. Only the top N
+        platform-to-compilers (by total metric) are featured individually & the rest
+        are bucketed as "Others". Tests are ordered by total metric & paged across plots.
+
+        Args:
+            df (pd.DataFrame): Wall time or test size dataframe.
+
+            metric (str): 'Wall Time (min)' or 'Max Resident Set Size (MB)'.
+
+            top_n (int): Number of platform-to-compilers featured individually.
+
+            page_size (int): Number of tests per plot.
+
+            x_font_sz (float): Font size of the x-axis.
+
+            y_font_sz (float): Font size of the y axis.
+
+            fontname (str): Font style.
+
+            txt_color (str): Hex color for font.
+
+            bg_color (str): Hex color for plot background.
+
+        Return (list): Plot figure per page of tests.
+
+        Note:
+        - Plotly does not feature a WebGL bar trace, thus the number of traces & bars
+        per plot is bounded instead.
+
+        """
+        # Pre-aggregate metric per test per platform-to-compiler
+        full_df = df.pivot_table(index='Test', columns='Platform_Compiler', values=metric, aggfunc='sum', fill_value=0)
+
+        # Top N platform-to-compilers featured individually, remaining bucketed
+        pf_comp_totals = full_df.sum(axis=0).sort_values(ascending=False)
+        others = pf_comp_totals.index[top_n:]
+        wide_df = full_df[pf_comp_totals.index[:top_n]]
+        if len(others):
+            wide_df = wide_df.assign(Others=full_df[others].sum(axis=1))
+
+        # Tests ordered by total metric
+        wide_df = wide_df.loc[wide_df.sum(axis=1).sort_values(ascending=False).index]
+
+        # Layout shared across pages
+        colors = px.colors.qualitative.Dark24
+        n_pages = max(1, -(-len(wide_df) // page_size))
+        layout = dict(template="lux",
+                      barmode='stack',
+                      height=1000,
+                      width=max(1000, min(3000, 30*page_size)),
+                      legend_title='<b>Platform-to-Compiler</b><br>',
+                      xaxis_title='<b>Regression Test</b><br><br>',
+                      yaxis_title=f'<br><br><b>{metric}</b>',
+                      font=dict(family=fontname, size=18),
+                      plot_bgcolor=bg_color,
+                      xaxis=dict(ticks="outside", tickangle=-90, tickfont=dict(family=fontname, color=txt_color, size=x_font_sz)),
+                      yaxis=dict(ticks="outside", tickfont=dict(family=fontname, color=txt_color, size=y_font_sz)))
+
+        figs = []
+        for page in range(n_pages):
+            page_df = wide_df.iloc[page*page_size:(page + 1)*page_size]
+            fig = go.Figure([go.Bar(x=page_df.index,
+                                    y=page_df[pf_comp],
+                                    name=pf_comp,
+                                    marker_color=colors[idx % len(colors)])
+                             for idx, pf_comp in enumerate(page_df.columns)])
+            fig.update_layout(title=dict(text=f'<b>{metric} vs Regression Test per Platform-to-Compiler ({page + 1}/{n_pages})</b>', x=0.5),
+                              **layout)
+            figs.append(fig)
+
+        return figs
+
+    def platform_layout_template(self, x_font_sz=14, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+        """
+        Layout template shared by the bar plots per platform, such that the axes & layout
+        are configured once rather than per figure.
+
+        Args:
+            x_font_sz (float): Font size of the x-axis.
+
+            y_font_sz (float): Font size of the y axis.
+
+            fontname (str): Font style.
+
+            txt_color (str): Hex color for font.
+
+            bg_color (str): Hex color for plot background.
+
+        Return (go.layout.Template): Template extending the "lux" template.
+
+        Note:
+        - The template's axes apply to the axes of every subplot.
+
+        """
+        template = go.layout.Template(pio.templates["lux"])
+        template.layout.update(title_font_family=fontname,
+                               font=dict(size=16),
+                               plot_bgcolor=bg_color,
+                               xaxis=dict(tickmode='linear',
+                                          ticks="outside",
+                                          tickwidth=1,
+                                          tickcolor=txt_color,
+                                          ticklen=8,
+                                          tickangle=-90,
+                                          tickfont=dict(family=fontname, color=txt_color, size=x_font_sz),
+                                          categoryorder='category ascending'),
+                               yaxis=dict(tickfont=dict(family=fontname, color=txt_color, size=y_font_sz)))
+        template.data.bar = [go.Bar(textangle=0, textposition="outside", cliponaxis=False, marker_line_width=0, opacity=1)]
+
+        return template
+
+    def faceted_barplot(self, df, metric, title, template, width=3000, facet_height=600, platforms_per_page=4, **bar_kwargs):
+        """
+        Generates bar plots of a log metric featuring a subplot per platform (small multiples), paged
+        by groups of platforms such that the height of each page is bounded.
+
+        Args:
+            df (pd.DataFrame): Wall time or test size dataframe of a test framework type.
+
+            metric (str): 'Wall Time (min)' or 'Max Resident Set Size (MB)'.
+
+            title (str): Title of the plot.
+
+            template (go.layout.Template): Shared layout template (see platform_layout_template).
+
+            width (int): Width of the plot.
+
+            facet_height (int): Height of each platform's subplot.
+
+            platforms_per_page (int): Maximum number of platforms (subplots) per page.
+
+            bar_kwargs: [Optional] Keyword arguments passed to px.bar (e.g. color='Compiler').
+
+        Return (list): Plot figure per page (see write_pages).
+
+        Note:
+        - The data is grouped by platform once w/in px.bar per page. Each subplot features only
+        the tests performed on its platform.
+
+        """
+        platforms = sorted(df['Platform'].dropna().unique())
+        pages = [platforms[start:start + platforms_per_page] for start in range(0, len(platforms), platforms_per_page)] or [[]]
+        figs = []
+        for page_idx, page_platforms in enumerate(pages, 1):
+            n_platforms = max(1, len(page_platforms))
+            fig = px.bar(df[df['Platform'].isin(page_platforms)],
+                         x='Test',
+                         y=metric,
+                         facet_row='Platform',
+                         facet_row_spacing=0.3/n_platforms,
+                         category_orders={'Platform': page_platforms},
+                         title=title + (f' ({page_idx}/{len(pages)})' if len(pages) > 1 else ''),
+                         template=template,
+                         height=facet_height*n_platforms,
+                         width=width,
+                         **bar_kwargs)
+            fig.update_xaxes(matches=None, showticklabels=True)
+            fig.update_yaxes(matches=None)
+            fig.for_each_annotation(lambda a: a.update(text=a.text.split('=', 1)[-1]))
+            figs.append(fig)
+
+        return figs
+
+    @staticmethod
+    def write_pages(figs, fn):
+        """
+        Save the pages of a paged plot (see faceted_barplot).
+
+        Args:
+            figs (list): Plot figure per page.
+
+            fn (str): Filename of the plot (e.g. "plot_results/WallTimes_by_Platform_RT.pdf"). Pages of a
+                      plot w/ more than one page are numbered (e.g. "WallTimes_by_Platform_RT_2.pdf").
+
+        Return: None
+
+        """
+        stem, ext = os.path.splitext(fn)
+        for page_idx, fig in enumerate(figs, 1):
+            fig.write_image(f'{stem}_{page_idx}{ext}' if len(figs) > 1 else fn)
+
+        return
+
+    def generate_barplots_platform(self, x_font_sz=14, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF', faceted=False):
         """
         Generate test wall & size bar plots per test framework per platform.
 
@@ -248,11 +456,30 @@ class GeneratePlots():
             txt_color (str): Hex color for font.
 
             bg_color (str): Hex color for plot background.
+
+            faceted (bool): If True, generates a single plot per metric per test framework w/
+                            a subplot per platform (see faceted_barplot), rather than a plot per platform.
             
         Return: None
 
         """
-        
+        if faceted:
+            template = self.platform_layout_template(x_font_sz, y_font_sz, fontname, txt_color, bg_color)
+            rt_kwargs = dict(color='Compiler', color_discrete_map={'intel': '#61D0FF', 'gnu': '#D87327'}, width=3000)
+            opnreq_kwargs = dict(color_discrete_sequence=['#0A4595'], width=2000)
+            for df, metric, metric_title, fn in ((self.wall_time_df, 'Wall Time (min)', 'Wall Times', 'WallTimes'),
+                                                 (self.test_sz_df, 'Max Resident Set Size (MB)', 'Maximum Resident Size', 'TestSize')):
+                for framework, framework_abbrev, bar_kwargs in (('Regression Testing', 'RT', rt_kwargs),
+                                                                ('Operation Requirement Test', 'OpnReq', opnreq_kwargs)):
+                    framework_df = df[df['Test_Framework_Type']==framework]
+                    if framework_df.empty:
+                        continue
+                    title = f"{framework.replace('Testing', 'Test')} Framework:<br>{metric_title} vs Tests Performed per Platform"
+                    figs = self.faceted_barplot(framework_df, metric, title, template, **bar_kwargs)
+                    self.write_pages(figs, f"plot_results/{fn}_by_Platform_{framework_abbrev}.pdf")
+
+            return
+
         # Test Wall Time vs all tests performed on each platform (RT Framework)
         filtered2rt_walltime = self.wall_time_df[self.wall_time_df['Test_Framework_Type']=='Regression Testing']
         for platform_name in filtered2rt_walltime['Platform'].unique():
@@ -386,6 +613,115 @@ class GeneratePlots():
             
         return
         
+    def generate_queue_wait_plots(self, queue_wait_df=None, x_font_sz=14, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+        """
+        Generate plots of the run time vs the queue wait of the Regression Tests, telling
+        slow platforms apart from badly queued platforms.
+
+        Args:
+            queue_wait_df (pd.DataFrame): [Optional] Queue wait per platform & compiler (see LoadData.generate_queue_wait_df).
+
+            x_font_sz (float): Font size of the x-axis.
+
+            y_font_sz (float): Font size of the y axis.
+
+            fontname (str): Font style.
+
+            txt_color (str): Hex color for font.
+
+            bg_color (str): Hex color for plot background.
+
+        Return: None
+
+        """
+        template = self.platform_layout_template(x_font_sz, y_font_sz, fontname, txt_color, bg_color)
+        rt_df = self.wall_time_df[self.wall_time_df['Test_Framework_Type']=='Regression Testing'].dropna(subset=['Run Time (min)', 'Queue Wait Time (min)'])
+        if rt_df.empty:
+            return
+
+        # Run time & queue wait stacked per test w/ a subplot per platform
+        parts_df = rt_df.melt(id_vars=['Platform', 'Platform_Compiler', 'Test'],
+                              value_vars=['Run Time (min)', 'Queue Wait Time (min)'],
+                              var_name='Component',
+                              value_name='Time (min)')
+        figs = self.faceted_barplot(parts_df, 'Time (min)',
+                                    "Regression Test Framework:<br>Run Time & Queue Wait vs Tests Performed per Platform",
+                                    template,
+                                    color='Component',
+                                    color_discrete_map={'Run Time (min)': '#0A4595', 'Queue Wait Time (min)': '#D87327'},
+                                    barmode='stack',
+                                    hover_data=['Platform_Compiler'])
+        self.write_pages(figs, "plot_results/QueueWait_by_Platform_RT.pdf")
+
+        # Distribution of the queue wait per platform-to-compiler
+        fig2 = px.box(rt_df,
+                      x='Platform_Compiler',
+                      y='Queue Wait Time (min)',
+                      color='Compiler',
+                      color_discrete_map={'intel': '#61D0FF', 'gnu': '#D87327'},
+                      title="Regression Test Framework:<br>Queue Wait Distribution per Platform-to-Compiler",
+                      template=template,
+                      height=1000,
+                      width=2000)
+        fig2.write_image("plot_results/QueueWait_Distribution_RT.pdf")
+
+        # Share of the wall + wait time spent queued per platform-to-compiler
+        if queue_wait_df is not None:
+            share_df = queue_wait_df.reset_index()
+            share_df['Platform_Compiler'] = share_df['Platform'] + ' + ' + share_df['Compiler']
+            fig3 = px.bar(share_df,
+                          x='Platform_Compiler',
+                          y='Queue Wait Share (%)',
+                          color='Compiler',
+                          color_discrete_map={'intel': '#61D0FF', 'gnu': '#D87327'},
+                          hover_data=['Total Queue Wait Time (min)', 'Median Queue Wait Time (min)', 'P95 Queue Wait Time (min)'],
+                          title="Regression Test Framework:<br>Queue Wait Share of Wall + Wait Time per Platform-to-Compiler",
+                          template=template,
+                          height=1000,
+                          width=2000)
+            fig3.write_image("plot_results/QueueWait_Share_RT.pdf")
+
+        return
+
+    def generate_speed_factor_plots(self, speed_df, x_font_sz=14, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+        """
+        Generate plot of the run time factor per platform-to-compiler (w/o queue wait).
+
+        Args:
+            speed_df (pd.DataFrame): Run time factor per platform-to-compiler (see LoadData.generate_speed_df).
+
+            x_font_sz (float): Font size of the x-axis.
+
+            y_font_sz (float): Font size of the y axis.
+
+            fontname (str): Font style.
+
+            txt_color (str): Hex color for font.
+
+            bg_color (str): Hex color for plot background.
+
+        Return: None
+
+        """
+        if speed_df.empty:
+            return
+        template = self.platform_layout_template(x_font_sz, y_font_sz, fontname, txt_color, bg_color)
+        factor_df = speed_df.rename_axis('Platform_Compiler').reset_index()
+        fig = px.bar(factor_df,
+                     x='Platform_Compiler',
+                     y='Speed Factor',
+                     color='Compiler',
+                     color_discrete_map={'intel': '#61D0FF', 'gnu': '#D87327'},
+                     hover_data=['Number of Tests'],
+                     title="Regression Test Framework:<br>Run Time Factor per Platform-to-Compiler (> 1 is Slower than Typical)",
+                     template=template,
+                     height=1000,
+                     width=2000)
+        fig.add_hline(y=1, line_dash='dash')
+        fig.write_image("plot_results/Speed_Factor_RT.pdf")
+
+        return
+
     def generate_histogramplots(self, df, x_font_sz=14, y_font_sz=14, fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
         """
         Generates histograms of the relevant log metrics.
@@ -585,3 +921,185 @@ class GeneratePlots():
         print('JSONs saved to local.')
         
         return
+
+    def encode_columns(self, df, cat_cols, num_cols, num_decimals=3):
+        """
+        Encode dataframe columns compactly for the HTML report. Categorical columns are
+        dictionary-encoded (categories & integer codes), such that all figures share
+        the same column arrays.
+
+        Args:
+            df (pd.DataFrame): Dataframe to encode.
+
+            cat_cols (list): Categorical columns (e.g. 'Test', 'Platform').
+
+            num_cols (list): Numeric columns (e.g. 'Wall Time (min)').
+
+            num_decimals (int): Number of decimals to round numeric columns.
+
+        Return (dict): Encoded columns.
+
+        """
+        encoded = {}
+        for col in cat_cols:
+            codes, cats = df[col].fillna('').astype(str).factorize()
+            encoded[col] = {'cats': cats.tolist(), 'codes': codes.tolist()}
+        for col in num_cols:
+            encoded[col] = [None if v != v else v for v in df[col].astype(float).round(num_decimals).tolist()]
+
+        return encoded
+
+    def generate_html_report(self, pivot_df=None, fn="plot_results/report.html", fontname='Helvetica', txt_color='#000000', bg_color='#FFFFFF'):
+        """
+        Generates a single self-contained HTML report of the log metrics.
+
+        Plotly.js is embedded once & the metrics are stored once as shared
+        column arrays. Each chart is described by a small spec (dataframe, metric,
+        filters, color) & is only rendered once scrolled into view.
+
+        Args:
+            pivot_df (pd.DataFrame): [Optional] Pivot dataframe featuring the number of
+                                     tests per platform-to-compiler.
+
+            fn (str): Filename of the HTML report.
+
+            fontname (str): Font style.
+
+            txt_color (str): Hex color for font.
+
+            bg_color (str): Hex color for plot background.
+
+        Return: None
+
+        """
+        cat_cols = ['Test', 'Platform', 'Compiler', 'Platform_Compiler', 'Test_Framework_Type']
+        data = {'wall': self.encode_columns(self.wall_time_df, cat_cols, ['Wall Time (min)', 'Run Time (min)', 'Queue Wait Time (min)']),
+                'size': self.encode_columns(self.test_sz_df, cat_cols, ['Max Resident Set Size (MB)'])}
+        if pivot_df is not None:
+            counts_df = pivot_df.reset_index()
+            counts_df['Platform_Compiler'] = counts_df['index']
+            data['counts'] = self.encode_columns(counts_df, cat_cols[1:], ['Number of Tests'])
+
+        # Chart specs
+        compiler_colors = {'intel': '#61D0FF', 'gnu': '#D87327'}
+        charts = [{'title': 'Wall Time (min) vs Regression Test per Platform-to-Compiler',
+                   'frame': 'wall', 'x': 'Test', 'y': 'Wall Time (min)', 'color': 'Platform_Compiler', 'filters': {}},
+                  {'title': 'Queue Wait Time (min) vs Regression Test per Platform-to-Compiler',
+                   'frame': 'wall', 'x': 'Test', 'y': 'Queue Wait Time (min)', 'color': 'Platform_Compiler',
+                   'filters': {'Test_Framework_Type': 'Regression Testing'}},
+                  {'title': 'Maximum Resident Set Size vs Test per Platform-to-Compiler',
+                   'frame': 'size', 'x': 'Test', 'y': 'Max Resident Set Size (MB)', 'color': 'Platform_Compiler', 'filters': {}}]
+        frameworks = {'Regression Testing': ('Regression Test Framework', 'Tests'),
+                      'Operation Requirement Test': ('Operation Requirement Test Framework', 'Test')}
+        for frame, df, metric, metric_title in (('wall', self.wall_time_df, 'Wall Time (min)', 'Wall Times'),
+                                                ('size', self.test_sz_df, 'Max Resident Set Size (MB)', 'Maximum Resident Size')):
+            for framework, (framework_title, tests_title) in frameworks.items():
+                filtered_df = df[df['Test_Framework_Type']==framework]
+                for platform_name in sorted(filtered_df['Platform'].dropna().unique()):
+                    charts.append({'title': f'{framework_title}:<br>{metric_title} vs {tests_title} Performed on {platform_name}',
+                                   'frame': frame, 'x': 'Test', 'y': metric,
+                                   'color': 'Compiler' if framework == 'Regression Testing' else None,
+                                   'filters': {'Test_Framework_Type': framework, 'Platform': platform_name}})
+        if pivot_df is not None:
+            charts.append({'title': 'Regression Test Framework:<br>Number of Tests vs Platform',
+                           'frame': 'counts', 'x': 'Platform', 'y': 'Number of Tests', 'color': 'Compiler',
+                           'filters': {'Test_Framework_Type': 'Regression Testing'}})
+            charts.append({'title': 'Operation Test Framework:<br>Number of Platform',
+                           'frame': 'counts', 'x': 'Platform', 'y': 'Number of Tests', 'color': None,
+                           'filters': {'Test_Framework_Type': 'Operation Requirement Test'}})
+
+        # Layout shared across all charts
+        layout = {'font': {'family': fontname, 'size': 14, 'color': txt_color},
+                  'title': {'x': 0.5},
+                  'barmode': 'stack',
+                  'height': 700,
+                  'plot_bgcolor': bg_color,
+                  'paper_bgcolor': bg_color,
+                  'xaxis': {'tickangle': -90, 'ticks': 'outside', 'categoryorder': 'category ascending', 'automargin': True},
+                  'yaxis': {'ticks': 'outside', 'automargin': True}}
+        colors = {'sequence': px.colors.qualitative.Dark24, 'map': compiler_colors, 'default': '#0A4595'}
+
+        html = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>UFS-WM Test Log Metrics</title>
+<style>body {font-family: %s; margin: 0 2em;} .chart {min-height: 700px; margin-bottom: 2em;}</style>
+<script type="text/javascript">%s</script>
+</head>
+<body>
+<h1>UFS-WM Test Log Metrics</h1>
+<div id="charts"></div>
+<script type="text/javascript">
+const DATA = %s;
+const CHARTS = %s;
+const LAYOUT = %s;
+const COLORS = %s;
+
+// Decode the dictionary-encoded column of a row.
+function cell(frame, col, i) {
+    const c = DATA[frame][col];
+    return c.codes ? c.cats[c.codes[i]] : c[i];
+}
+
+// Build the traces of a chart from the shared column arrays.
+function traces(spec) {
+    const n = DATA[spec.frame][spec.y].length;
+    const groups = new Map();
+    for (let i = 0; i < n; i++) {
+        let keep = true;
+        for (const [col, val] of Object.entries(spec.filters)) {
+            if (cell(spec.frame, col, i) !== val) { keep = false; break; }
+        }
+        const y = cell(spec.frame, spec.y, i);
+        if (!keep || y === null) continue;
+        const key = spec.color ? cell(spec.frame, spec.color, i) : '';
+        if (!groups.has(key)) groups.set(key, {x: [], y: []});
+        groups.get(key).x.push(cell(spec.frame, spec.x, i));
+        groups.get(key).y.push(y);
+    }
+    let k = 0;
+    return Array.from(groups, ([key, g]) => ({
+        type: 'bar', name: key, x: g.x, y: g.y, showlegend: !!spec.color,
+        marker: {color: COLORS.map[key] || (spec.color ? COLORS.sequence[k++ %% COLORS.sequence.length] : COLORS.default)}
+    }));
+}
+
+// Charts are rendered once scrolled into view.
+const observer = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+        if (!entry.isIntersecting) continue;
+        observer.unobserve(entry.target);
+        const spec = CHARTS[entry.target.dataset.idx];
+        const layout = Object.assign({}, LAYOUT, {
+            title: Object.assign({}, LAYOUT.title, {text: '<b>' + spec.title + '</b>'}),
+            xaxis: Object.assign({}, LAYOUT.xaxis, {title: {text: spec.x}}),
+            yaxis: Object.assign({}, LAYOUT.yaxis, {title: {text: spec.y}})
+        });
+        Plotly.newPlot(entry.target, traces(spec), layout, {responsive: true});
+    }
+}, {rootMargin: '400px'});
+
+const container = document.getElementById('charts');
+CHARTS.forEach((spec, idx) => {
+    const div = document.createElement('div');
+    div.className = 'chart';
+    div.dataset.idx = idx;
+    container.appendChild(div);
+    observer.observe(div);
+});
+</script>
+</body>
+</html>
+""" % (fontname,
+       get_plotlyjs(),
+       json.dumps(data, separators=(',', ':')),
+       json.dumps(charts, separators=(',', ':')),
+       json.dumps(layout, separators=(',', ':')),
+       json.dumps(colors, separators=(',', ':')))
+
+        with open(fn, 'w') as f:
+            f.write(html)
+        print(f'HTML report saved to local: {fn}')
+
+        return
@@ -0,0 +1,243 @@
+import os
+import glob
+import math
+import sqlite3
+from datetime import datetime
+import pandas as pd
+
+# Schema of the history database
+_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    run_commit TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    source TEXT NOT NULL,
+    UNIQUE (run_commit, source)
+);
+CREATE TABLE IF NOT EXISTS platforms (platform_id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS compilers (compiler_id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS tests (
+    test_id INTEGER PRIMARY KEY,
+    framework TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (framework, name)
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    test_id INTEGER NOT NULL REFERENCES tests(test_id),
+    platform_id INTEGER NOT NULL REFERENCES platforms(platform_id),
+    compiler_id INTEGER NOT NULL REFERENCES compilers(compiler_id),
+    run_date TEXT NOT NULL,
+    test_description TEXT,
+    wall_time_sec REAL,
+    wallnwait_time_sec REAL,
+    run_time_sec REAL,
+    max_rss_kb REAL,
+    tries INTEGER,
+    UNIQUE (run_id, test_id, platform_id, compiler_id)
+);
+CREATE INDEX IF NOT EXISTS idx_results_test_platform_date ON results (test_id, platform_id, run_date);
+CREATE INDEX IF NOT EXISTS idx_results_platform_date ON results (platform_id, run_date);
+"""
+
+# Query of the results joined w/ their dimensions
+_HISTORY_QUERY = """
+SELECT r.run_date AS "Date", ru.run_commit AS "Commit", t.framework AS "Test_Framework_Type",
+       p.name AS "Platform", c.name AS "Compiler", t.name AS "Test", r.test_description AS "Test_Description",
+       r.wall_time_sec AS "Wall Time (sec)", r.wallnwait_time_sec AS "Wall + Wait Time (sec)",
+       r.run_time_sec AS "Run Time (sec)", r.max_rss_kb AS "Max Resident Set Size (KB)", r.tries AS "Tries"
+FROM results r
+JOIN runs ru ON ru.run_id = r.run_id
+JOIN tests t ON t.test_id = r.test_id
+JOIN platforms p ON p.platform_id = r.platform_id
+JOIN compilers c ON c.compiler_id = r.compiler_id
+"""
+
+
+class HistoryDB():
+    """
+    Embedded SQLite history of the test metrics of all ingested UFS-WM logs.
+
+    """
+    def __init__(self, db_path="dataframes/history.db"):
+        """
+        Args:
+            db_path (str): SQLite database file. Created if it does not exist.
+
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript(_HISTORY_SCHEMA)
+        self.dim_ids = {'platforms': {}, 'compilers': {}, 'tests': {}}
+
+    def close(self):
+        self.conn.close()
+
+    def _dim_id(self, table, key):
+        """
+        Id of a platform, compiler or test. Inserted if it does not exist.
+
+        Args:
+            table (str): 'platforms', 'compilers' or 'tests'.
+
+            key (tuple): (name,) for platforms & compilers. (framework, name) for tests.
+
+        Return (int): Id.
+
+        """
+        ids = self.dim_ids[table]
+        if key not in ids:
+            cols = ('framework', 'name') if table == 'tests' else ('name',)
+            where = ' AND '.join(f'{col} = ?' for col in cols)
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?'*len(cols))})", key)
+            ids[key] = self.conn.execute(f"SELECT rowid FROM {table} WHERE {where}", key).fetchone()[0]
+
+        return ids[key]
+
+    def _run_id(self, run_commit, run_date, source):
+        self.conn.execute("INSERT OR IGNORE INTO runs (run_commit, run_date, source) VALUES (?, ?, ?)",
+                          (run_commit, run_date, source))
+
+        return self.conn.execute("SELECT run_id FROM runs WHERE run_commit = ? AND source = ?",
+                                 (run_commit, source)).fetchone()[0]
+
+    def append(self, rows, source='logs'):
+        """
+        Append test results in bulk within a single transaction. A result
+        already featured for the same run, test, platform & compiler is replaced.
+
+        Args:
+            rows (iterable): Dicts w/ the keys 'Commit', 'Date' (YYYY-MM-DD),
+                             'Test_Framework_Type', 'Platform', 'Compiler', 'Test',
+                             'Test_Description', 'Wall_Time', 'WallnWait_Time',
+                             'Run_Time' (sec), 'Max_RSS_KB' & 'Tries'.
+
+            source (str): Source of the results (e.g. 'logs', 'snapshot').
+
+        Return (int): Number of results appended.
+
+        """
+        def nullable(val):
+            return None if val is None or (isinstance(val, float) and math.isnan(val)) else val
+
+        with self.conn:
+            values = []
+            for row in rows:
+                values.append((self._run_id(row['Commit'], row['Date'], source),
+                               self._dim_id('tests', (row['Test_Framework_Type'], row['Test'])),
+                               self._dim_id('platforms', (row['Platform'],)),
+                               self._dim_id('compilers', (row['Compiler'],)),
+                               row['Date'],
+                               row['Test_Description'],
+                               nullable(row['Wall_Time']),
+                               nullable(row['WallnWait_Time']),
+                               nullable(row['Run_Time']),
+                               nullable(row['Max_RSS_KB']),
+                               nullable(row['Tries'])))
+            self.conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+
+        return len(values)
+
+    def ingest(self, record_store):
+        """
+        Append the test records of the parsed logs.
+
+        Args:
+            record_store (TestRecordStore): Store of the parsed test records.
+
+        Return (int): Number of results appended.
+
+        Note:
+        - Maximum resident set size is featured in bytes within the Regression Test logs &
+        in KB within the Operation Req. Test logs. Both are saved in KB.
+
+        """
+        def rows():
+            for rid in range(len(record_store)):
+                rec = record_store.record(rid)
+                rss_scale = 1/(2**10) if rec['Test_Framework_Type'] == 'Regression Testing' else 1
+                yield dict(rec,
+                           Date=rec['Commit'].split(' ')[0],
+                           Max_RSS_KB=rec['Max_RSS']*rss_scale)
+
+        return self.append(rows(), source='logs')
+
+    def import_snapshots(self, results_dir='results'):
+        """
+        One-time import of the dataframes saved within the dated snapshot folders
+        (e.g. results/020124/wall_time_df.pkl & test_sz_df.pkl).
+
+        Args:
+            results_dir (str): Directory of the snapshot folders named by date (MMDDYY).
+
+        Return (int): Number of results imported.
+
+        """
+        n_rows = 0
+        for snapshot_dir in sorted(glob.glob(os.path.join(results_dir, '*'))):
+            wall_fn = os.path.join(snapshot_dir, 'wall_time_df.pkl')
+            sz_fn = os.path.join(snapshot_dir, 'test_sz_df.pkl')
+            if not (os.path.exists(wall_fn) and os.path.exists(sz_fn)):
+                continue
+            snapshot = os.path.basename(snapshot_dir)
+            date = datetime.strptime(snapshot, '%m%d%y').strftime('%Y-%m-%d')
+            wall_df, sz_df = pd.read_pickle(wall_fn), pd.read_pickle(sz_fn)
+
+            # Snapshots feature either wall time (sec) & size (KB) or the current
+            # wall time (HH:MM:SS) & size (bytes) columns
+            if 'Wall Time (sec)' in wall_df:
+                wall_df['Wall_Time'] = wall_df['Wall Time (sec)']
+            else:
+                wall_df['Wall_Time'] = wall_df['Wall Time (min)']*60
+            if 'Max. Resident Set Size (KB)' in sz_df:
+                sz_df['Max_RSS_KB'] = sz_df['Max. Resident Set Size (KB)']
+            else:
+                sz_df['Max_RSS_KB'] = sz_df['Max Resident Set Size (bytes)']/(2**10)
+            desc_col = 'Test_Compiler' if 'Test_Compiler' in wall_df else 'Test_Description'
+            keys = ['Test_Framework_Type', 'Platform', 'Compiler', 'Test', desc_col]
+            snapshot_df = wall_df[keys + ['Wall_Time']].merge(sz_df[keys + ['Max_RSS_KB']], on=keys, how='outer')
+            snapshot_df['Test_Framework_Type'] = snapshot_df['Test_Framework_Type'].replace('Regression Test', 'Regression Testing')
+            snapshot_df[['Platform', 'Compiler', 'Test']] = snapshot_df[['Platform', 'Compiler', 'Test']].fillna('')
+            snapshot_df = snapshot_df.rename(columns={desc_col: 'Test_Description'}).assign(Commit=snapshot,
+                                                                                             Date=date,
+                                                                                             WallnWait_Time=None,
+                                                                                             Run_Time=None,
+                                                                                             Tries=None)
+            n_rows += self.append(snapshot_df.to_dict('records'), source='snapshot')
+            print(f'Imported snapshot {snapshot}: {len(snapshot_df)} results')
+
+        return n_rows
+
+    def query(self, test=None, platform=None, compiler=None, framework=None, start_date=None, end_date=None):
+        """
+        Test results of the history.
+
+        Args:
+            test (str): [Optional] Name of test (e.g. 'cpld_control_p8').
+
+            platform (str): [Optional] Name of platform (e.g. 'Hercules').
+
+            compiler (str): [Optional] Name of compiler (e.g. 'intel').
+
+            framework (str): [Optional] Test framework type (e.g. 'Regression Testing').
+
+            start_date (str): [Optional] First date to select (YYYY-MM-DD).
+
+            end_date (str): [Optional] Last date to select (YYYY-MM-DD).
+
+        Return (pd.DataFrame): Test results ordered by date.
+
+        """
+        conditions, params = [], []
+        for clause, val in (('t.name = ?', test),
+                            ('p.name = ?', platform),
+                            ('c.name = ?', compiler),
+                            ('t.framework = ?', framework),
+                            ('r.run_date >= ?', start_date),
+                            ('r.run_date <= ?', end_date)):
+            if val is not None:
+                conditions.append(clause)
+                params.append(val)
+        sql = _HISTORY_QUERY + (' WHERE ' + ' AND '.join(conditions) if conditions else '') + ' ORDER BY r.run_date'
+
+        return pd.read_sql_query(sql, self.conn, params=params)
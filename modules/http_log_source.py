@@ -0,0 +1,264 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import http.client
+from datetime import datetime
+from urllib.parse import urlsplit, quote
+from concurrent.futures import ThreadPoolExecutor
+
+
+class HTTPLogSource():
+    """
+    Clone-free source of the UFS-WM logs, listed & downloaded over the GitHub contents API.
+
+    Requests are conditional (If-None-Match w/ the cached ETag), such that unchanged logs
+    cost a '304 Not Modified' & are read from the local response cache. Logs are downloaded
+    concurrently over persistent (keep-alive) connections, one per worker thread, & workers
+    pause once the remaining rate limit runs low.
+
+    """
+    def __init__(self, gh_token=None, owner='ufs-community', repo='ufs-weather-model', branch='develop', log_dir='/tests/logs',
+                 api_url='https://api.github.com', cache_dir='dataframes/http_cache', max_workers=8, min_remaining=50, max_retries=3, timeout=30):
+        """
+        Args:
+            gh_token (str): [Optional] GitHub token. Unauthenticated requests are rate limited further.
+
+            owner (str): Owner of the repository.
+
+            repo (str): Name of the repository.
+
+            branch (str): Name of the branch.
+
+            log_dir (str): Relative directory of the where the logs files are located in repository.
+
+            api_url (str): Base URL of the API (e.g. a local stand-in server).
+
+            cache_dir (str): Directory of the cached responses & their ETags.
+
+            max_workers (int): Number of concurrent downloads (& persistent connections).
+
+            min_remaining (int): Workers wait for the rate limit's reset once fewer requests remain.
+
+            max_retries (int): Number of retries of a rate limited or failed request.
+
+            timeout (float): Timeout of each request (sec).
+
+        """
+        self.gh_token = gh_token
+        self.repo_path = f'/repos/{owner}/{repo}'
+        self.branch = branch
+        self.log_dir = log_dir.strip('/')
+        api = urlsplit(api_url)
+        self.scheme, self.netloc, self.base_path = api.scheme, api.netloc, api.path.rstrip('/')
+        self.cache_dir = cache_dir
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        self.max_workers = max_workers
+        self.min_remaining = min_remaining
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+        # ETag & cached body file per URL
+        self.index_path = os.path.join(self.cache_dir, 'index.json')
+        self.etags = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.etags = json.load(f)
+
+        # Workers kept across reads, each w/ a persistent connection (tracked to be closed) & rate limit shared across workers
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.rate_remaining, self.rate_reset = None, None
+        self.n_requests, self.n_not_modified = 0, 0
+        self.latest_commit = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the workers & close their persistent connections.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        self.pool.shutdown(wait=True)
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections = []
+
+        return
+
+    def _connection(self, reconnect=False):
+        """
+        Args:
+            reconnect (bool): If True, the thread's connection is re-established.
+
+        Return (http.client.HTTPConnection): Persistent connection of the thread.
+
+        """
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or reconnect:
+            if conn is not None:
+                conn.close()
+            conn_cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            new_conn = self.local.conn = conn_cls(self.netloc, timeout=self.timeout)
+            with self.lock:
+                if conn is not None:
+                    self.connections.remove(conn)
+                self.connections.append(new_conn)
+            conn = new_conn
+
+        return conn
+
+    def _wait_for_rate_limit(self):
+        with self.lock:
+            remaining, reset = self.rate_remaining, self.rate_reset
+        if remaining is not None and reset is not None and remaining < self.min_remaining:
+            wait_sec = reset - time.time()
+            if wait_sec > 0:
+                print(f'Rate limit low ({remaining} requests remaining). Waiting {wait_sec:.0f} sec ...')
+                time.sleep(wait_sec)
+
+    def _cache_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.md5(url.encode()).hexdigest())
+
+    def get(self, path, params='', accept='application/vnd.github+json'):
+        """
+        Conditional GET of an API path. Responses are cached w/ their ETag.
+
+        Args:
+            path (str): Path relative to the repository (e.g. '/contents/tests/logs').
+
+            params (str): [Optional] Query string (e.g. 'ref=develop').
+
+            accept (str): Media type requested.
+
+        Return (bytes): Body of the response (or of the cached response if not modified).
+
+        """
+        url = f'{self.base_path}{self.repo_path}{quote(path)}' + (f'?{params}' if params else '')
+        headers = {'Accept': accept, 'User-Agent': 'ufs-dev-logs', 'Connection': 'keep-alive'}
+        if self.gh_token:
+            headers['Authorization'] = f'Bearer {self.gh_token}'
+        cached = self.etags.get(url)
+        if cached is not None and os.path.exists(self._cache_path(url)):
+            headers['If-None-Match'] = cached
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                conn = self._connection(reconnect=attempt > 0)
+                conn.request('GET', url, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError):
+                if attempt == self.max_retries:
+                    raise
+                continue
+
+            # Track the remaining rate limit
+            with self.lock:
+                self.n_requests += 1
+                if resp.getheader('X-RateLimit-Remaining') is not None:
+                    self.rate_remaining = int(resp.getheader('X-RateLimit-Remaining'))
+                    self.rate_reset = int(resp.getheader('X-RateLimit-Reset', '0'))
+
+            if resp.status == 304:
+                with self.lock:
+                    self.n_not_modified += 1
+                with open(self._cache_path(url), 'rb') as f:
+                    return f.read()
+            if resp.status == 200:
+                if resp.getheader('ETag') is not None:
+                    tmp_path = self._cache_path(url) + '.tmp'
+                    with open(tmp_path, 'wb') as f:
+                        f.write(body)
+                    os.replace(tmp_path, self._cache_path(url))
+                    with self.lock:
+                        self.etags[url] = resp.getheader('ETag')
+                return body
+
+            # Rate limited (primary or secondary): Retry after the advised delay
+            if resp.status in (403, 429) and attempt < self.max_retries:
+                if resp.getheader('Retry-After') is not None:
+                    time.sleep(float(resp.getheader('Retry-After')))
+                    continue
+                if resp.getheader('X-RateLimit-Remaining') == '0':
+                    time.sleep(max(0, int(resp.getheader('X-RateLimit-Reset', '0')) - time.time()))
+                    continue
+            if resp.status >= 500 and attempt < self.max_retries:
+                time.sleep(2**attempt)
+                continue
+            raise http.client.HTTPException(f'GET {url}: {resp.status} {resp.reason}')
+
+    def list_logs(self):
+        """
+        Return (list): Filenames of the logs within the log directory.
+
+        """
+        entries = json.loads(self.get(f'/contents/{self.log_dir}', f'ref={self.branch}'))
+
+        return [entry['name'] for entry in entries if entry['type'] == 'file']
+
+    def latest_log_commit(self):
+        """
+        Return (str, datetime): Hash & date (local time, as within LoadData.read_latest_logs) of the
+        latest commit made to the log directory.
+
+        """
+        commit = json.loads(self.get('/commits', f'sha={self.branch}&path={self.log_dir}&per_page=1'))[0]
+        commit_date = datetime.fromisoformat(commit['commit']['committer']['date'].replace('Z', '+00:00'))
+        self.latest_commit = (commit['sha'], commit_date.astimezone().replace(tzinfo=None))
+
+        return self.latest_commit
+
+    def read_logs(self, selection=None, is_relevant_log=None):
+        """
+        Download the logs in use as of the latest commit made to the log directory.
+
+        Args:
+            selection (LogSelection): [Optional] Platforms, compilers, test framework types &
+                                      tests to select. Unselected logs are not downloaded.
+
+            is_relevant_log (function): [Optional] Predicate on the log filenames in use (see LoadData.is_relevant_log).
+                                        Default: All '.log' files.
+
+        Return (dict): Text per (log filename, commit date), as within LoadData.log_files_corpus.
+
+        """
+        commit_sha, commit_date = self.latest_log_commit()
+        log_fns = [log_fn for log_fn in self.list_logs()
+                   if (log_fn.endswith('.log') if is_relevant_log is None else is_relevant_log(log_fn))
+                   and (selection is None or selection.accepts_log(log_fn))]
+
+        # Logs requested per branch (rather than per commit), such that the URLs & ETags of unchanged logs persist across commits
+        def fetch(log_fn):
+            return self.get(f'/contents/{self.log_dir}/{log_fn}', f'ref={self.branch}', accept='application/vnd.github.raw')
+
+        bodies = list(self.pool.map(fetch, log_fns))
+
+        # Persist the ETags of the cached responses
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.etags, f)
+        os.replace(tmp_path, self.index_path)
+
+        # Text as featured w/in 'git show' (w/o its trailing newline)
+        corpus = {}
+        for log_fn, body in zip(log_fns, bodies):
+            txt = body.decode(errors='replace')
+            corpus[(log_fn, commit_date)] = txt[:-1] if txt.endswith('\n') else txt
+
+        return corpus
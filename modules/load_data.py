@@ -3,6 +3,19 @@ import os
 
 # Inital setup modules
 from init_setup import init_setup
+from opnreq_scanner import OpnReqScanner
+from file_index import OutputFileIndex
+from record_store import TestRecordStore, sec_to_time
+from summary_aggregates import SummaryAggregates
+from history_db import HistoryDB
+from record_spill import LazyLogCorpus, RecordSpill
+from metrics_exporter import MetricsExporter, timed_stage
+from log_formats import LogFormatRegistry, sniff_rt_022024, sniff_opnreq_122021
+from corpus_cache import shared_cache
+from sparse_pivot import SparsePivot
+from speed_model import SpeedModel
+from log_archive import LogArchive
+from flaky_index import FlakyIndex, attempt_sec
 import shutil
 from git import Repo
 
@@ -22,7 +35,7 @@ class LoadData():
     Pull, load, extract, & preprocess UFS-WM data.
     
     """
-    def __init__(self, gh_username, gh_token, repo_abbrev='ufs-wm',  branch='develop'):
+    def __init__(self, gh_username, gh_token, repo_abbrev='ufs-wm',  branch='develop', refresh=True, max_memory_mb=None, selection=None, corpus_cache=None, log_source=None):
         """
         Args:                          
             gh_username (str): GitHub username
@@ -32,12 +45,43 @@ class LoadData():
             repo_abbrev (str): Name of repository. Default: 'ufs-wm'
             
             branch (str): Default: Name of repository. 'develop
+
+            refresh (bool, str): If False, the local repo is not reset & pulled from remote
+                                 (e.g. when the remote is fetched by the watch mode). If 'auto',
+                                 the pull is skipped while the corpus cache is warm.
+
+            max_memory_mb (float): [Optional] Bounded-memory mode for large log corpora. Logs are
+                                   read & parsed one at a time & the test records are spilled
+                                   to disk in chunks once they exceed the ceiling (MB). The
+                                   dataframes are assembled one chunk at a time (see RecordSpill.frame).
+                                   Not covered by the ceiling: The generated dataframes & pivots (a row
+                                   per unique test) & the persisted indexes, i.e. the output file index,
+                                   flaky test index & summary aggregates, which grow w/ the distinct
+                                   output files, tests, commit dates & logs ingested across runs rather than
+                                   w/ the logs of a run.
+
+            selection (LogSelection): [Optional] Platforms, compilers, test framework types &
+                                      tests to select. Unselected logs are never read &
+                                      unselected tests are skipped while parsing.
+
+            corpus_cache (CorpusCache): [Optional] LRU cache of the logs' text per (commit, log path).
+                                        Default: Cache shared within the session.
+
+            log_source (HTTPLogSource): [Optional] Clone-free source of the logs (see read_http_logs).
+                                        If set, the UFS-WM repo is neither cloned nor pulled. Closed by
+                                        the caller once the logs are read (see HTTPLogSource.close).
                               
         """
         # Clone & pull UFS-WM repo
         self.username, self.token = gh_username, gh_token
         self.repo_abbrev, self.branch = repo_abbrev, branch
-        if not os.path.exists('ufs-repo'):
+        self.log_source = log_source
+        if self.log_source is not None:
+            print(f'Fetching the {repo_abbrev} logs over HTTP (the repo is not cloned).')
+            self.local_repo_dir, self.my_local_repo = None, None
+            refresh = False
+
+        elif not os.path.exists('ufs-repo'):
             print(f'Cloning {self.repo_abbrev} repo from remote ...')
             init_setup(self.username, self.token, self.repo_abbrev, self.branch)
 
@@ -45,22 +89,107 @@ class LoadData():
             print(f'The {repo_abbrev} repo exist on local.')
 
         # Load local repo & verify active branch 
-        self.local_repo_dir = os.getcwd() + '/ufs-repo'
-        self.my_local_repo = Repo(self.local_repo_dir)
-        print(f'\nCurrently on Active Branch: {self.my_local_repo.active_branch}')
+        if self.log_source is None:
+            self.local_repo_dir = os.getcwd() + '/ufs-repo'
+            self.my_local_repo = Repo(self.local_repo_dir)
+            print(f'\nCurrently on Active Branch: {self.my_local_repo.active_branch}')
 
-        # Forcing a pull from remote repo to overwrite local repo
-        self.my_local_repo.git.reset('--hard', f'origin/{self.my_local_repo.active_branch}')
-        
-        # Fetch information from remote repository & pull to local repo.
-        print(f'\nPulling {self.repo_abbrev} repo from remote ...')
-        self.my_local_repo.remote().pull(self.my_local_repo.active_branch)
-        print('\nCompleted.')
+        # Logs' text cached across instances (e.g. notebook sessions)
+        self.corpus_cache = corpus_cache if corpus_cache is not None else shared_cache()
+        if refresh == 'auto':
+            refresh = not self.corpus_cache.is_warm()
+
+        if refresh:
+            # Forcing a pull from remote repo to overwrite local repo
+            self.my_local_repo.git.reset('--hard', f'origin/{self.my_local_repo.active_branch}')
+            
+            # Fetch information from remote repository & pull to local repo.
+            print(f'\nPulling {self.repo_abbrev} repo from remote ...')
+            self.my_local_repo.remote().pull(self.my_local_repo.active_branch)
+            self.corpus_cache.last_refresh = time.time()
+            print('\nCompleted.')
         
         # Create directory to save results
         if not os.path.exists("dataframes"):
             os.mkdir("dataframes")
 
+        # Inverted index of compared & moved output files (persisted across runs)
+        self.file_index = OutputFileIndex("dataframes/output_file_index.pkl")
+
+        # Summary statistics per test maintained incrementally (persisted across runs)
+        self.aggregates = SummaryAggregates("dataframes/summary_aggregates.pkl")
+
+        # Retries, failed compares & wasted wall time per test maintained incrementally (persisted across runs)
+        self.flaky_index = FlakyIndex("dataframes/flaky_index.pkl")
+
+        # History of the test metrics of all ingested runs
+        self.history_db = HistoryDB("dataframes/history.db")
+
+        # Raw text of all ingested logs (zstd-compressed w/ a shared dictionary)
+        self.log_archive = LogArchive("dataframes/log_archive.db")
+
+        # Latest test metrics & pipeline timing exported for monitoring (OpenMetrics textfile)
+        self.metrics_exporter = MetricsExporter("dataframes/ufs_wm_metrics.prom")
+
+        # Selection predicates pushed down to the reading & parsing of the logs
+        self.selection = selection
+
+        # Registry of the supported log format versions, each routed to its parser
+        self.register_log_formats()
+
+        # Chunks of the test records spilled to disk (bounded-memory mode only)
+        self.record_spill = RecordSpill("dataframes/spill", max_memory_mb) if max_memory_mb is not None else None
+
+    @classmethod
+    def offline(cls, selection=None, file_index_path="dataframes/output_file_index.pkl"):
+        """
+        Instance only parsing logs (e.g. within the backfill workers), w/o the local repo
+        & w/o the persisted aggregates, history & exported metrics.
+
+        Args:
+            selection (LogSelection): [Optional] Platforms, compilers, test framework types &
+                                      tests to select.
+
+            file_index_path (str): Pickle file of the inverted index of output files. If None, the index is
+                                   kept in memory only (e.g. within the backfill workers).
+
+        Return (LoadData): Instance for preprocessing the logs set to log_files_corpus.
+
+        """
+        data_wrapper = cls.__new__(cls)
+        data_wrapper.selection = selection
+        data_wrapper.file_index = OutputFileIndex(file_index_path)
+        data_wrapper.flaky_index = FlakyIndex(None)
+        data_wrapper.metrics_exporter = MetricsExporter(None)
+        data_wrapper.record_spill = None
+        data_wrapper.register_log_formats()
+
+        return data_wrapper
+
+    def register_log_formats(self):
+        """
+        Register the supported log format versions, each routed to its parser (most frequent first).
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        # Note: Logs saved w/ the compiler's name within their filenames & the RT run logs (e.g. RT-run-Orion.log)
+        # still reside within the UFS-WM logs directory, but are no longer in use
+        self.log_formats = LogFormatRegistry()
+        self.log_formats.register('Regression Testing', '02/2024', sniff_rt_022024, self.parse_rt_log,
+                                  filename_prefix='RegressionTests_', stale_patterns=('intel',))
+        self.log_formats.register('Operation Requirement Test', '12/2021', sniff_opnreq_122021, self.parse_opnreq_log,
+                                  filename_prefix='OpnReqTests_', stale_patterns=('intel',))
+
+        # Formats already sniffed per (log filename, commit date) of the log_files_corpus (e.g. from the logs' blobs)
+        self.log_files_formats = {}
+
+        return
+
+    @timed_stage
     def read_latest_logs(self, log_dir='/tests/logs', days_of_commits=10):
         """
         Extracts latest logs of UFS-WM RT & OpnReq Test framework.
@@ -87,34 +216,160 @@ class LoadData():
         platform, & compiler listed within their filenames (e.g. OpnReqTests_cpld_bmark_p8_hera.intel.log)
         
         """
-        # Observe commits made to against log's directory (e.g. /tests as of 2022) within last N days 
-        commits_dict = defaultdict()
-        commits_files_dict = {}
-        for commit in self.my_local_repo.iter_commits('--all', max_count=100, since=f'{days_of_commits}.days.ago', paths='./tests'):
-            print(commit)
-            print("Committed by %s on %s with sha %s" % (commit.committer.name, time.strftime("%a, %d %b %Y %H:%M", time.localtime(commit.committed_date)), commit.hexsha))
-            commits_dict[datetime.fromtimestamp(mktime(time.localtime(commit.committed_date)))] = {commit.hexsha: list(commit.stats.files.keys())}
+        # Observe commits made to against log's directory (e.g. /tests as of 2022) within last N days
+        # Note: Walks are cached per state of the refs, N days & date
+        walk_key = (self.my_local_repo.git.rev_parse('--all'), days_of_commits, datetime.now().date())
+        commits_dict = self.corpus_cache.walk_commits(walk_key, lambda: self.walk_commits(days_of_commits))
 
-        # Extract & generate list of relevant logs.
+        # Extract & generate list of relevant logs as of the latest commit (rather than the working tree, which
+        # may be stale or on another branch). Unselected logs are skipped by their filename & logs of an
+        # unknown format are skipped by sniffing only the head of their blob.
+        latest_sha = [v for v in commits_dict[max(commits_dict)].keys()][0]
         unique_log_list = []
-        for log_fn in os.listdir(self.local_repo_dir + log_dir):
-            if 'intel' not in log_fn and 'RT-run' not in log_fn and '.log' in log_fn:
+        self.log_files_formats = {}
+        for blob in (self.my_local_repo.commit(latest_sha).tree / log_dir.strip('/')).blobs:
+            log_fn = blob.name
+            if not self.is_relevant_log(log_fn):
+                continue
+            if self.selection is not None and not self.selection.accepts_log(log_fn):
+                continue
+            log_format = self.log_formats.sniff_blob(blob)
+            if log_format is not None:
                 unique_log_list.append(log_fn)
+                self.log_files_formats[(log_fn, max(commits_dict))] = log_format
         print('\nList of relevant logs:\n', unique_log_list)
 
         # Generate dictionary of the latest commit's RT log corpuses
+        # Note: In bounded-memory mode, logs are only referenced & read (& archived) when parsed
+        if self.record_spill is not None:
+            self.log_files_corpus = LazyLogCorpus(self.my_local_repo, self.log_archive)
+            for log_filename in unique_log_list:
+                self.log_files_corpus[(log_filename, max(commits_dict))] = (latest_sha, f'.{log_dir}/{log_filename}')
+            return
+
         self.log_files_corpus = {}
         log_file_content = []
         for log_filename in unique_log_list:
             try:
-                # Checkout most recent committed log files to pull updates to local
-                recent_log_committed = self.my_local_repo.git.show('{}:{}'.format([v for v in commits_dict[max(commits_dict)].keys()][0], f'.{log_dir}/{log_filename}'))
+                # Checkout most recent committed log files to pull updates to local (unless cached)
+                log_path = f'.{log_dir}/{log_filename}'
+                recent_log_committed = self.corpus_cache.get((latest_sha, log_path),
+                                                             lambda: self.my_local_repo.git.show(f'{latest_sha}:{log_path}'))
                 self.log_files_corpus[(log_filename, max(commits_dict))] = recent_log_committed
             except:
                 pass
 
+        # Archive raw logs (logs unchanged since the last archived commit are stored once)
+        self.log_archive.add_many((latest_sha, log_fn, commit_date, txt) for (log_fn, commit_date), txt in self.log_files_corpus.items())
+
+        return
+
+    def walk_commits(self, days_of_commits=10):
+        """
+        Walk the commits made to the tests directory within the last N days.
+
+        Args:
+            days_of_commits (int): N number of days worth of commits.
+
+        Return (dict): Changed files per commit hash per commit date.
+
+        """
+        commits_dict = defaultdict()
+        for commit in self.my_local_repo.iter_commits('--all', max_count=100, since=f'{days_of_commits}.days.ago', paths='./tests'):
+            print(commit)
+            print("Committed by %s on %s with sha %s" % (commit.committer.name, time.strftime("%a, %d %b %Y %H:%M", time.localtime(commit.committed_date)), commit.hexsha))
+            commits_dict[datetime.fromtimestamp(mktime(time.localtime(commit.committed_date)))] = {commit.hexsha: list(commit.stats.files.keys())}
+
+        return commits_dict
+
+    @timed_stage
+    def read_commit_logs(self, commit_sha, log_dir='/tests/logs'):
+        """
+        Extracts the logs of UFS-WM RT & OpnReq Test framework as of a given commit (e.g. to
+        switch between commits within notebooks). Logs are read through the corpus cache.
+
+        Args:
+            commit_sha (str): Commit hash (or any revision, e.g. 'HEAD~3').
+
+            log_dir (str): Relative directory of the where the logs files
+                           are located in repository.
+
+        Return: None
+
+        """
+        commit = self.my_local_repo.commit(commit_sha)
+        commit_date = datetime.fromtimestamp(mktime(time.localtime(commit.committed_date)))
+        self.log_files_formats = {}
+        self.log_files_corpus = {}
+        for blob in (commit.tree / log_dir.strip('/')).blobs:
+            if not self.is_relevant_log(blob.name):
+                continue
+            if self.selection is not None and not self.selection.accepts_log(blob.name):
+                continue
+            self.log_files_corpus[(blob.name, commit_date)] = self.corpus_cache.get((commit.hexsha, f'.{log_dir}/{blob.name}'),
+                                                                                   lambda: self.my_local_repo.git.show(f'{commit.hexsha}:.{log_dir}/{blob.name}'))
+        self.log_archive.add_many((commit.hexsha, log_fn, commit_date, txt) for (log_fn, commit_date), txt in self.log_files_corpus.items())
+
+        return
+
+    @timed_stage
+    def read_http_logs(self):
+        """
+        Downloads the latest logs of UFS-WM RT & OpnReq Test framework from the log source
+        (w/o the UFS-WM repo). Unchanged logs are read from the source's response cache.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        self.log_files_formats = {}
+        self.log_files_corpus = self.log_source.read_logs(self.selection, self.is_relevant_log)
+        print('\nList of relevant logs:\n', [log_fn for log_fn, _ in self.log_files_corpus])
+        commit_sha, _ = self.log_source.latest_commit
+        self.log_archive.add_many((commit_sha, log_fn, commit_date, txt) for (log_fn, commit_date), txt in self.log_files_corpus.items())
+
+        return
+
+    @timed_stage
+    def read_archived_logs(self, commit_sha=None, start_date=None, end_date=None):
+        """
+        Loads logs from the log archive rather than from the UFS-WM repository (e.g. to re-parse
+        the logs of past commits w/o the repository's history).
+
+        Args:
+            commit_sha (str): [Optional] Commit hash of the logs.
+
+            start_date (str): [Optional] Earliest commit date (e.g. '2024-01-01').
+
+            end_date (str): [Optional] Latest commit date (exclusive).
+
+        Return: None
+
+        """
+        log_fns = [log_fn for log_fn in self.log_archive.log_fns()
+                   if self.is_relevant_log(log_fn) and (self.selection is None or self.selection.accepts_log(log_fn))]
+        self.log_files_formats = {}
+        self.log_files_corpus = self.log_archive.corpus(commit_sha, start_date, end_date, log_fns)
+
         return
     
+    def is_relevant_log(self, log_fn):
+        """
+        Args:
+            log_fn (str): Log filename.
+
+        Return (bool): True if the log is in use within the UFS-WM RT & OpnReq Test framework.
+
+        Note:
+        - The filenames of the logs in use are registered per format w/in the LogFormatRegistry,
+        where the format of the log is sniffed.
+
+        """
+        return self.log_formats.is_log_filename(log_fn)
+
+    @timed_stage
     def preprocess(self):
         """
         Extracts & parses metrics featured within logs.
@@ -122,241 +377,332 @@ class LoadData():
         Args:
             None
             
-        Return: Log information preprocessed per test per platform-to-compiler.
+        Return (TestRecordStore): Test records of the parsed logs per test per platform-to-compiler.
+
+        Note:
+        - Parsed log details are not retained once their test records are stored. Only the
+        flaky test counts of each log are kept (see flaky_logs), e.g. for the backfill shards.
 
         """
-        # Generate dictionary of parsed log details
-        self.parsed_txt_dict = defaultdict(list)
+        # Compact store of the test records & flaky test counts per log (see FlakyIndex.log_rows)
+        self.record_store = TestRecordStore()
+        self.flaky_logs = []
+        if self.record_spill is not None:
+            self.record_spill.clear()
 
-        # Map the test size abbreviations to powers of 10 
-        test_sz_abbrev = {'KB': (2**10),
-                          'MB': (2**10)**2, 
-                          'GB': (2**10)**3,
-                          'TB': (2**10)**4}
-        
         # Parse through log names & dates of latest retrieval
         for (log_fn, commit_date), txt in self.log_files_corpus.items():
 
+            # Route log to the parser of its format version (sniffed from the log's head, unless already sniffed).
+            log_format, parse_log = self.log_formats.route(txt, self.log_files_formats.get((log_fn, commit_date)))
+            if parse_log is None:
+                print(f'Skipping {log_fn}: Unknown log format.')
+                continue
+            if self.selection is not None and not self.selection.accepts_log(log_fn, framework=log_format[0]):
+                continue
+
             # Parse & extract platform and compiler from logs.
             pf = log_fn.split(".")[:-1][0]
             pf = pf.split("_",1)[1].title()
-            
-            # Parse log information per test per platform-to-compiler.
-            framework_type = str()
-            bl_test_dir = []
-            compare_test_dir = []
-            dtimes_performed = []
-            dtimes_completed = []
-            tot_times = []
-            unique_test_steps = []
-            unique_test_time = []
-            unique_test_sz = []
-            log_txt_list = []
-            compile_builds_txt = []
-            tests_txt = []
-            reg_test_case = []
-            reg_test = []
-            failed_reg_test = []
-            reg_test_stat = []
-            for line in txt.split('\n'):
-                log_txt_list.append(line)
-                if "COMPILE" in line:
-                    compile_builds_txt.append(line.split(' ')[3].replace("'", ""))   
-                if log_fn.startswith('OpnReqTests'):  
-                    if "Test " and " PASS" in line or "Test " and " FAIL Tries" in line:
-                        reg_test_case.append(line.split(' ')[1])
-                        casentest = line.split(' ')[1]
-                        reg_test.append(casentest)
-                        reg_test_stat.append(line.split(' ')[-1])
-                elif log_fn.startswith('RegressionTests'):
-                    if "PASS -- TEST" in line:
-                        reg_test_case.append(line.split(' ')[1])
-                        reg_test.append(line.split(' ')[3].replace("'", ""))
-                        reg_test_stat.append(line.split(' ')[0])
-
-                        # Extract test time 
-                        unique_test_time.append(line[line.find("[")+1:line.find("]")])
-
-                        # Extract test size
-                        unique_test_sz.append(line.split('](')[-1].replace(")", ""))
-                        
-                    if "TEST" and " FAIL TO COMPARE" in line:
-                        failed_reg_test.append(line[line.find("(")+1:line.find(")")])
+
+            # Parsed log details
+            log_details = parse_log(pf, commit_date, txt)
+
+            # Test records of log appended to store
+            self.record_store.add_log(commit_date, log_details)
+
+            # Retries & failed compares of the log's tests counted w/in the flaky test index
+            log_key, flaky_rows = FlakyIndex.log_rows(commit_date, log_details)
+            self.flaky_index.add_rows(log_key, flaky_rows)
+            log_details = None
+
+            # Bounded-memory mode: Flaky test counts are not retained & the test records are spilled once full
+            if self.record_spill is not None:
+                if self.record_spill.is_full(self.record_store):
+                    self.spill_records()
+            else:
+                self.flaky_logs.append((log_key, flaky_rows))
+
+            # Log's text released before the next log is read
+            txt = None
+
+        # Persist inverted index of compared & moved output files
+        self.file_index.save()
                         
-                    # Accomodating the empty test size with measurement unit placeholder
-                    x1 = [x.split(' ')[0] if x.split(' ')[0]!='' else 0 for x in unique_test_sz]
-                    x2 = [" ".join(re.findall("[a-zA-Z]+", x)) for x in unique_test_sz]
-                    refactored_vector = ['{} {}'.format(x1,x2) for x1, x2 in zip(x1,x2)]   
-                    
-                    # Partition elements of test size & convert to numeric
-                    x3 = [test_sz_abbrev[x.split(' ')[-1]] if x.split(' ')[-1] in test_sz_abbrev.keys() else 1 for x in refactored_vector]
-                    x4 = np.asarray([re.sub("[^0-9]", "", x) for x in refactored_vector], dtype=int)
-                    unique_test_sz_parsed = x3*x4
-
-                    # Partition elements of test time & convert to numeric
-                    wallnwait_times = [x.split(', ')[0] if x!=', ' else '00:00' for x in unique_test_time]
-                    run_times = [x.split(', ')[1] if x!=', ' else '00:00' for x in unique_test_time]
-                    wallnwait_dt_list = [datetime.strptime(elem, '%M:%S') for elem in wallnwait_times]
-                    run_dt_list = [datetime.strptime(elem, '%M:%S') for elem in run_times]
-                    zero_dt_list = [datetime.strptime('00:00', '%M:%S')]*len(run_dt_list)
-
-                    # Overall test time (Wall time + Wait time + Run time)
-                    unique_test_time_parsed = np.asarray(run_dt_list) - np.asarray(zero_dt_list) + np.asarray(wallnwait_dt_list)
-                    
-                    # Extract only time
-                    unique_test_time_parsed = [dt_obj.time() for dt_obj in unique_test_time_parsed]
-                    run_dt_list = [dt_obj.time() for dt_obj in run_dt_list]
-                    wallnwait_dt_list = [dt_obj.time() for dt_obj in wallnwait_dt_list]
-                    
-            # Operation Req. & Regression Test logs feature different internal formats
-            if log_fn.startswith('OpnReqTests'):
-                
-                # Framework type parsed & extracted
-                framework_type = log_txt_list[1].replace('Start ', '')
+        return self.record_store
 
-                # Test Start/End Datetimes.
-                dtimes_performed.append(log_txt_list[0])
-                dtimes_completed.append(log_txt_list[-2])
-                tot_times.append(re.sub("[^:0-9]", "", log_txt_list[-1].split(': ')[1]))
+    def parse_rt_log(self, pf, commit_date, txt):
+        """
+        Parser of the Regression Test logs (as of 02/2024).
 
-                # Compared & moved files per test per platform-to-compiler parsed & extracted
-                bl_test_dir = list(re.findall(r'baseline dir = (.*?)working', txt.replace("\n", "")))
-                
-                # Test build steps parsed & extracted
-                work_test_dir = list(re.findall(r'working dir  = (.*?)Checking', txt.replace("\n", " ")))
+        Args:
+            pf (str): Platform parsed from the log's filename.
 
-                # Test defined steps
-                unique_test_steps = list(re.findall(r'results ....(.*?)0:', txt.replace("\n", "")))
-                
-                # Wall time (s) parsed & extracted
-                unique_test_time = list(re.findall(r'The total amount of wall time(.*?)newline_stamp', txt.replace("\n", "newline_stamp")))
-                unique_test_time_parsed = [float(t.split("= ")[-1]) for t in unique_test_time]
-                
-                # Convert Wall time to mins to maintain time measurement units consistency with regression test logs
-                unique_test_time_parsed = [divmod(t, 60) for t in unique_test_time_parsed]
-                unique_test_time_parsed = [datetime.strptime(str(int(elem[0]))+':'+str(round(elem[1], 6)), '%M:%S.%f').time() for elem in unique_test_time_parsed]
-    
-                # Maximum test size (Kb) parsed & extracted
-                unique_test_sz = list(re.findall(r'maximum resident set size(.*?)newline_stamp', txt.replace("\n", "newline_stamp")))
-                unique_test_sz_parsed = [float(t.split("= ")[-1]) for t in unique_test_sz]
-                                
-                unique_test_bl = dict(zip(reg_test, bl_test_dir))
-                unique_test_work = dict(zip(reg_test, work_test_dir))
-                unique_test_info = dict(zip(reg_test, unique_test_steps)) 
-                
-                mv_d = {}
-                compare_d = {}
-                for k, v in unique_test_info.items():
-                    compare_files = []
-                    compare_status = []
-                    mv_files = []
-                    mv_status = []
-                    compare_files = list(re.findall(r'Comparing (.*?) .', v))
-                    compare_status = list(re.findall(r'\.{6,15}(.*?) ', v))
-                    mv_files = list(re.findall(r'Moving (.*?) .', v))
-                    mv_status = list(re.findall(r'\.{6,15}(.*?) ', v))
-                    compare_d[k] = dict(zip(compare_files, compare_status))
-                    mv_d[k] = dict(zip(mv_files, mv_status))
-                    
-                # Convert start & end time per Opn Req. log to datetime
-                dtimes_performed = [datetime.strptime(elem, '%a %b  %d %H:%M:%S %Z %Y') for elem in dtimes_performed]
-                dtimes_completed = [datetime.strptime(elem, '%a %b  %d %H:%M:%S %Z %Y') for elem in dtimes_completed]
-                
-                # Convert total ("elapsed") time of the overall tests within Opn. Req. test log to datetime
-                tot_times = [datetime.strptime(elem, '%H:%M:%S').time() for elem in tot_times]
-                
-                # Variables nulled as it is not applicable to the Opn. Req. Test logs
-                wallnwait_dt_list = []
-                run_dt_list = []
+            commit_date (datetime): Commit date of the log.
 
-            elif log_fn.startswith('RegressionTests'):
-                
-                # Framework type parsed & extracted
-                framework_type = log_txt_list[0].split(' ')
-                framework_type = framework_type[-3] + ' ' + framework_type[-2]
-
-                # Test Start/End Datetimes. 
-                for txt in log_txt_list:
-                    if 'Starting Date/Time' in txt:
-                        dtimes_performed.append(txt.split(': ')[1])
-                    if 'Ending Date/Time' in txt:
-                        dtimes_completed.append(txt.split(': ')[1])
-                    if 'Total Time' in txt:
-                        tot_times.append(re.sub("[^:0-9]", "", txt.split(': ')[1]))
-
-                    # Sourced comparison & baseline directorues
-                    if 'BASELINE DIRECTORY' in txt:
-                        bl_test_dir.append(txt.split(' ')[-1])
-                        unique_test_bl = bl_test_dir
-                    if 'COMPARISON DIRECTORY' in txt:
-                        compare_test_dir.append(txt.split(' ')[-1])
-                        compare_d = compare_test_dir
-
-                # Convert start & end time per RT log to datetime
-                dtimes_performed = [datetime.strptime(elem, '%Y%m%d %H:%M:%S') for elem in dtimes_performed]
-                dtimes_completed = [datetime.strptime(elem, '%Y%m%d %H:%M:%S') for elem in dtimes_completed]
-
-                # Convert total time of the overall tests within Opn. Req. test log to datetime
-                tot_times = [datetime.strptime(elem, '%H:%M:%S').time() for elem in tot_times]
+            txt (str): Text of the log.
+
+        Return (dict): Parsed log details.
+
+        """
+        # Map the test size abbreviations to powers of 10 
+        test_sz_abbrev = {'KB': (2**10),
+                          'MB': (2**10)**2, 
+                          'GB': (2**10)**3,
+                          'TB': (2**10)**4}
+
+        # Parse log information per test per platform-to-compiler.
+        framework_type = str()
+        bl_test_dir = []
+        compare_test_dir = []
+        unique_test_bl = []
+        compare_d = []
+        dtimes_performed = []
+        dtimes_completed = []
+        tot_times = []
+        unique_test_time = []
+        unique_test_sz = []
+        log_txt_list = []
+        compile_builds_txt = []
+        reg_test_case = []
+        reg_test = []
+        failed_reg_test = []
+        reg_test_stat = []
+        retried_reg_test = defaultdict(int)
+        compare_failed_reg_test = defaultdict(int)
+        failed_attempt_time = defaultdict(float)
+        for line in txt.split('\n'):
+            log_txt_list.append(line)
+            if "COMPILE" in line:
+                compile_builds_txt.append(line.split(' ')[3].replace("'", ""))   
+            # Unselected tests are skipped prior to converting their fields
+            if "PASS -- TEST" in line and (self.selection is None or self.selection.accepts_test('Regression Testing', pf, line.split(' ')[3].replace("'", ""))):
+                reg_test_case.append(line.split(' ')[1])
+                reg_test.append(line.split(' ')[3].replace("'", ""))
+                reg_test_stat.append(line.split(' ')[0])
+
+                # Extract test time 
+                unique_test_time.append(line[line.find("[")+1:line.find("]")])
+
+                # Extract test size
+                unique_test_sz.append(line.split('](')[-1].replace(")", ""))
                 
-                # Variables nulled as it is not applicable to Req. Test logs
-                work_test_dir = list()
-                unique_test_work = dict()
-                unique_test_info = dict()
-                mv_d = dict()
-
-            # Both Opn. Req. Test & Regression test logs will feature time & size per test
-            unique_test_wallnwait_dt = dict(zip(reg_test, wallnwait_dt_list))
-            unique_test_run_dt = dict(zip(reg_test, run_dt_list))
-            unique_test_time = dict(zip(reg_test, unique_test_time_parsed))
-            unique_test_sz = dict(zip(reg_test, unique_test_sz_parsed)) 
-
-            # Dictionary of parsed log details
-            self.parsed_txt_dict[(pf, commit_date)] = {"Platform": pf,
-                                                      "Tests_Performed_Date": dtimes_performed,
-                                                      "Test_Framework_Type": framework_type.title(),
-                                                      "Builds": compile_builds_txt,
-                                                      "Unique_Tests": reg_test,
-                                                      "Unique_Test_Bl": unique_test_bl,
-                                                      "Unique_Test_Work": unique_test_work,
-                                                      "Unique_Test_Info": unique_test_info,
-                                                      "Unique_Test_WallnWait_Time": unique_test_wallnwait_dt,
-                                                      "Unique_Test_Run_Time": unique_test_run_dt,
-                                                      "Unique_Test_Time": unique_test_time, # For RT logs, Wall + Wait + Run time. For Opn Req logs, referred to as "Total Wall Time"
-                                                      "Unique_Test_Size": unique_test_sz, # Maximum resident set size (KB)
-                                                      "Compared_Files": compare_d,
-                                                      "Moved_Files": mv_d,
-                                                      "Overall_Tests_Result": log_txt_list[-3].split(' ')[-1],
-                                                      "Tests_Completed_Date": dtimes_completed,
-                                                      "Elapsed_Time": tot_times}
-
-            # Failed tests that are re-ran to fulfill a pass.
-            # Note: The essential metrics, test's new wall time & test size, will only be re-captured 
-            failed_regtest_list = []
-            for idx, line in enumerate(txt.split('\n')):
-                if "FAIL Tries" in line:
-                    if log_fn.startswith('OpnReqTests'):
-                        casentest = line.split(' ')[1] + ', ' + line.split(' ')[2]
-                        failed_regtest_list.append(casentest)
-                    elif log_fn.startswith('RegressionTests'):
-                        failed_reg_test = line.split(' ')[2]
-                        failed_regtest_list.append(failed_reg_test)
-                for f in failed_regtest_list:
-                    if f in line and line.endswith('PASS'):
-                        # Wall time parsed & extracted
-                        failed_test_new_time=txt.split('\n')[idx-3]
-                        failed_test_new_time = float(failed_test_new_time.split("= ")[-1])
-                        
-                        # Max test size (Kb) parsed & extracted
-                        failed_test_new_sz=txt.split('\n')[idx-2]
-                        failed_test_new_sz = float(failed_test_new_sz.split("= ")[-1])
+            if "TEST" in line and " FAIL TO COMPARE" in line:
+                failed_reg_test.append(line[line.find("(")+1:line.find(")")])
 
-                        # Updates dictionary to the re-captured relevant metrics
-                        self.parsed_txt_dict[(pf, commit_date)]["Unique_Test_Time"][f]= failed_test_new_time
-                        self.parsed_txt_dict[(pf, commit_date)]["Unique_Test_Size"][f]= failed_test_new_sz
-                        
-        return self.parsed_txt_dict
+            # Attempts of tests which failed to compare against the baseline
+            if line.startswith("FAIL TO COMPARE -- TEST"):
+                compare_failed_reg_test[line.split(' ')[5].replace("'", "")] += 1
+                failed_attempt_time[line.split(' ')[5].replace("'", "")] += attempt_sec(line)
+
+            # Failed attempts of tests that are re-ran
+            if "FAIL Tries" in line:
+                retried_reg_test[line.split(' ')[2].replace("'", "")] += 1
+                failed_attempt_time[line.split(' ')[2].replace("'", "")] += attempt_sec(line)
+
+        # Accomodating the empty test size with measurement unit placeholder
+        x1 = [x.split(' ')[0] if x.split(' ')[0]!='' else 0 for x in unique_test_sz]
+        x2 = [" ".join(re.findall("[a-zA-Z]+", x)) for x in unique_test_sz]
+        refactored_vector = ['{} {}'.format(x1,x2) for x1, x2 in zip(x1,x2)]   
+        
+        # Partition elements of test size & convert to numeric
+        x3 = [test_sz_abbrev[x.split(' ')[-1]] if x.split(' ')[-1] in test_sz_abbrev.keys() else 1 for x in refactored_vector]
+        x4 = np.asarray([re.sub("[^0-9]", "", x) for x in refactored_vector], dtype=int)
+        unique_test_sz_parsed = x3*x4
+
+        # Partition elements of test time & convert to numeric
+        wallnwait_times = [x.split(', ')[0] if x!=', ' else '00:00' for x in unique_test_time]
+        run_times = [x.split(', ')[1] if x!=', ' else '00:00' for x in unique_test_time]
+        wallnwait_dt_list = [datetime.strptime(elem, '%M:%S') for elem in wallnwait_times]
+        run_dt_list = [datetime.strptime(elem, '%M:%S') for elem in run_times]
+        zero_dt_list = [datetime.strptime('00:00', '%M:%S')]*len(run_dt_list)
+
+        # Overall test time (Wall time + Wait time + Run time)
+        unique_test_time_parsed = np.asarray(run_dt_list) - np.asarray(zero_dt_list) + np.asarray(wallnwait_dt_list)
+        
+        # Extract only time
+        unique_test_time_parsed = [dt_obj.time() for dt_obj in unique_test_time_parsed]
+        run_dt_list = [dt_obj.time() for dt_obj in run_dt_list]
+        wallnwait_dt_list = [dt_obj.time() for dt_obj in wallnwait_dt_list]
+
+        # Framework type parsed & extracted
+        framework_type = log_txt_list[0].split(' ')
+        framework_type = framework_type[-3] + ' ' + framework_type[-2]
+        overall_result = log_txt_list[-3].split(' ')[-1]
+
+        # Test Start/End Datetimes. 
+        for log_line in log_txt_list:
+            if 'Starting Date/Time' in log_line:
+                dtimes_performed.append(log_line.split(': ')[1])
+            if 'Ending Date/Time' in log_line:
+                dtimes_completed.append(log_line.split(': ')[1])
+            if 'Total Time' in log_line:
+                tot_times.append(re.sub("[^:0-9]", "", log_line.split(': ')[1]))
+
+            # Sourced comparison & baseline directorues
+            if 'BASELINE DIRECTORY' in log_line:
+                bl_test_dir.append(log_line.split(' ')[-1])
+                unique_test_bl = bl_test_dir
+            if 'COMPARISON DIRECTORY' in log_line:
+                compare_test_dir.append(log_line.split(' ')[-1])
+                compare_d = compare_test_dir
+
+        # Convert start & end time per RT log to datetime
+        dtimes_performed = [datetime.strptime(elem, '%Y%m%d %H:%M:%S') for elem in dtimes_performed]
+        dtimes_completed = [datetime.strptime(elem, '%Y%m%d %H:%M:%S') for elem in dtimes_completed]
+
+        # Convert total time of the overall tests within Opn. Req. test log to datetime
+        tot_times = [datetime.strptime(elem, '%H:%M:%S').time() for elem in tot_times]
+
+        # Time & size per test
+        unique_test_wallnwait_dt = dict(zip(reg_test, wallnwait_dt_list))
+        unique_test_run_dt = dict(zip(reg_test, run_dt_list))
+        unique_test_time = dict(zip(reg_test, unique_test_time_parsed))
+        unique_test_sz = dict(zip(reg_test, unique_test_sz_parsed)) 
+        unique_test_tries = {test: 1 + retried_reg_test[test] for test in reg_test}
+
+        # Failed compares & wall time (s) of the failed attempts per test (see FlakyIndex)
+        if self.selection is not None:
+            compare_failed_reg_test = {test: n for test, n in compare_failed_reg_test.items() if self.selection.accepts_test('Regression Testing', pf, test)}
+            failed_attempt_time = {test: t for test, t in failed_attempt_time.items() if self.selection.accepts_test('Regression Testing', pf, test)}
 
+        # Failed tests that are re-ran to fulfill a pass.
+        # Note: The essential metrics, test's new wall time & test size, will only be re-captured 
+        failed_regtest_list = []
+        for idx, line in enumerate(log_txt_list):
+            if "FAIL Tries" in line:
+                failed_regtest_list.append(line.split(' ')[2].replace("'", ""))
+            for f in failed_regtest_list:
+                if f in unique_test_time and f in line and line.endswith('PASS') and idx >= 3:
+                    try:
+                        # Wall time (s) parsed & extracted
+                        failed_test_new_time = float(log_txt_list[idx-3].split("= ")[-1])
+
+                        # Max test size (KB) parsed & extracted
+                        failed_test_new_sz = float(log_txt_list[idx-2].split("= ")[-1])
+                    except ValueError:
+                        continue
+
+                    # Updates dictionary to the re-captured relevant metrics (as time & bytes, as the other tests)
+                    unique_test_time[f]= sec_to_time(failed_test_new_time)
+                    unique_test_sz[f]= failed_test_new_sz*(2**10)
+
+        # Working directories, test steps & moved files nulled as it is not applicable to Regression Test logs
+        return {"Platform": pf,
+                "Tests_Performed_Date": dtimes_performed,
+                "Test_Framework_Type": framework_type.title(),
+                "Builds": compile_builds_txt,
+                "Unique_Tests": reg_test,
+                "Unique_Test_Bl": unique_test_bl,
+                "Unique_Test_Work": dict(),
+                "Unique_Test_Info": dict(),
+                "Unique_Test_WallnWait_Time": unique_test_wallnwait_dt,
+                "Unique_Test_Run_Time": unique_test_run_dt,
+                "Unique_Test_Time": unique_test_time, # Wall + Wait + Run time
+                "Unique_Test_Size": unique_test_sz, # Maximum resident set size (bytes)
+                "Unique_Test_Tries": unique_test_tries,
+                "Unique_Test_Status": dict(zip(reg_test, reg_test_stat)),
+                "Unique_Test_Failed_Compares": dict(compare_failed_reg_test),
+                "Unique_Test_Failed_Time": dict(failed_attempt_time), # Wall + Wait + Run time (s) of the failed attempts
+                "Compared_Files": compare_d,
+                "Moved_Files": dict(),
+                "Overall_Tests_Result": overall_result,
+                "Tests_Completed_Date": dtimes_completed,
+                "Elapsed_Time": tot_times}
+
+    def parse_opnreq_log(self, pf, commit_date, txt):
+        """
+        Parser of the Operation Requirement Test logs (as of 12/2021).
+
+        Args:
+            pf (str): Platform parsed from the log's filename.
+
+            commit_date (datetime): Commit date of the log.
+
+            txt (str): Text of the log.
+
+        Return (dict): Parsed log details.
+
+        Note:
+        - Opn. Req. Test logs are not split into lines, but are scanned once in place w/o
+        intermediate copies of the log's text. Re-ran tests are re-captured within the OpnReqScanner.
+
+        """
+        opnreq_scanner = OpnReqScanner(txt)
+        if self.selection is not None:
+            opnreq_tests = opnreq_scanner.scan(lambda test: self.selection.accepts_test('Operation Requirement Test', pf, test))
+        else:
+            opnreq_tests = opnreq_scanner.scan()
+        reg_test = list(opnreq_tests)
+        unique_test_tries = {test: v["Tries"] for test, v in opnreq_tests.items()}
+
+        # Failed compares & wall time (s) of the re-ran & failed attempts per test (see FlakyIndex)
+        unique_test_failed_compares = {test: v["Failed_Compares"] for test, v in opnreq_tests.items() if v["Failed_Compares"]}
+        unique_test_failed_time = {test: v["Retried_Wall_Time"] + ((v["Wall_Time"] or 0) if v["Status"] != 'PASS' else 0)
+                                   for test, v in opnreq_tests.items()}
+
+        # Framework type parsed & extracted
+        framework_type = opnreq_scanner.header["Framework"]
+        overall_result = opnreq_scanner.header["Overall_Result"]
+
+        # Test Start/End Datetimes.
+        dtimes_performed = [opnreq_scanner.header["Start_Date"]]
+        dtimes_completed = [opnreq_scanner.header["End_Date"]]
+        tot_times = [re.sub("[^:0-9]", "", opnreq_scanner.header["Elapsed_Time"].split(': ')[1])]
+
+        # Baseline & working directories per test parsed & extracted
+        unique_test_bl = {test: v["Baseline_Dir"] for test, v in opnreq_tests.items()}
+        unique_test_work = {test: v["Working_Dir"] for test, v in opnreq_tests.items()}
+
+        # Test defined steps
+        unique_test_info = {test: opnreq_scanner.info(test) for test in opnreq_tests}
+
+        # Wall time (s) parsed & extracted
+        unique_test_time = {test: v["Wall_Time"] for test, v in opnreq_tests.items() if v["Wall_Time"] is not None}
+        
+        # Convert Wall time to mins to maintain time measurement units consistency with regression test logs
+        unique_test_time = {test: divmod(t, 60) for test, t in unique_test_time.items()}
+        unique_test_time = {test: datetime.strptime(str(int(elem[0]))+':'+str(round(elem[1], 6)), '%M:%S.%f').time() for test, elem in unique_test_time.items()}
+
+        # Maximum test size (Kb) parsed & extracted
+        unique_test_sz = {test: v["Max_RSS"] for test, v in opnreq_tests.items() if v["Max_RSS"] is not None}
+
+        # Compared & moved files per test per platform-to-compiler parsed & extracted
+        compare_d = {test: v["Compared_Files"] for test, v in opnreq_tests.items()}
+        mv_d = {test: v["Moved_Files"] for test, v in opnreq_tests.items()}
+        self.file_index.add_tests(pf, commit_date, compare_d, mv_d)
+            
+        # Convert start & end time per Opn Req. log to datetime
+        dtimes_performed = [datetime.strptime(elem, '%a %b  %d %H:%M:%S %Z %Y') for elem in dtimes_performed]
+        dtimes_completed = [datetime.strptime(elem, '%a %b  %d %H:%M:%S %Z %Y') for elem in dtimes_completed]
+        
+        # Convert total ("elapsed") time of the overall tests within Opn. Req. test log to datetime
+        tot_times = [datetime.strptime(elem, '%H:%M:%S').time() for elem in tot_times]
+
+        # Wall + Wait & Run times nulled as it is not applicable to the Opn. Req. Test logs
+        return {"Platform": pf,
+                "Tests_Performed_Date": dtimes_performed,
+                "Test_Framework_Type": framework_type.title(),
+                "Builds": [],
+                "Unique_Tests": reg_test,
+                "Unique_Test_Bl": unique_test_bl,
+                "Unique_Test_Work": unique_test_work,
+                "Unique_Test_Info": unique_test_info,
+                "Unique_Test_WallnWait_Time": dict(),
+                "Unique_Test_Run_Time": dict(),
+                "Unique_Test_Time": unique_test_time, # Referred to as "Total Wall Time"
+                "Unique_Test_Size": unique_test_sz, # Maximum resident set size (KB)
+                "Unique_Test_Tries": unique_test_tries,
+                "Unique_Test_Status": {test: v["Status"] for test, v in opnreq_tests.items()},
+                "Unique_Test_Failed_Compares": unique_test_failed_compares,
+                "Unique_Test_Failed_Time": unique_test_failed_time, # Wall time (s) of the failed attempts
+                "Compared_Files": compare_d,
+                "Moved_Files": mv_d,
+                "Overall_Tests_Result": overall_result,
+                "Tests_Completed_Date": dtimes_completed,
+                "Elapsed_Time": tot_times}
+
+    @timed_stage
     def map_metrics(self):
         """
         Maps out the metrics by platform & compiler
@@ -367,23 +713,70 @@ class LoadData():
         Return: None
 
         """
+        # Bounded-memory mode: Remaining test records spilled & dataframes assembled from chunks (see generate_df)
+        if self.record_spill is not None:
+            self.spill_records()
+            self.aggregates.save()
+            self.flaky_index.save()
+            self.wall_time_dict, self.test_sz_dict = None, None
+            self.wallnwait_time_dict, self.run_time_dict = None, None
+
+            return self.wall_time_dict, self.test_sz_dict
+
         # Generate Wall Time & Size Dfs per platform-compiler.
         self.wall_time_dict = {}
         self.test_sz_dict = {}
-        for (pf, commit_date), k2 in self.parsed_txt_dict.items():
-            for testname_time, t in k2["Unique_Test_Time"].items():
-                self.wall_time_dict[(k2["Test_Framework_Type"], pf, testname_time)] = t
-            for testname_sz, sz in k2["Unique_Test_Size"].items():
-                self.test_sz_dict[(k2["Test_Framework_Type"], pf, testname_sz)] = sz
+        for key, t in self.record_store.items('Wall_Time'):
+            self.wall_time_dict[key] = sec_to_time(t)
+        for key, sz in self.record_store.items('Max_RSS'):
+            self.test_sz_dict[key] = sz
+
+        # Wall + Wait & Run time components (s) per platform-compiler (Regression Test logs only)
+        self.wallnwait_time_dict = dict(self.record_store.items('WallnWait_Time'))
+        self.run_time_dict = dict(self.record_store.items('Run_Time'))
+
+        # Update & persist summary statistics w/ the newly ingested runs
+        self.aggregates.update(self.record_store)
+        self.aggregates.save()
+
+        # Persist the flaky test index counted while preprocessing
+        self.flaky_index.save()
+
+        # Append test metrics to history
+        self.history_db.ingest(self.record_store)
+
+        # Update exported latest test metrics
+        self.metrics_exporter.update(self.record_store)
 
         return self.wall_time_dict, self.test_sz_dict
 
-    def generate_df(self):
+    def spill_records(self):
+        """
+        Aggregate, append to history & spill the in-memory test records to disk (bounded-memory mode).
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        self.aggregates.update(self.record_store)
+        self.history_db.ingest(self.record_store)
+        self.metrics_exporter.update(self.record_store)
+        self.record_spill.append(self.record_store)
+        self.record_store = TestRecordStore()
+
+        return
+
+    @timed_stage
+    def generate_df(self, save=True):
         """
         Generates dataframe of the log metrics by framework type, compiler, & platform.
 
         Args:
-             None
+             save (bool): If True, the dataframes are saved as the snapshot of all relevant logs.
+                          Set to False when only a subset of the logs was ingested (e.g. a commit's
+                          changed logs) & merge them into the snapshot (see merge_into_pkl).
             
         Return (pd.DataFrame, pd.DataFrame): Dataframes of the wall time & test size
         metrics featured across all relevant UFS-WM log files.
@@ -395,7 +788,10 @@ class LoadData():
 
         """
         # Wall Time dataframe w/ Wall Time ascending
-        self.wall_time_df = pd.Series(self.wall_time_dict).reset_index()
+        if self.record_spill is not None:
+            self.wall_time_df = self.record_spill.frame('Wall_Time', 'Wall Time (HH:MM:SS)', sec_to_time)
+        else:
+            self.wall_time_df = pd.Series(self.wall_time_dict).reset_index()
         self.wall_time_df.columns = ['Test_Framework_Type', 'Filename_Description', 'Test_Description', 'Wall Time (HH:MM:SS)']
         self.wall_time_df = self.wall_time_df.sort_values('Wall Time (HH:MM:SS)').reset_index(drop=True)
 
@@ -420,8 +816,24 @@ class LoadData():
         # Convert to datetime to minutes
         self.wall_time_df['Wall Time (min)'] = self.wall_time_df['Wall Time (HH:MM:SS)'].apply(lambda t: (t.hour * 60) + t.minute + (t.second/60) + ((t.microsecond)/((10**6)*60)))
 
+        # Wall + Wait & Run time components (min) & the derived queue wait of the Regression Test logs' "[wall+wait, run]" times.
+        # Note: Components are null for the Operation Req. Test logs, as they only feature the wall time.
+        key_cols = ['Test_Framework_Type', 'Filename_Description', 'Test_Description']
+        for num_col, time_dict in (('WallnWait_Time', self.wallnwait_time_dict), ('Run_Time', self.run_time_dict)):
+            if self.record_spill is not None:
+                part_df = self.record_spill.frame(num_col, num_col)
+            else:
+                part_df = pd.DataFrame([key + (sec,) for key, sec in time_dict.items()], columns=key_cols + [num_col])
+            self.wall_time_df = self.wall_time_df.merge(part_df.astype({num_col: float}), on=key_cols, how='left')
+        self.wall_time_df['Wall + Wait Time (min)'] = self.wall_time_df.pop('WallnWait_Time')/60
+        self.wall_time_df['Run Time (min)'] = self.wall_time_df.pop('Run_Time')/60
+        self.wall_time_df['Queue Wait Time (min)'] = (self.wall_time_df['Wall + Wait Time (min)'] - self.wall_time_df['Run Time (min)']).clip(lower=0)
+
         # Max Resident Size dataframe w/ Max Resident Set Size (KB) ascending
-        self.test_sz_df = pd.Series(self.test_sz_dict).reset_index()
+        if self.record_spill is not None:
+            self.test_sz_df = self.record_spill.frame('Max_RSS', 'Max Resident Set Size (bytes)')
+        else:
+            self.test_sz_df = pd.Series(self.test_sz_dict).reset_index()
         self.test_sz_df.columns = ['Test_Framework_Type', 'Filename_Description', 'Test_Description', 'Max Resident Set Size (bytes)']
         self.test_sz_df = self.test_sz_df.sort_values('Max Resident Set Size (bytes)').reset_index(drop=True)
 
@@ -448,11 +860,13 @@ class LoadData():
         test_sz_scaled2mb = 2**20
         self.test_sz_df['Max Resident Set Size (MB)'] = self.test_sz_df['Max Resident Set Size (bytes)'].apply(lambda x: x/(test_sz_scaled2mb))
         
-        self.save_as_pkl(self.wall_time_df, "wall_time_df")
-        self.save_as_pkl(self.test_sz_df, "test_sz_df")
+        if save:
+            self.save_as_pkl(self.wall_time_df, "wall_time_df")
+            self.save_as_pkl(self.test_sz_df, "test_sz_df")
 
         return self.wall_time_df, self.test_sz_df
 
+    @timed_stage
     def generate_pivot_df(self, df, independent_feature_name):
         """
         Generate the pivot tables.
@@ -471,43 +885,128 @@ class LoadData():
         Return (pd.DataFrame): Pivot dataframe of either the wall time &
         test size metrics featured across all relevant UFS-WM test logs.
 
+        Note:
+        - Dense view of the sparse pivot (see generate_sparse_pivot), where the
+        Operation Req. Test logs' compiler is empty as it is no longer declared within test status.
+
         """
-        # Pivoted features
-        indep_feat_dict = defaultdict(dict)
-        test_type = defaultdict(dict)
-        for test in set(df['Test']):
-            for idx, row in df.iterrows():
-                if row['Test'] == test:
-                    indep_feat_dict[test][row['Platform_Compiler']] = row[independent_feature_name]
-                    test_type[row['Platform_Compiler']] = row['Test_Framework_Type']
-        df = pd.DataFrame.from_dict(indep_feat_dict)
-        df.index.name, df.columns.name = 'pf_2_comp', 'test'
-        
-        # Generate & append test frequency as new feature
-        df['freq'] = df.count(axis='columns')
-        df = df.sort_values(by='freq',
-                            axis=0, 
-                            ascending=False)
-        df.insert(0, 'freq', df.pop('freq'))
-        df = pd.DataFrame(pd.Series(test_type)).join(df)
-        df.rename(columns={df.columns[0]: "Test_Framework_Type" }, inplace=True)
-        df.rename(columns={'freq': 'Number of Tests'}, inplace=True)
-
-        for idx, row in df.T.items():
-            # Applies to only the Regression test logs because the Operaion Req. Test logs no longer declares 
-            # compiler within test status
-            if ' + ' in idx:
-                df.loc[idx,'Platform']=idx.split(' + ')[0]
-                df.loc[idx,'Compiler']=idx.split(' + ')[-1]
-            else:
-                df.loc[idx,'Platform'] = idx
-                df.loc[idx,'Compiler'] = ''
+        df = SparsePivot.from_dfs({independent_feature_name: df}).dense(independent_feature_name)
 
         print(f'{independent_feature_name} pivot table:\n', df)
         self.save_as_pkl(df, f"{independent_feature_name}_pivot_df")
         
         return df
 
+    @timed_stage
+    def generate_sparse_pivot(self, wall_time_df, test_sz_df):
+        """
+        Generate the sparse pivot of all metrics, from which the dense pivot tables
+        are produced on demand (e.g. pivot.dense('Max Resident Set Size (MB)')).
+
+        Args:
+             wall_time_df (pd.DataFrame): Dataframe of the wall time metrics.
+
+             test_sz_df (pd.DataFrame): Dataframe of the test size metrics.
+
+        Return (SparsePivot): Sparse pivot of the wall time (& its wall + wait, run & queue wait
+        components) & test size metrics featured across all relevant UFS-WM test logs.
+
+        """
+        pivot = SparsePivot.from_dfs({'Wall Time (min)': wall_time_df,
+                                      'Wall + Wait Time (min)': wall_time_df,
+                                      'Run Time (min)': wall_time_df,
+                                      'Queue Wait Time (min)': wall_time_df,
+                                      'Max Resident Set Size (MB)': test_sz_df})
+        pivot.save("dataframes/sparse_pivot.pkl")
+
+        return pivot
+
+    @timed_stage
+    def generate_queue_wait_df(self, wall_time_df):
+        """
+        Distribution of the queue wait per platform-to-compiler, aggregated over all
+        tests at once (i.e. w/o iterating over platforms).
+
+        Args:
+             wall_time_df (pd.DataFrame): Dataframe of the wall time metrics (see generate_df).
+
+        Return (pd.DataFrame): Number of tests, total wall + wait, run & queue wait times (min),
+        queue wait share of the wall + wait time (%) & queue wait quantiles (min) per platform
+        & compiler, longest total queue wait first.
+
+        Note:
+        - Only the Regression Test logs feature the wall + wait & run times per test.
+
+        """
+        df = wall_time_df.dropna(subset=['Wall + Wait Time (min)', 'Run Time (min)'])
+        grouped = df.groupby(['Platform', 'Compiler'])
+        queue_wait_df = grouped.agg(**{'Number of Tests': ('Queue Wait Time (min)', 'size'),
+                                       'Total Wall + Wait Time (min)': ('Wall + Wait Time (min)', 'sum'),
+                                       'Total Run Time (min)': ('Run Time (min)', 'sum'),
+                                       'Total Queue Wait Time (min)': ('Queue Wait Time (min)', 'sum'),
+                                       'Mean Queue Wait Time (min)': ('Queue Wait Time (min)', 'mean'),
+                                       'Max Queue Wait Time (min)': ('Queue Wait Time (min)', 'max')})
+        quantiles_df = grouped['Queue Wait Time (min)'].quantile([0.5, 0.9, 0.95]).unstack()
+        quantiles_df.columns = ['Median Queue Wait Time (min)', 'P90 Queue Wait Time (min)', 'P95 Queue Wait Time (min)']
+        queue_wait_df = queue_wait_df.join(quantiles_df)
+        queue_wait_df['Queue Wait Share (%)'] = 100*queue_wait_df['Total Queue Wait Time (min)']/queue_wait_df['Total Wall + Wait Time (min)'].where(queue_wait_df['Total Wall + Wait Time (min)'] > 0)
+        queue_wait_df = queue_wait_df.sort_values('Total Queue Wait Time (min)', ascending=False)
+
+        print('Queue wait per platform-to-compiler:\n', queue_wait_df)
+        self.save_as_pkl(queue_wait_df, "queue_wait_df")
+
+        return queue_wait_df
+
+    @timed_stage
+    def generate_speed_df(self, pivot):
+        """
+        Fit the cross-platform speed model on the run times (i.e. w/o the queue wait).
+
+        Args:
+             pivot (SparsePivot): Sparse pivot of all metrics (see generate_sparse_pivot).
+
+        Return (pd.DataFrame, SpeedModel): Run time factor (> 1 is slower), number of tests, platform &
+        compiler per platform-to-compiler, fastest first, & the fitted model (e.g. to predict the run
+        times of the tests not yet performed per platform-to-compiler).
+
+        Note:
+        - Only the Regression Test logs feature the run time per test.
+
+        """
+        run_time_pivot_df = pivot.dense('Run Time (min)')
+        speed_model = SpeedModel().fit(run_time_pivot_df)
+        speed_df = speed_model.speed_factors().to_frame().join(run_time_pivot_df[['Number of Tests', 'Platform', 'Compiler']])
+
+        print('Run time factor per platform-to-compiler:\n', speed_df)
+        self.save_as_pkl(speed_df, "speed_factor_df")
+        self.save_as_pkl(speed_model.test_costs().to_frame(), "test_cost_df")
+
+        return speed_df, speed_model
+
+    def merge_into_pkl(self, df, fn, sort_col):
+        """
+        Merge the rows of newly ingested logs into a saved dataframe, where the rows of the
+        same tests (framework, platform, compiler & test) are replaced & all other rows are kept.
+
+        Args:
+             df (pd.DataFrame): Dataframe of the newly ingested logs (see generate_df).
+
+             fn (str): Filename of the saved pickle file (e.g. "wall_time_df").
+
+             sort_col (str): Column the saved dataframe is ordered by.
+
+        Return (pd.DataFrame): Merged dataframe.
+
+        """
+        key_cols = ['Test_Framework_Type', 'Filename_Description', 'Test_Description']
+        pkl_path = f"dataframes/{fn}.pkl"
+        if os.path.exists(pkl_path):
+            df = pd.concat([pd.read_pickle(pkl_path), df], ignore_index=True).drop_duplicates(subset=key_cols, keep='last')
+        df = df.sort_values(sort_col, kind='stable').reset_index(drop=True)
+        self.save_as_pkl(df, fn)
+
+        return df
+
     def save_as_pkl(self, df, fn):
         """
         Save dataframe as pickle file.
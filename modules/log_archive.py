@@ -0,0 +1,331 @@
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime
+import zstandard
+
+# Schema of the log archive
+_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dictionaries (dict_id INTEGER PRIMARY KEY, data BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS blobs (
+    blob_id INTEGER PRIMARY KEY,
+    digest TEXT UNIQUE NOT NULL,
+    dict_id INTEGER REFERENCES dictionaries(dict_id),
+    ref_blob_id INTEGER REFERENCES blobs(blob_id),
+    raw_size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS logs (
+    commit_sha TEXT NOT NULL,
+    log_fn TEXT NOT NULL,
+    commit_date TEXT NOT NULL,
+    blob_id INTEGER NOT NULL REFERENCES blobs(blob_id),
+    UNIQUE (commit_sha, log_fn)
+);
+CREATE INDEX IF NOT EXISTS idx_logs_date ON logs (commit_date);
+CREATE INDEX IF NOT EXISTS idx_logs_fn_date ON logs (log_fn, commit_date);
+"""
+
+
+class LogArchive():
+    """
+    Archive of the raw UFS-WM logs ingested, compressed w/ zstd.
+
+    Each distinct log text is stored once as a blob within an embedded SQLite container
+    indexed by (commit hash, log filename), such that any log is read w/o decompressing
+    the rest of the archive:
+    - Keyframes are compressed w/ a shared dictionary trained on the logs themselves
+    (i.e. the text repeated across platforms & log formats), unless the dictionary
+    costs more than it saves.
+    - Later versions of a log are compressed against the log's latest keyframe
+    (i.e. the text repeated across commits), thus are read w/ at most two decompressions.
+
+    """
+    def __init__(self, archive_path="dataframes/log_archive.db", level=9, dict_size=2**17, min_samples=8, max_delta_ratio=0.5):
+        """
+        Args:
+            archive_path (str): SQLite file of the archive. Created if it does not exist.
+
+            level (int): zstd compression level.
+
+            dict_size (int): Maximum size of the trained dictionary (bytes). The dictionary is
+                             sized to the samples it is trained on, up to this size.
+
+            min_samples (int): Minimum number of distinct logs (archived keyframes & new logs,
+                               across calls) to train the dictionary on. Logs archived before
+                               the dictionary is trained are compressed w/o dictionary.
+
+            max_delta_ratio (float): A log is stored as a new keyframe once its compression
+                                     against the latest keyframe exceeds this ratio of its
+                                     compression as a keyframe.
+
+        """
+        self.archive_path = archive_path
+        self.level = level
+        self.dict_size = dict_size
+        self.min_samples = min_samples
+        self.max_delta_ratio = max_delta_ratio
+        self.conn = sqlite3.connect(self.archive_path)
+        self.conn.executescript(_ARCHIVE_SCHEMA)
+
+        # Latest trained dictionary & the decompressors per dictionary
+        row = self.conn.execute("SELECT dict_id, data FROM dictionaries ORDER BY dict_id DESC LIMIT 1").fetchone()
+        self.dict_id, self.compressor = None, zstandard.ZstdCompressor(level=self.level)
+        if row is not None:
+            self._use_dict(*row)
+        self.decompressors = {None: zstandard.ZstdDecompressor()}
+
+        # Latest keyframe (blob id) per log filename & recently decompressed keyframes
+        self.keyframes = {}
+        self.keyframe_cache = OrderedDict()
+
+        # Number of samples of the last dictionary which did not pay for itself (retrained once doubled)
+        self.n_unpaid_samples = 0
+
+    def close(self):
+        self.conn.close()
+
+    def _use_dict(self, dict_id, data):
+        self.dict_id = dict_id
+        self.compressor = zstandard.ZstdCompressor(level=self.level, dict_data=zstandard.ZstdCompressionDict(data))
+
+    def _decompressor(self, dict_id):
+        if dict_id not in self.decompressors:
+            data = self.conn.execute("SELECT data FROM dictionaries WHERE dict_id = ?", (dict_id,)).fetchone()[0]
+            self.decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=zstandard.ZstdCompressionDict(data))
+
+        return self.decompressors[dict_id]
+
+    def _keyframe(self, blob_id):
+        """
+        Args:
+            blob_id (int): Id of the keyframe.
+
+        Return (bytes): Raw text of the keyframe.
+
+        """
+        raw = self.keyframe_cache.get(blob_id)
+        if raw is None:
+            dict_id, data = self.conn.execute("SELECT dict_id, data FROM blobs WHERE blob_id = ?", (blob_id,)).fetchone()
+            raw = self.keyframe_cache[blob_id] = self._decompressor(dict_id).decompress(data)
+            if len(self.keyframe_cache) > 64:
+                self.keyframe_cache.popitem(last=False)
+        self.keyframe_cache.move_to_end(blob_id)
+
+        return raw
+
+    def _latest_keyframe(self, log_fn):
+        """
+        Args:
+            log_fn (str): Log filename.
+
+        Return (int): Id of the log's latest keyframe. None if the log is not archived.
+
+        """
+        if log_fn not in self.keyframes:
+            row = self.conn.execute("SELECT b.blob_id FROM logs l JOIN blobs b ON b.blob_id = l.blob_id "
+                                    "WHERE l.log_fn = ? AND b.ref_blob_id IS NULL ORDER BY l.commit_date DESC LIMIT 1", (log_fn,)).fetchone()
+            self.keyframes[log_fn] = row[0] if row is not None else None
+
+        return self.keyframes[log_fn]
+
+    def _decompress(self, dict_id, ref_blob_id, data):
+        if ref_blob_id is None:
+            return self._decompressor(dict_id).decompress(data)
+        ref_dict = zstandard.ZstdCompressionDict(self._keyframe(ref_blob_id), dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+
+        return zstandard.ZstdDecompressor(dict_data=ref_dict).decompress(data)
+
+    def train(self, samples):
+        """
+        Train a dictionary on sample logs (e.g. when the log formats change). Keyframes archived
+        afterwards are compressed w/ the new dictionary, previously archived logs are
+        still read w/ their own dictionary.
+
+        Args:
+            samples (list): Texts of the sample logs.
+
+        Return (int): Id of the dictionary. None if the dictionary does not pay for itself, i.e. the
+        samples compressed w/ the dictionary & the dictionary exceed the samples compressed w/o it.
+
+        Note:
+        - The dictionary is sized to ~5% of the samples (at least 4 KB), up to dict_size.
+
+        """
+        raws = [txt.encode() for txt in samples]
+        dict_size = min(self.dict_size, max(2**12, sum(len(raw) for raw in raws)//20))
+        try:
+            zstd_dict = zstandard.train_dictionary(dict_size, raws, level=self.level)
+        except zstandard.ZstdError:
+            return None
+        dict_compressor = zstandard.ZstdCompressor(level=self.level, dict_data=zstd_dict)
+        plain_compressor = zstandard.ZstdCompressor(level=self.level)
+        dict_bytes = len(zstd_dict.as_bytes()) + sum(len(dict_compressor.compress(raw)) for raw in raws)
+        if dict_bytes >= sum(len(plain_compressor.compress(raw)) for raw in raws):
+            return None
+
+        with self.conn:
+            dict_id = self.conn.execute("INSERT INTO dictionaries (data) VALUES (?)", (zstd_dict.as_bytes(),)).lastrowid
+        self._use_dict(dict_id, zstd_dict.as_bytes())
+
+        return dict_id
+
+    def _train_on_archive(self, new_raws):
+        """
+        Train the dictionary on the archived keyframes & the new logs once they feature at least
+        min_samples logs. A dictionary which did not pay for itself is retried once the
+        number of samples doubled.
+
+        Args:
+            new_raws (list): Raw text (bytes) of the logs to archive.
+
+        Return: None
+
+        """
+        n_keyframes = self.conn.execute("SELECT COUNT(*) FROM blobs WHERE ref_blob_id IS NULL").fetchone()[0]
+        if n_keyframes + len(new_raws) < max(self.min_samples, 2*self.n_unpaid_samples):
+            return
+        keyframe_ids = [blob_id for (blob_id,) in self.conn.execute("SELECT blob_id FROM blobs WHERE ref_blob_id IS NULL "
+                                                                    "ORDER BY blob_id DESC LIMIT 256")]
+        samples = [self._keyframe(blob_id).decode() for blob_id in keyframe_ids] + [raw.decode() for raw in new_raws]
+        if self.train(samples) is None:
+            self.n_unpaid_samples = len(samples)
+
+        return
+
+    def add_many(self, logs):
+        """
+        Archive logs within a single transaction. Logs already archived for the same commit &
+        filename are ignored.
+
+        Args:
+            logs (iterable): (Commit hash, log filename, commit date, text) per log, ordered by commit date.
+
+        Return (int): Number of new blobs (i.e. distinct log texts) archived.
+
+        Note:
+        - The dictionary is trained once the archived keyframes & new logs feature at least
+        min_samples distinct logs, whether they are archived at once or across calls (e.g. one
+        at a time in bounded-memory mode).
+
+        """
+        new_blobs, entries = {}, []
+        for commit_sha, log_fn, commit_date, txt in logs:
+            raw = txt.encode()
+            digest = hashlib.sha1(raw).hexdigest()
+            entries.append((commit_sha, log_fn, str(commit_date), digest))
+            if digest not in new_blobs and self.conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone() is None:
+                new_blobs[digest] = (log_fn, raw)
+        if self.dict_id is None and new_blobs:
+            self._train_on_archive([raw for _, raw in new_blobs.values()])
+
+        with self.conn:
+            for digest, (log_fn, raw) in new_blobs.items():
+                data, ref_blob_id = self.compressor.compress(raw), None
+
+                # Compressed against the log's latest keyframe, unless the log changed too much
+                keyframe_id = self._latest_keyframe(log_fn)
+                if keyframe_id is not None:
+                    ref_dict = zstandard.ZstdCompressionDict(self._keyframe(keyframe_id), dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+                    delta = zstandard.ZstdCompressor(level=self.level, dict_data=ref_dict).compress(raw)
+                    if len(delta) <= self.max_delta_ratio*len(data):
+                        data, ref_blob_id = delta, keyframe_id
+                blob_id = self.conn.execute("INSERT INTO blobs (digest, dict_id, ref_blob_id, raw_size, data) VALUES (?, ?, ?, ?, ?)",
+                                            (digest, self.dict_id if ref_blob_id is None else None, ref_blob_id, len(raw), data)).lastrowid
+                if ref_blob_id is None:
+                    self.keyframes[log_fn] = blob_id
+            self.conn.executemany("INSERT OR IGNORE INTO logs (commit_sha, log_fn, commit_date, blob_id) "
+                                  "SELECT ?, ?, ?, blob_id FROM blobs WHERE digest = ?", entries)
+
+        return len(new_blobs)
+
+    def add(self, commit_sha, log_fn, commit_date, txt):
+        """
+        Args:
+            commit_sha (str): Commit hash of the log.
+
+            log_fn (str): Log filename.
+
+            commit_date (datetime): Commit date of the log.
+
+            txt (str): Text of the log.
+
+        Return (int): Number of new blobs archived (0 if the text was already archived).
+
+        """
+        return self.add_many([(commit_sha, log_fn, commit_date, txt)])
+
+    def get(self, commit_sha, log_fn):
+        """
+        Args:
+            commit_sha (str): Commit hash of the log.
+
+            log_fn (str): Log filename.
+
+        Return (str): Text of the log. None if it is not archived.
+
+        """
+        row = self.conn.execute("SELECT b.dict_id, b.ref_blob_id, b.data FROM logs l JOIN blobs b ON b.blob_id = l.blob_id "
+                                "WHERE l.commit_sha = ? AND l.log_fn = ?", (commit_sha, log_fn)).fetchone()
+        if row is None:
+            return None
+
+        return self._decompress(*row).decode()
+
+    def log_fns(self):
+        """
+        Return (list): Filenames of the archived logs.
+
+        """
+        return [log_fn for (log_fn,) in self.conn.execute("SELECT DISTINCT log_fn FROM logs ORDER BY log_fn")]
+
+    def corpus(self, commit_sha=None, start_date=None, end_date=None, log_fns=None):
+        """
+        Archived logs keyed as LoadData.log_files_corpus, such that they are preprocessed
+        w/o the UFS-WM repository.
+
+        Args:
+            commit_sha (str): [Optional] Commit hash of the logs.
+
+            start_date (str): [Optional] Earliest commit date (e.g. '2024-01-01').
+
+            end_date (str): [Optional] Latest commit date (exclusive).
+
+            log_fns (list): [Optional] Log filenames.
+
+        Return (dict): Text per (log filename, commit date), ordered by commit date.
+
+        """
+        where, params = [], []
+        if commit_sha is not None:
+            where.append("l.commit_sha = ?")
+            params.append(commit_sha)
+        if start_date is not None:
+            where.append("l.commit_date >= ?")
+            params.append(str(start_date))
+        if end_date is not None:
+            where.append("l.commit_date < ?")
+            params.append(str(end_date))
+        if log_fns is not None:
+            where.append(f"l.log_fn IN ({', '.join('?'*len(log_fns))})")
+            params.extend(log_fns)
+        query = "SELECT l.log_fn, l.commit_date, b.dict_id, b.ref_blob_id, b.data FROM logs l JOIN blobs b ON b.blob_id = l.blob_id"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+
+        return {(log_fn, datetime.fromisoformat(commit_date)): self._decompress(dict_id, ref_blob_id, data).decode()
+                for log_fn, commit_date, dict_id, ref_blob_id, data in self.conn.execute(query + " ORDER BY l.commit_date, l.log_fn", params)}
+
+    def stats(self):
+        """
+        Return (dict): Number of archived logs, blobs & keyframes, raw size & compressed size (bytes).
+
+        """
+        n_logs = self.conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+        n_blobs, n_keyframes, raw_size, compressed_size = self.conn.execute("SELECT COUNT(*), COUNT(*) - COUNT(ref_blob_id), "
+                                                                            "COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(data)), 0) "
+                                                                            "FROM blobs").fetchone()
+        dict_size = self.conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM dictionaries").fetchone()[0]
+
+        return {'logs': n_logs, 'blobs': n_blobs, 'keyframes': n_keyframes,
+                'raw_bytes': raw_size, 'compressed_bytes': compressed_size + dict_size}
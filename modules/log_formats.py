@@ -0,0 +1,163 @@
+def sniff_rt_022024(head):
+    """
+    Regression Test logs (as of 02/2024), starting w/ e.g. '====START OF HERA REGRESSION TESTING LOG===='.
+
+    Args:
+        head (str): Head of the log.
+
+    Return (bool): True if the log is of the format.
+
+    """
+    first_line = head.split('\n', 1)[0]
+
+    return first_line.startswith('====START OF ') and first_line.endswith(' REGRESSION TESTING LOG====')
+
+
+def sniff_opnreq_122021(head):
+    """
+    Operation Requirement Test logs (as of 12/2021), starting w/ the date & 'Start Operation Requirement Test'.
+
+    Args:
+        head (str): Head of the log.
+
+    Return (bool): True if the log is of the format.
+
+    """
+    lines = head.split('\n', 2)
+
+    return len(lines) > 1 and lines[1] == 'Start Operation Requirement Test'
+
+
+class LogFormatRegistry():
+    """
+    Registry of the versioned UFS-WM log formats.
+
+    Each format version registers the filenames of its logs, a sniffer, which identifies
+    the format from only the head of a log, & the parser specialized for the version. A log
+    is sniffed once & routed to its parser, where logs of an unknown format are skipped w/o
+    being parsed.
+
+    """
+    def __init__(self, sniff_bytes=512):
+        """
+        Args:
+            sniff_bytes (int): Number of leading characters (or bytes) of a log passed to the sniffers.
+
+        """
+        self.sniff_bytes = sniff_bytes
+        self.formats = []
+
+    def register(self, framework, version, sniffer, parser, filename_prefix, stale_patterns=()):
+        """
+        Register a log format version. Sniffers are tried in order of registration,
+        such that the most frequent formats are to be registered first.
+
+        Args:
+            framework (str): Test framework type of the logs (e.g. 'Regression Testing').
+
+            version (str): Date from which the format is in use (e.g. '02/2024').
+
+            sniffer (function): Function of the log's head returning True if the log is of the format.
+
+            parser (function): Function parsing the log (see LoadData.preprocess).
+
+            filename_prefix (str): Prefix of the log filenames (e.g. 'RegressionTests_').
+
+            stale_patterns (tuple): Patterns of the log filenames still residing within the UFS-WM logs directory,
+                                    but no longer in use (e.g. 'intel' for the logs saved w/ the compiler's name).
+
+        Return: None
+
+        """
+        self.formats.append((framework, version, sniffer, parser, filename_prefix, tuple(stale_patterns)))
+
+        return
+
+    def sniff(self, head):
+        """
+        Args:
+            head (str): Head of the log.
+
+        Return (tuple): (Framework, version) of the format. None if the format is unknown.
+
+        """
+        head = head[:self.sniff_bytes]
+        for framework, version, sniffer, *_ in self.formats:
+            if sniffer(head):
+                return framework, version
+
+        return None
+
+    def sniff_file(self, log_path):
+        """
+        Sniff the format of a log on disk, where only the head of the log is read.
+
+        Args:
+            log_path (str): Path to the log file.
+
+        Return (tuple): (Framework, version) of the format. None if the format is unknown.
+
+        """
+        with open(log_path, 'rb') as f:
+            head = f.read(self.sniff_bytes)
+
+        return self.sniff(head.decode(errors='replace'))
+
+    def sniff_blob(self, blob):
+        """
+        Sniff the format of a log committed to the repo, where only the head of the blob is read.
+
+        Args:
+            blob (git.Blob): Blob of the log at a commit.
+
+        Return (tuple): (Framework, version) of the format. None if the format is unknown.
+
+        """
+        head = blob.data_stream.read(self.sniff_bytes)
+
+        return self.sniff(head.decode(errors='replace'))
+
+    def parser(self, log_format):
+        """
+        Args:
+            log_format (tuple): (Framework, version) of the format (see sniff).
+
+        Return (function): Parser of the format. None if the format is unknown.
+
+        """
+        for framework, version, _, parser, *_ in self.formats:
+            if (framework, version) == log_format:
+                return parser
+
+        return None
+
+    def route(self, txt, log_format=None):
+        """
+        Args:
+            txt (str): Text of the log.
+
+            log_format (tuple): [Optional] (Framework, version) of the format, if already sniffed (e.g. from the
+                                log's blob). Default: Sniffed from the log's head.
+
+        Return (tuple, function): (Framework, version) of the format & its parser.
+        (None, None) if the format is unknown.
+
+        """
+        if log_format is None:
+            log_format = self.sniff(txt)
+        parser = self.parser(log_format) if log_format is not None else None
+        if parser is None:
+            return None, None
+
+        return log_format, parser
+
+    def is_log_filename(self, log_fn):
+        """
+        Args:
+            log_fn (str): Log filename.
+
+        Return (bool): True if the file is a log of a registered format in use (e.g. not a stale log).
+
+        """
+        return '.log' in log_fn and any(log_fn.startswith(filename_prefix) and not any(pattern in log_fn for pattern in stale_patterns)
+                                        for *_, filename_prefix, stale_patterns in self.formats)
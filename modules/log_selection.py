@@ -0,0 +1,95 @@
+from fnmatch import fnmatchcase
+from record_store import split_test
+
+# Test framework type per log filename prefix
+_FRAMEWORK_PREFIXES = {'RegressionTests': 'Regression Testing',
+                       'OpnReqTests': 'Operation Requirement Test'}
+
+
+class LogSelection():
+    """
+    Selection predicates on the platforms, compilers, test framework types & tests, applied
+    at the earliest stage of loading: Logs of unselected platforms or framework types are never
+    read & the status lines of unselected tests are skipped before their fields are converted.
+
+    """
+    def __init__(self, platforms=None, compilers=None, frameworks=None, tests=None):
+        """
+        Args:
+            platforms (list): [Optional] Platforms to select (e.g. ['Hera', 'Derecho']). Case insensitive.
+
+            compilers (list): [Optional] Compilers to select (e.g. ['intel']). Operation Req. Test
+                              logs do not declare compiler, thus are not selected w/ compilers.
+
+            frameworks (list): [Optional] Test framework types to select (e.g. ['Regression Testing']).
+
+            tests (list): [Optional] Patterns of the test names to select (e.g. ['cpld_*', '*_p8']). Case insensitive.
+
+        """
+        self.platforms = {pf.lower() for pf in platforms} if platforms is not None else None
+        self.compilers = {comp.lower() for comp in compilers} if compilers is not None else None
+        self.frameworks = set(frameworks) if frameworks is not None else None
+        self.tests = [pattern.lower() for pattern in tests] if tests is not None else None
+
+    @staticmethod
+    def filename_desc(log_fn):
+        """
+        Args:
+            log_fn (str): Log filename.
+
+        Return (str): Description parsed from the log's filename, as within LoadData.preprocess (e.g. 'Control_P8_Hera').
+
+        """
+        return log_fn.split(".")[:-1][0].split("_", 1)[1].title()
+
+    def accepts_log(self, log_fn, framework=None):
+        """
+        Predicate on a log prior to reading it.
+
+        Args:
+            log_fn (str): Log filename.
+
+            framework (str): [Optional] Test framework type of the log. Default: Derived from the log's filename.
+
+        Return (bool): False if none of the log's tests could be selected.
+
+        """
+        if framework is None:
+            framework = _FRAMEWORK_PREFIXES.get(log_fn.split('_', 1)[0])
+        if framework is None:
+            return True
+        if self.frameworks is not None and framework not in self.frameworks:
+            return False
+        if self.compilers is not None and framework != 'Regression Testing':
+            return False
+        if self.platforms is not None:
+            platform, _, _ = split_test(framework, self.filename_desc(log_fn), '')
+            return platform.lower() in self.platforms
+
+        return True
+
+    def accepts_test(self, framework, filename_desc, test_desc):
+        """
+        Predicate on a test prior to converting its fields.
+
+        Args:
+            framework (str): Test framework type (e.g. 'Regression Testing').
+
+            filename_desc (str): Description parsed from the log's filename (e.g. 'Hera', 'Control_P8_Hera').
+
+            test_desc (str): Test described within the log (e.g. 'control_p8_intel', 'bit_base').
+
+        Return (bool): True if the test is selected.
+
+        """
+        if self.frameworks is not None and framework not in self.frameworks:
+            return False
+        platform, test, compiler = split_test(framework, filename_desc, test_desc)
+        if self.platforms is not None and platform.lower() not in self.platforms:
+            return False
+        if self.compilers is not None and compiler.lower() not in self.compilers:
+            return False
+        if self.tests is not None and not any(fnmatchcase(test.lower(), pattern) for pattern in self.tests):
+            return False
+
+        return True
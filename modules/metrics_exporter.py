@@ -0,0 +1,222 @@
+import os
+import math
+import time
+import functools
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Gauges per test series: (metric name, unit, help, index of value within series)
+_TEST_GAUGES = (('ufs_wm_test_wall_time_seconds', 'seconds', 'Wall time of the latest run of the test.', 1),
+                ('ufs_wm_test_max_rss_bytes', 'bytes', 'Maximum resident set size of the latest run of the test.', 2),
+                ('ufs_wm_test_tries', '', 'Number of attempts of the latest run of the test.', 3),
+                ('ufs_wm_test_passed', '', 'Status of the latest run of the test (1 if PASS).', 4),
+                ('ufs_wm_test_commit_timestamp_seconds', 'seconds', 'Commit date of the log of the latest run of the test.', 5))
+
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+
+def escape_label(val):
+    """
+    Args:
+        val (str): Label value.
+
+    Return (str): Label value escaped as per the OpenMetrics text format.
+
+    """
+    return val.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def timed_stage(method):
+    """
+    Decorator timing a stage of the LoadData pipeline. The duration & failures of the stage
+    are recorded within the metrics exporter & the textfile is updated.
+
+    Args:
+        method (function): LoadData method (e.g. preprocess).
+
+    Return (function): Timed method.
+
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        exporter, stage = self.metrics_exporter, method.__name__
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        except Exception:
+            exporter.stage_failures[stage] = exporter.stage_failures.get(stage, 0) + 1
+            raise
+        finally:
+            exporter.stage_secs[stage] = time.perf_counter() - start
+            exporter.write_textfile()
+
+    return wrapper
+
+
+class MetricsExporter():
+    """
+    OpenMetrics exporter of the latest test metrics per platform, compiler & test & of
+    the pipeline's own timing per stage.
+
+    Series are exported as a node-exporter textfile (Prometheus text format) &/or from a
+    local HTTP endpoint (OpenMetrics text format).
+    Labels of each series are rendered once & cached. The commit of a run is exported
+    as a value rather than a label, such that the number of series is bounded by
+    the number of (framework, platform, compiler, test).
+
+    """
+    def __init__(self, textfile_path="dataframes/ufs_wm_metrics.prom"):
+        """
+        Args:
+            textfile_path (str): [Optional] Textfile to write the metrics to (e.g. within
+                                 the node-exporter's textfile directory). If None,
+                                 no textfile is written.
+
+        """
+        self.textfile_path = textfile_path
+
+        # (framework, platform, compiler, test) -> [commit, wall time, RSS, tries, passed, commit timestamp]
+        self.series = {}
+        self.labels = {}
+
+        # Pipeline timing per stage
+        self.stage_secs = {}
+        self.stage_failures = {}
+        self.last_ingest = math.nan
+
+    def update(self, record_store):
+        """
+        Update the series w/ the test records of the newly parsed logs. Only the
+        latest commit of each series is kept.
+
+        Args:
+            record_store (TestRecordStore): Store of the parsed test records.
+
+        Return: None
+
+        Note:
+        - Maximum resident set size is featured in bytes within the Regression Test logs &
+        in KB within the Operation Req. Test logs. Both are exported in bytes.
+
+        """
+        for rid in range(len(record_store)):
+            rec = record_store.record(rid)
+            key = (rec['Test_Framework_Type'], rec['Platform'], rec['Compiler'], rec['Test'])
+            if key in self.series and self.series[key][0] > rec['Commit']:
+                continue
+            if key not in self.labels:
+                self.labels[key] = ','.join(f'{name}="{escape_label(val)}"'
+                                            for name, val in zip(('framework', 'platform', 'compiler', 'test'), key))
+            try:
+                commit_ts = datetime.fromisoformat(rec['Commit']).timestamp()
+            except ValueError:
+                commit_ts = math.nan
+            rss_scale = 1 if rec['Test_Framework_Type'] == 'Regression Testing' else 2**10
+            passed = float(rec['Status'] == 'PASS') if rec['Status'] else math.nan
+            self.series[key] = [rec['Commit'], rec['Wall_Time'], rec['Max_RSS']*rss_scale, rec['Tries'], passed, commit_ts]
+        self.last_ingest = time.time()
+
+        return
+
+    def render(self, openmetrics=True):
+        """
+        Args:
+            openmetrics (bool): If True, the metrics are rendered in the OpenMetrics text format.
+                                Otherwise, in the Prometheus text format (0.0.4) read by the
+                                node-exporter's textfile collector.
+
+        Return (str): Metrics in the OpenMetrics or Prometheus text format.
+
+        Note:
+        - The Prometheus text format features neither UNIT lines nor the EOF marker & names
+        the counter family after its samples (i.e. w/ the '_total' suffix).
+
+        """
+        lines = []
+        for name, unit, help_txt, idx in _TEST_GAUGES:
+            lines.append(f'# TYPE {name} gauge')
+            if unit:
+                lines.append(f'# UNIT {name} {unit}')
+            lines.append(f'# HELP {name} {help_txt}')
+            labels = self.labels
+            lines.extend(f'{name}{{{labels[key]}}} {vals[idx]!r}'
+                         for key, vals in self.series.items() if not math.isnan(vals[idx]))
+
+        # Pipeline health
+        lines += ['# TYPE ufs_wm_pipeline_stage_duration_seconds gauge',
+                  '# UNIT ufs_wm_pipeline_stage_duration_seconds seconds',
+                  '# HELP ufs_wm_pipeline_stage_duration_seconds Duration of the last run of the pipeline stage.']
+        lines.extend(f'ufs_wm_pipeline_stage_duration_seconds{{stage="{stage}"}} {secs!r}' for stage, secs in self.stage_secs.items())
+        failures_family = 'ufs_wm_pipeline_stage_failures' if openmetrics else 'ufs_wm_pipeline_stage_failures_total'
+        lines += [f'# TYPE {failures_family} counter',
+                  f'# HELP {failures_family} Number of failed runs of the pipeline stage.']
+        lines.extend(f'ufs_wm_pipeline_stage_failures_total{{stage="{stage}"}} {n}' for stage, n in self.stage_failures.items())
+        lines += ['# TYPE ufs_wm_pipeline_test_series gauge',
+                  '# HELP ufs_wm_pipeline_test_series Number of exported test series.',
+                  f'ufs_wm_pipeline_test_series {len(self.series)}']
+        if not math.isnan(self.last_ingest):
+            lines += ['# TYPE ufs_wm_pipeline_last_ingest_timestamp_seconds gauge',
+                      '# UNIT ufs_wm_pipeline_last_ingest_timestamp_seconds seconds',
+                      '# HELP ufs_wm_pipeline_last_ingest_timestamp_seconds Time of the last ingest of test records.',
+                      f'ufs_wm_pipeline_last_ingest_timestamp_seconds {self.last_ingest!r}']
+        if openmetrics:
+            lines.append('# EOF')
+        else:
+            lines = [line for line in lines if not line.startswith('# UNIT ')]
+
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self):
+        """
+        Write the metrics to the textfile in the Prometheus text format. The textfile is replaced
+        atomically, such that the node-exporter never collects a partially written file.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        if self.textfile_path is None:
+            return
+        tmp_path = self.textfile_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.render(openmetrics=False))
+        os.replace(tmp_path, self.textfile_path)
+
+        return
+
+    def serve(self, port=9101, addr='127.0.0.1'):
+        """
+        Serve the metrics from a local HTTP endpoint (/metrics) within a background thread.
+
+        Args:
+            port (int): Port of the endpoint.
+
+            addr (str): Address to bind the endpoint to.
+
+        Return (ThreadingHTTPServer): Running server. Stop w/ server.shutdown().
+
+        """
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server
@@ -0,0 +1,187 @@
+import mmap
+import re
+
+# Line patterns of the UFS-WM Operation Requirement Test logs (as of 03/2024).
+# All alternatives are anchored to the start of a line & combined into a single
+# pattern so that a log is scanned once, in place, without copies of its text.
+_OPNREQ_LINE_PATTERN = '|'.join([r'^baseline dir = (?P<bl>[^\n]*?)[ \t]*$',
+                                 r'^working dir  = (?P<work>[^\n]*?)[ \t]*$',
+                                 r'^Checking test (?P<check>\S+)[^\n]*$',
+                                 r'^ (?P<op>Comparing|Moving) (?P<file>\S+) [^\n]*\.(?P<status>[^.\n]*?)[ \t]*$',
+                                 r'^[ \t]*\d+: The total amount of wall time[ \t]*= *(?P<wall>\S+)',
+                                 r'^[ \t]*\d+: The maximum resident set size \(KB\)[ \t]*= *(?P<rss>\S+)',
+                                 r'^Test (?P<test>\S+)(?P<test_tail>[^\n]*?)[ \t]*$'])
+_OPNREQ_LINE_RE = re.compile(_OPNREQ_LINE_PATTERN, re.M)
+_OPNREQ_LINE_RE_BYTES = re.compile(_OPNREQ_LINE_PATTERN.encode(), re.M)
+
+
+class OpnReqScanner():
+    """
+    Single-pass scanner of the UFS-WM Operation Requirement Test logs.
+
+    """
+    def __init__(self, buf):
+        """
+        Args:
+            buf (str, bytes, mmap.mmap): Full text of an OpnReq. Test log. Text is
+                                         scanned in place & is never copied.
+
+        """
+        self.buf = buf
+        self.is_bytes = not isinstance(buf, str)
+        self.line_re = _OPNREQ_LINE_RE_BYTES if self.is_bytes else _OPNREQ_LINE_RE
+        self.newline = b'\n' if self.is_bytes else '\n'
+
+    @classmethod
+    def from_file(cls, log_path):
+        """
+        Memory-map an OpnReq. Test log from disk for scanning.
+
+        Args:
+            log_path (str): Path to the log file.
+
+        Return (OpnReqScanner): Scanner over the memory-mapped log.
+
+        """
+        with open(log_path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _decode(self, val):
+        """
+        Args:
+            val (str, bytes): Captured value.
+
+        Return (str): Captured value as text.
+
+        """
+        return val.decode() if self.is_bytes else val
+
+    def edge_lines(self, n_head=2, n_tail=3):
+        """
+        Extract the first & last lines of the log without splitting the entire log.
+
+        Args:
+            n_head (int): Number of lines to extract from the start of the log.
+
+            n_tail (int): Number of lines to extract from the end of the log.
+
+        Return (list, list): First N lines & last N lines (last line at the end).
+
+        """
+        head, start = [], 0
+        while len(head) < n_head:
+            end = self.buf.find(self.newline, start)
+            if end == -1:
+                head.append(self._decode(self.buf[start:]))
+                break
+            head.append(self._decode(self.buf[start:end]))
+            start = end + 1
+
+        # Trailing newline of the log is not regarded as an empty last line
+        tail, end = [], len(self.buf)
+        if end and self.buf[end-1:end] == self.newline:
+            end -= 1
+        while len(tail) < n_tail and end >= 0:
+            start = self.buf.rfind(self.newline, 0, end) + 1
+            tail.insert(0, self._decode(self.buf[start:end]))
+            end = start - 1
+
+        return head, tail
+
+    def scan(self, test_filter=None):
+        """
+        Extracts the header & the metrics per test featured within the log.
+
+        Args:
+            test_filter (function): [Optional] Predicate on the test names. Lines of
+                                    unselected tests are skipped w/o being converted.
+
+        Return (dict): Parsed test information keyed by test name, in the order of
+        appearance within the log.
+
+        Note:
+        - A test which is re-ran (FAIL Tries) is re-captured, such that the directories,
+        wall time & test size of its final attempt are kept along with its number of tries,
+        its number of attempts failing to compare & the wall time of its previous attempts.
+
+        """
+        head, tail = self.edge_lines()
+        self.header = {"Start_Date": head[0] if head else '',
+                       "Framework": head[1].replace('Start ', '') if len(head) > 1 else '',
+                       "Overall_Result": tail[0].split(' ')[-1] if len(tail) == 3 else '',
+                       "End_Date": tail[-2] if len(tail) > 1 else '',
+                       "Elapsed_Time": tail[-1]}
+
+        # Test information is accumulated until its status line closes the test.
+        self.tests = {}
+        current = None
+        skipping = False
+        for m in self.line_re.finditer(self.buf):
+            kind = m.lastgroup
+            if skipping:
+                # Lines of an unselected test are skipped until its status line
+                skipping = kind != 'test_tail'
+                continue
+            if current is None:
+                current = self._new_test(m.start())
+            if kind == 'check' and test_filter is not None and not test_filter(self._decode(m.group('check'))):
+                current, skipping = None, True
+            elif kind == 'bl':
+                current["Baseline_Dir"] = self._decode(m.group('bl'))
+            elif kind == 'work':
+                current["Working_Dir"] = self._decode(m.group('work'))
+            elif kind == 'check':
+                current["Info_Span"] = [m.end() + 1, m.end() + 1]
+            elif kind == 'status':
+                files = current["Compared_Files"] if m.group('op') in ('Comparing', b'Comparing') else current["Moved_Files"]
+                files[self._decode(m.group('file'))] = self._decode(m.group('status'))
+                current["Info_Span"][1] = m.end()
+            elif kind == 'wall':
+                current["Wall_Time"] = float(m.group('wall'))
+            elif kind == 'rss':
+                current["Max_RSS"] = float(m.group('rss'))
+            elif kind == 'test_tail':
+                test = self._decode(m.group('test'))
+                current["Status"] = self._decode(m.group('test_tail')).split(' ')[-1]
+                previous = self.tests.get(test)
+                current["Tries"] = previous["Tries"] + 1 if previous is not None else 1
+
+                # Attempts w/ a compared file not OK (as the RT logs' FAIL TO COMPARE) & wall time (s) of the attempts before the final one
+                failed_compare = any(status != 'OK' for status in current["Compared_Files"].values())
+                current["Failed_Compares"] = (previous["Failed_Compares"] if previous is not None else 0) + failed_compare
+                current["Retried_Wall_Time"] = previous["Retried_Wall_Time"] + (previous["Wall_Time"] or 0) if previous is not None else 0
+                current["Info_Span"] = tuple(current["Info_Span"])
+                self.tests[test] = current
+                current = None
+
+        return self.tests
+
+    def _new_test(self, pos):
+        """
+        Args:
+            pos (int): Offset within the log where the test's information begins.
+
+        Return (dict): Empty test information.
+
+        """
+        return {"Baseline_Dir": '',
+                "Working_Dir": '',
+                "Info_Span": [pos, pos],
+                "Wall_Time": None,
+                "Max_RSS": None,
+                "Compared_Files": {},
+                "Moved_Files": {}}
+
+    def info(self, test):
+        """
+        Text of the steps performed per test (e.g. moved & compared files).
+
+        Args:
+            test (str): Name of test.
+
+        Return (str): Text of the test's steps sliced from the log.
+
+        """
+        start, end = self.tests[test]["Info_Span"]
+
+        return self._decode(self.buf[start:end])
@@ -0,0 +1,164 @@
+import os
+import glob
+import pandas as pd
+from git import GitCommandError
+
+
+class LazyLogCorpus():
+    """
+    Corpus of the UFS-WM logs referenced by commit & path, where the text of a log is
+    read from the local repo only when it is iterated & is not retained.
+
+    """
+    def __init__(self, repo, log_archive=None):
+        """
+        Args:
+            repo (git.Repo): Local UFS-WM repo.
+
+            log_archive (LogArchive): [Optional] Archive of the raw logs. Each log is archived as it is read.
+
+        """
+        self.repo = repo
+        self.log_archive = log_archive
+        self.refs = {}
+
+    def __setitem__(self, key, ref):
+        """
+        Args:
+            key (tuple): (Log filename, commit date).
+
+            ref (tuple): (Commit hash, path of the log within the repo).
+
+        """
+        self.refs[key] = ref
+
+    def __iter__(self):
+        return iter(self.refs)
+
+    def __len__(self):
+        return len(self.refs)
+
+    def items(self):
+        """
+        Return (generator): ((log filename, commit date), text) per log. Logs that do not
+        exist at their commit are skipped.
+
+        """
+        for key, (sha, log_path) in self.refs.items():
+            try:
+                txt = self.repo.git.show(f'{sha}:{log_path}')
+            except GitCommandError:
+                continue
+            if self.log_archive is not None:
+                self.log_archive.add(sha, key[0], key[1], txt)
+            yield key, txt
+
+
+class RecordSpill():
+    """
+    Chunks of the parsed test records spilled to disk, such that the in-memory records
+    remain under a memory ceiling & the dataframes are assembled from the chunks.
+
+    """
+    # Features of the test records featured within each chunk
+    KEY_COLS = ['Test_Framework_Type', 'Filename_Description', 'Test_Description']
+    NUM_COLS = ['Wall_Time', 'WallnWait_Time', 'Run_Time', 'Max_RSS']
+
+    def __init__(self, spill_dir="dataframes/spill", max_memory_mb=256):
+        """
+        Args:
+            spill_dir (str): Directory of the spilled chunks.
+
+            max_memory_mb (float): Ceiling of the in-memory test records (MB) before
+                                   they are spilled to disk.
+
+        """
+        self.spill_dir = spill_dir
+        self.max_bytes = max_memory_mb * (2**20)
+        if not os.path.exists(self.spill_dir):
+            os.makedirs(self.spill_dir)
+        self.chunk_fns = sorted(glob.glob(os.path.join(self.spill_dir, 'chunk_*.pkl')))
+
+    def clear(self):
+        """
+        Remove the chunks of a previous run.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        for chunk_fn in self.chunk_fns:
+            os.remove(chunk_fn)
+        self.chunk_fns = []
+
+        return
+
+    def is_full(self, record_store):
+        """
+        Args:
+            record_store (TestRecordStore): Store of the in-memory test records.
+
+        Return (bool): True if the records exceed the memory ceiling.
+
+        """
+        return record_store.nbytes() > self.max_bytes
+
+    def append(self, record_store):
+        """
+        Spill the test records to a new chunk.
+
+        Args:
+            record_store (TestRecordStore): Store of the test records to spill.
+
+        Return: None
+
+        """
+        if not len(record_store):
+            return
+
+        # Interned names are saved as categoricals of their ids
+        chunk_df = pd.DataFrame({col: pd.Categorical.from_codes(record_store.str_cols[col], record_store.tables[col].strings)
+                                 for col in self.KEY_COLS})
+        for col in self.NUM_COLS:
+            chunk_df[col] = record_store.num_cols[col]
+        chunk_fn = os.path.join(self.spill_dir, f'chunk_{len(self.chunk_fns):05d}.pkl')
+        chunk_df.to_pickle(chunk_fn)
+        self.chunk_fns.append(chunk_fn)
+
+        return
+
+    def frame(self, num_col, name, convert=None):
+        """
+        Assemble a metric from the chunks. As w/in LoadData.map_metrics, the last record
+        of each (framework, filename description, test description) is kept.
+
+        Note:
+        - Chunks are read & folded in one at a time, such that at most the kept records & a
+        single chunk are held in memory (rather than all records of all chunks).
+
+        Args:
+            num_col (str): 'Wall_Time', 'WallnWait_Time', 'Run_Time' or 'Max_RSS'.
+
+            name (str): Name of the metric's feature (e.g. 'Wall Time (HH:MM:SS)').
+
+            convert (function): [Optional] Conversion of the metric's values.
+
+        Return (pd.DataFrame): Dataframe of the framework, filename description, test description & metric.
+
+        """
+        df = None
+        for chunk_fn in self.chunk_fns:
+            chunk_df = pd.read_pickle(chunk_fn)
+            chunk_df = chunk_df.loc[chunk_df[num_col].notna(), self.KEY_COLS + [num_col]]
+            chunk_df = chunk_df.astype({col: object for col in self.KEY_COLS})
+            df = chunk_df if df is None else pd.concat([df, chunk_df], ignore_index=True)
+            df = df.drop_duplicates(subset=self.KEY_COLS, keep='last')
+        if df is None:
+            return pd.DataFrame(columns=self.KEY_COLS + [name])
+
+        if convert is not None:
+            df[num_col] = df[num_col].map(convert)
+
+        return df.rename(columns={num_col: name}).reset_index(drop=True)
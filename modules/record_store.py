@@ -0,0 +1,322 @@
+from array import array
+from datetime import time as dt_time
+import math
+import sys
+import numpy as np
+import pandas as pd
+
+
+class StringTable():
+    """
+    Interned table of strings (e.g. platform, compiler & test names) mapped to integer ids.
+
+    """
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+        self.nbytes = 0
+
+    def intern(self, s):
+        """
+        Args:
+            s (str): String to intern.
+
+        Return (int): Id of the string.
+
+        """
+        sid = self.ids.get(s)
+        if sid is None:
+            sid = self.ids[s] = len(self.strings)
+            self.strings.append(s)
+            self.nbytes += sys.getsizeof(s)
+
+        return sid
+
+    def __getitem__(self, sid):
+        return self.strings[sid]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+def time_to_sec(t):
+    """
+    Args:
+        t (datetime.time, float): Time of day (or seconds).
+
+    Return (float): Total seconds. NaN if no time is featured.
+
+    """
+    if t is None:
+        return math.nan
+    if isinstance(t, dt_time):
+        return t.hour*3600 + t.minute*60 + t.second + t.microsecond/10**6
+
+    return float(t)
+
+
+def sec_to_time(sec):
+    """
+    Args:
+        sec (float): Total seconds.
+
+    Return (datetime.time): Time of day.
+
+    """
+    minutes, sec = divmod(sec, 60)
+    hours, minutes = divmod(int(minutes), 60)
+
+    return dt_time(hours, minutes, int(sec), int(round((sec - int(sec))*10**6)) % 10**6)
+
+
+def split_test(framework, filename_desc, test_desc):
+    """
+    Platform, test & compiler as derived within the generated dataframes.
+
+    Args:
+        framework (str): Test framework type (e.g. 'Regression Testing').
+
+        filename_desc (str): Description parsed from the log's filename (e.g. 'Hera', 'Control_P8_Hera').
+
+        test_desc (str): Test described within the log (e.g. 'control_p8_intel', 'bit_base').
+
+    Return (str, str, str): Platform, test & compiler.
+
+    Note:
+    - The Operation Req. Test logs no longer declares compiler per test.
+
+    """
+    if framework == 'Regression Testing':
+        test, _, compiler = test_desc.rpartition('_')
+        return filename_desc, test, compiler
+
+    test_prefix, _, platform = filename_desc.rpartition('_')
+
+    return platform, test_prefix + ' + ' + test_desc, ''
+
+
+class TestRecordStore():
+    """
+    Compact columnar store of the parsed test metrics featured within the UFS-WM logs.
+
+    Each test record is a row of parallel typed arrays, where the framework, platform,
+    compiler, test & commit names are interned ids. Records are indexed by
+    (platform, test), test & compiler.
+
+    """
+    # String columns (interned) & numeric columns of each test record.
+    STR_COLS = ('Test_Framework_Type', 'Filename_Description', 'Test_Description',
+                'Platform', 'Test', 'Compiler', 'Commit', 'Status')
+    NUM_COLS = ('Wall_Time', 'WallnWait_Time', 'Run_Time', 'Max_RSS', 'Tries')
+
+    def __init__(self):
+        self.tables = {col: StringTable() for col in self.STR_COLS}
+        self.str_cols = {col: array('I') for col in self.STR_COLS}
+        self.num_cols = {col: array('d') for col in self.NUM_COLS}
+
+        # Hash indexes of record ids
+        self.platform_test_idx = {}
+        self.test_idx = {}
+        self.compiler_idx = {}
+
+    def __len__(self):
+        return len(self.num_cols['Wall_Time'])
+
+    def nbytes(self):
+        """
+        Return (int): Approximate memory of the records (bytes), incl. the interned strings & indexes.
+
+        """
+        n_bytes = sum(arr.itemsize*len(arr) for arr in list(self.str_cols.values()) + list(self.num_cols.values()))
+        n_bytes += sum(table.nbytes for table in self.tables.values())
+
+        # Record id entries w/in the 3 hash indexes
+        n_bytes += 3*len(self)*(8 + sys.getsizeof(len(self)))
+
+        return n_bytes
+
+    def add(self, framework, filename_desc, test_desc, commit, wall_time, wallnwait_time=None, run_time=None, max_rss=None, tries=None, status=None):
+        """
+        Append a test record.
+
+        Args:
+            framework (str): Test framework type (e.g. 'Regression Testing').
+
+            filename_desc (str): Description parsed from the log's filename (e.g. 'Hera', 'Control_P8_Hera').
+
+            test_desc (str): Test described within the log (e.g. 'control_p8_intel', 'bit_base').
+
+            commit (datetime, str): Commit date (or hash) of the log.
+
+            wall_time (datetime.time, float): Test time (or seconds).
+
+            wallnwait_time (datetime.time, float): [Optional] Wall + wait time (or seconds).
+
+            run_time (datetime.time, float): [Optional] Run time (or seconds).
+
+            max_rss (float): [Optional] Maximum resident set size.
+
+            tries (int): [Optional] Number of attempts of the test.
+
+            status (str): [Optional] Final status of the test (e.g. 'PASS').
+
+        Return (int): Id of the record.
+
+        Note:
+        - Platform, test & compiler are derived as they are within the generated
+        dataframes (see split_test).
+
+        """
+        platform, test, compiler = split_test(framework, filename_desc, test_desc)
+
+        rid = len(self)
+        for col, val in zip(self.STR_COLS, (framework, filename_desc, test_desc, platform, test, compiler, str(commit), status or '')):
+            self.str_cols[col].append(self.tables[col].intern(val))
+        for col, val in zip(self.NUM_COLS, (wall_time, wallnwait_time, run_time, max_rss, tries)):
+            self.num_cols[col].append(time_to_sec(val))
+
+        platform_id, test_id = self.str_cols['Platform'][rid], self.str_cols['Test'][rid]
+        self.platform_test_idx.setdefault((platform_id, test_id), []).append(rid)
+        self.test_idx.setdefault(test_id, []).append(rid)
+        self.compiler_idx.setdefault(self.str_cols['Compiler'][rid], []).append(rid)
+
+        return rid
+
+    def add_log(self, commit, log_details):
+        """
+        Append the test records of a parsed log.
+
+        Args:
+            commit (datetime, str): Commit date (or hash) of the log.
+
+            log_details (dict): Parsed log details (see LoadData.preprocess).
+
+        Return: None
+
+        """
+        framework = log_details["Test_Framework_Type"]
+        pf = log_details["Platform"]
+        tests = dict.fromkeys(log_details["Unique_Test_Time"])
+        tests.update(dict.fromkeys(log_details["Unique_Test_Size"]))
+        for test_desc in tests:
+            self.add(framework, pf, test_desc, commit,
+                     log_details["Unique_Test_Time"].get(test_desc),
+                     log_details["Unique_Test_WallnWait_Time"].get(test_desc),
+                     log_details["Unique_Test_Run_Time"].get(test_desc),
+                     log_details["Unique_Test_Size"].get(test_desc),
+                     log_details.get("Unique_Test_Tries", {}).get(test_desc),
+                     log_details.get("Unique_Test_Status", {}).get(test_desc))
+
+        return
+
+    def to_df(self):
+        """
+        Return (pd.DataFrame): Test records w/ the string & numeric columns.
+
+        """
+        df = pd.DataFrame({col: np.array(self.tables[col].strings, dtype=object)[np.asarray(self.str_cols[col], dtype=np.int64)]
+                           for col in self.STR_COLS})
+        for col in self.NUM_COLS:
+            df[col] = np.asarray(self.num_cols[col])
+
+        return df
+
+    @classmethod
+    def from_df(cls, df):
+        """
+        Args:
+            df (pd.DataFrame): Test records (see to_df).
+
+        Return (TestRecordStore): Store of the test records.
+
+        """
+        record_store = cls()
+        for rec in df.to_dict('records'):
+            record_store.add(rec['Test_Framework_Type'], rec['Filename_Description'], rec['Test_Description'], rec['Commit'],
+                             rec['Wall_Time'], rec['WallnWait_Time'], rec['Run_Time'], rec['Max_RSS'], rec['Tries'], rec['Status'])
+
+        return record_store
+
+    def record(self, rid):
+        """
+        Args:
+            rid (int): Id of the record.
+
+        Return (dict): Test record.
+
+        """
+        rec = {col: self.tables[col][self.str_cols[col][rid]] for col in self.STR_COLS}
+        rec.update({col: self.num_cols[col][rid] for col in self.NUM_COLS})
+
+        return rec
+
+    def items(self, num_col):
+        """
+        Metric per (framework, filename description, test description) of each record.
+
+        Args:
+            num_col (str): Numeric column (e.g. 'Wall_Time', 'Max_RSS').
+
+        Return (generator): ((framework, filename description, test description), value)
+        for each record featuring the metric, in order of insertion.
+
+        """
+        tables = [self.tables[col].strings for col in self.STR_COLS[:3]]
+        cols = [self.str_cols[col] for col in self.STR_COLS[:3]]
+        for framework_id, filename_id, test_id, val in zip(*cols, self.num_cols[num_col]):
+            if not math.isnan(val):
+                yield (tables[0][framework_id], tables[1][filename_id], tables[2][test_id]), val
+
+    def find(self, platform=None, test=None, compiler=None):
+        """
+        Ids of the records of a given platform, test and/or compiler.
+
+        Args:
+            platform (str): [Optional] Name of platform (e.g. 'Hera').
+
+            test (str): [Optional] Name of test (e.g. 'control_p8').
+
+            compiler (str): [Optional] Name of compiler (e.g. 'intel').
+
+        Return (list): Ids of the matching records, in order of insertion.
+
+        """
+        ids = [table.ids.get(name) for table, name in ((self.tables['Platform'], platform),
+                                                      (self.tables['Test'], test),
+                                                      (self.tables['Compiler'], compiler))]
+        platform_id, test_id, compiler_id = ids
+        if any(sid is None and name is not None for sid, name in zip(ids, (platform, test, compiler))):
+            return []
+
+        if platform is not None and test is not None:
+            rids = self.platform_test_idx.get((platform_id, test_id), [])
+        elif test is not None:
+            rids = self.test_idx.get(test_id, [])
+        elif compiler is not None:
+            rids = self.compiler_idx.get(compiler_id, [])
+        else:
+            rids = range(len(self))
+
+        return [rid for rid in rids
+                if (platform is None or self.str_cols['Platform'][rid] == platform_id)
+                and (compiler is None or self.str_cols['Compiler'][rid] == compiler_id)]
+
+    def platforms(self, test):
+        """
+        Args:
+            test (str): Name of test.
+
+        Return (list): Platforms on which the test was performed.
+
+        """
+        return sorted({self.tables['Platform'][self.str_cols['Platform'][rid]] for rid in self.find(test=test)})
+
+    def tests(self, compiler):
+        """
+        Args:
+            compiler (str): Name of compiler.
+
+        Return (list): Tests compiled w/ the compiler.
+
+        """
+        return sorted({self.tables['Test'][self.str_cols['Test'][rid]] for rid in self.find(compiler=compiler)})
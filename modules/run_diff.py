@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+
+# Columns identifying a test across runs
+KEY_COLS = ['Test_Framework_Type', 'Platform', 'Compiler', 'Test']
+METRIC_COLS = ['Wall Time (min)', 'Max Resident Set Size (MB)']
+
+
+def run_frame(records_df):
+    """
+    Metrics of a run per (framework, platform, compiler, test).
+
+    Args:
+        records_df (pd.DataFrame): Test records of the run (see TestRecordStore.to_df), e.g. of
+                                   the logs of a commit or of a commit within the backfilled records.
+
+    Return (pd.DataFrame): Wall time (min), maximum resident set size (MB) & status indexed by test.
+
+    Note:
+    - Metrics are scaled as within LoadData.generate_df. The last record of a test is kept.
+
+    """
+    run_df = pd.DataFrame({'Test_Framework_Type': records_df['Test_Framework_Type'].to_numpy(),
+                           'Platform': records_df['Platform'].to_numpy(),
+                           'Compiler': records_df['Compiler'].to_numpy(),
+                           'Test': records_df['Test'].to_numpy(),
+                           'Wall Time (min)': records_df['Wall_Time'].to_numpy()/60,
+                           'Max Resident Set Size (MB)': records_df['Max_RSS'].to_numpy()/(2**20),
+                           'Status': records_df['Status'].to_numpy()})
+
+    return run_df.groupby(KEY_COLS, sort=False).last()
+
+
+def run_frame_from_dfs(wall_time_df, test_sz_df):
+    """
+    Metrics of a run per (framework, platform, compiler, test) w/o status.
+
+    Args:
+        wall_time_df (pd.DataFrame): Wall time dataframe of the run (see LoadData.generate_df).
+
+        test_sz_df (pd.DataFrame): Test size dataframe of the run (see LoadData.generate_df).
+
+    Return (pd.DataFrame): Wall time (min), maximum resident set size (MB) & status indexed by test.
+
+    """
+    dfs = []
+    for df, metric in ((wall_time_df, 'Wall Time (min)'), (test_sz_df, 'Max Resident Set Size (MB)')):
+        df = df.assign(Compiler=df['Compiler'].fillna(''))
+        dfs.append(df.groupby(KEY_COLS, sort=False)[metric].last())
+    run_df = pd.concat(dfs, axis=1)
+    run_df['Status'] = ''
+
+    return run_df
+
+
+class RunDiff():
+    """
+    Comparison of the test metrics of two runs (e.g. commits, dates or branches).
+
+    Tests of both runs are hash-joined on (framework, platform, compiler, test) & compared
+    w/ vectorized operations, resulting in a delta table of the wall time & maximum resident
+    set size deltas, the added & removed tests & the pass/fail flips.
+
+    """
+    def __init__(self, base_df, head_df, base_label='base', head_label='head'):
+        """
+        Args:
+            base_df (pd.DataFrame): Metrics of the base run (see run_frame).
+
+            head_df (pd.DataFrame): Metrics of the run compared to the base run (see run_frame).
+
+            base_label (str): Name of the base run (e.g. commit hash, date or branch).
+
+            head_label (str): Name of the compared run.
+
+        """
+        self.base_label, self.head_label = base_label, head_label
+        self.delta_df = self.compare(base_df, head_df)
+
+    @staticmethod
+    def compare(base_df, head_df):
+        """
+        Args:
+            base_df (pd.DataFrame): Metrics of the base run (see run_frame).
+
+            head_df (pd.DataFrame): Metrics of the compared run (see run_frame).
+
+        Return (pd.DataFrame): Delta table per test, ordered by change & by the absolute wall time delta.
+
+        """
+        df = pd.merge(base_df.reset_index(), head_df.reset_index(), on=KEY_COLS, how='outer', suffixes=(' (base)', ' (head)'), indicator=True)
+        joined = df.pop('_merge').to_numpy()
+        in_base, in_head = joined != 'right_only', joined != 'left_only'
+        for metric in METRIC_COLS:
+            base_vals, head_vals = df[f'{metric} (base)'].to_numpy(dtype=float), df[f'{metric} (head)'].to_numpy(dtype=float)
+            df[f'{metric} Delta'] = head_vals - base_vals
+            with np.errstate(divide='ignore', invalid='ignore'):
+                df[f'{metric} Delta (%)'] = np.where(base_vals != 0, 100*(head_vals - base_vals)/base_vals, np.nan)
+
+        # Change per test: Added, removed, status flipped (fixed or broke) or still featured in both runs
+        base_status, head_status = df['Status (base)'].fillna('').to_numpy(), df['Status (head)'].fillna('').to_numpy()
+        flipped = in_base & in_head & (base_status != '') & (head_status != '') & (base_status != head_status)
+        df['Change'] = np.select([~in_base, ~in_head, flipped & (head_status == 'PASS'), flipped & (base_status == 'PASS'), flipped],
+                                 ['Added', 'Removed', 'Fixed', 'Broke', 'Status Changed'], default='')
+
+        # Status flips & removed tests first, then the largest wall time changes
+        change_order = df['Change'].map({'Broke': 0, 'Removed': 1, 'Status Changed': 2, 'Fixed': 3, 'Added': 4, '': 5})
+        order = np.lexsort((-np.nan_to_num(np.abs(df['Wall Time (min) Delta'].to_numpy()), nan=-1), change_order.to_numpy()))
+
+        return df.iloc[order].reset_index(drop=True)
+
+    def summary(self):
+        """
+        Return (dict): Number of tests compared, added, removed, fixed & broken & the total deltas.
+
+        """
+        changes = self.delta_df['Change'].value_counts()
+
+        return {'Compared': int((~self.delta_df['Change'].isin(['Added', 'Removed'])).sum()),
+                'Added': int(changes.get('Added', 0)),
+                'Removed': int(changes.get('Removed', 0)),
+                'Fixed': int(changes.get('Fixed', 0)),
+                'Broke': int(changes.get('Broke', 0)),
+                'Total Wall Time Delta (min)': float(np.nansum(self.delta_df['Wall Time (min) Delta'])),
+                'Total Max Resident Set Size Delta (MB)': float(np.nansum(self.delta_df['Max Resident Set Size (MB) Delta']))}
+
+    def regressions(self, metric='Wall Time (min)', min_pct=10, top_n=None):
+        """
+        Args:
+            metric (str): 'Wall Time (min)' or 'Max Resident Set Size (MB)'.
+
+            min_pct (float): Minimum increase (%) of the metric.
+
+            top_n (int): [Optional] Number of largest increases to keep.
+
+        Return (pd.DataFrame): Tests whose metric increased by at least min_pct, largest first.
+
+        """
+        df = self.delta_df[self.delta_df[f'{metric} Delta (%)'] >= min_pct]
+        df = df.sort_values(f'{metric} Delta', ascending=False)
+
+        return df.head(top_n) if top_n is not None else df
+
+    def save_html(self, html_path="plot_results/run_diff.html", top_n=50):
+        """
+        Save an HTML summary of the comparison: counts, status flips, removed & added tests &
+        the largest wall time & maximum resident set size increases.
+
+        Args:
+            html_path (str): HTML file to save the summary as.
+
+            top_n (int): Number of tests featured per table.
+
+        Return: None
+
+        """
+        key_cols = KEY_COLS + ['Status (base)', 'Status (head)']
+        sections = [('Status Flips', self.delta_df[self.delta_df['Change'].isin(['Broke', 'Fixed', 'Status Changed'])][key_cols + ['Change']]),
+                    ('Removed Tests', self.delta_df[self.delta_df['Change'] == 'Removed'][key_cols]),
+                    ('Added Tests', self.delta_df[self.delta_df['Change'] == 'Added'][key_cols])]
+        for metric in METRIC_COLS:
+            sections.append((f'Largest {metric} Increases',
+                             self.regressions(metric, min_pct=0, top_n=top_n)[KEY_COLS + [f'{metric} (base)', f'{metric} (head)',
+                                                                                         f'{metric} Delta', f'{metric} Delta (%)']]))
+        summary_df = pd.DataFrame([self.summary()])
+
+        html = [f'<html><head><meta charset="utf-8"><title>{self.base_label} vs {self.head_label}</title></head><body>',
+                f'<h1>Test Metrics: {self.base_label} (base) vs {self.head_label}</h1>',
+                summary_df.to_html(index=False, float_format='{:.2f}'.format)]
+        for title, df in sections:
+            html.append(f'<h2>{title} ({len(df)})</h2>')
+            html.append(df.head(top_n).to_html(index=False, float_format='{:.2f}'.format, na_rep=''))
+        html.append('</body></html>')
+        with open(html_path, 'w') as f:
+            f.write('\n'.join(html))
+
+        return
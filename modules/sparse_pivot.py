@@ -0,0 +1,228 @@
+import os
+import pickle
+import numpy as np
+import pandas as pd
+
+
+class SparsePivot():
+    """
+    Sparse (COO) pivot of the log metrics per platform-to-compiler & test, holding all metrics
+    within a single structure.
+
+    Only the observed (platform-to-compiler, test) cells of each metric are stored as row & column
+    codes w/ their values, such that the pivot's memory & file size scale w/ the number of tests
+    performed rather than w/ the number of platform-to-compilers x tests (nor w/ the cells only
+    observed for other metrics, e.g. the run times absent from the Operation Req. Test logs).
+    Dense pivot tables are produced only on demand.
+
+    """
+    KEY_COLS = ['Platform_Compiler', 'Test']
+
+    def __init__(self, pf_comps, tests, cells, frameworks):
+        """
+        Args:
+            pf_comps (pd.Index): Platform-to-compilers (row labels).
+
+            tests (pd.Index): Tests (column labels).
+
+            cells (dict): Row codes, column codes & values of the observed cells per metric. Metrics
+                          observed on the same cells share their code arrays.
+
+            frameworks (np.ndarray): Test framework type per platform-to-compiler.
+
+        """
+        self.pf_comps, self.tests = pf_comps, tests
+        self.cells = cells
+        self.frameworks = frameworks
+
+    def __setstate__(self, state):
+        # Pivots saved w/ the union of all metrics' cells & NaN-filled values per metric
+        if 'values' in state:
+            state['cells'] = self._observed_cells(state.pop('rows'), state.pop('cols'), state.pop('values'))
+        self.__dict__.update(state)
+
+    @staticmethod
+    def _observed_cells(rows, cols, values):
+        """
+        Args:
+            rows (np.ndarray): Row code per cell.
+
+            cols (np.ndarray): Column code per cell.
+
+            values (dict): Values per cell (NaN if not observed) per metric.
+
+        Return (dict): Row codes, column codes & values of the observed cells per metric, where the
+        codes are of the smallest integer type & shared across metrics observed on the same cells.
+
+        """
+        rows = rows.astype(np.min_scalar_type(max(rows.max(initial=0), 0)))
+        cols = cols.astype(np.min_scalar_type(max(cols.max(initial=0), 0)))
+        codes, cells = {}, {}
+        for metric, vals in values.items():
+            observed = ~np.isnan(vals)
+            mask_key = observed.tobytes()
+            if mask_key not in codes:
+                codes[mask_key] = (rows[observed], cols[observed])
+            cells[metric] = codes[mask_key] + (vals[observed],)
+
+        return cells
+
+    @classmethod
+    def from_dfs(cls, dfs):
+        """
+        Args:
+            dfs (dict): Dataframes of the log metrics (see LoadData.generate_df) per metric
+                        (e.g. {'Wall Time (min)': wall_time_df, 'Max Resident Set Size (MB)': test_sz_df}).
+
+        Return (SparsePivot): Sparse pivot of all metrics.
+
+        """
+        long_dfs = [df[cls.KEY_COLS + ['Test_Framework_Type', metric]] for metric, df in dfs.items()]
+
+        return cls.from_long(pd.concat(long_dfs, ignore_index=True), list(dfs))
+
+    @classmethod
+    def from_long(cls, long_df, metrics):
+        """
+        Args:
+            long_df (pd.DataFrame): Metrics per platform-to-compiler, test & test framework type. As within
+                                    LoadData.generate_pivot_df, the last value per cell is kept.
+
+            metrics (list): Metrics featured within the dataframe.
+
+        Return (SparsePivot): Sparse pivot of the metrics.
+
+        """
+        long_df = long_df.dropna(subset=cls.KEY_COLS)
+        cells_df = long_df.groupby(cls.KEY_COLS, sort=False)[metrics].last().reset_index()
+        rows, pf_comps = pd.factorize(cells_df['Platform_Compiler'])
+        cols, tests = pd.factorize(cells_df['Test'])
+        frameworks = long_df.groupby('Platform_Compiler', sort=False)['Test_Framework_Type'].last().reindex(pf_comps)
+        values = {metric: cells_df[metric].to_numpy(dtype=float) for metric in metrics}
+
+        return cls(pd.Index(pf_comps), pd.Index(tests), cls._observed_cells(rows, cols, values), frameworks.to_numpy())
+
+    def to_long(self):
+        """
+        Return (pd.DataFrame): Metrics per observed cell.
+
+        """
+        metric_vals = [pd.Series(vals, index=pd.MultiIndex.from_arrays([rows, cols]), name=metric)
+                       for metric, (rows, cols, vals) in self.cells.items()]
+        long_df = pd.concat(metric_vals, axis=1) if metric_vals else pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []]))
+        rows, cols = long_df.index.get_level_values(0).to_numpy(dtype=np.int32), long_df.index.get_level_values(1).to_numpy(dtype=np.int32)
+        long_df = long_df.reset_index(drop=True)
+        long_df.insert(0, 'Test_Framework_Type', self.frameworks[rows])
+        long_df.insert(0, 'Test', self.tests[cols])
+        long_df.insert(0, 'Platform_Compiler', self.pf_comps[rows])
+
+        return long_df
+
+    def update(self, other):
+        """
+        Merge the cells of a newer pivot (e.g. as history grows). Newer values replace the
+        older values of the same cell & metric.
+
+        Args:
+            other (SparsePivot): Newer sparse pivot.
+
+        Return (SparsePivot): Merged sparse pivot.
+
+        """
+        metrics = list(dict.fromkeys(list(self.cells) + list(other.cells)))
+
+        return self.from_long(pd.concat([self.to_long(), other.to_long()], ignore_index=True), metrics)
+
+    def nnz(self, metric):
+        """
+        Args:
+            metric (str): Name of metric.
+
+        Return (int): Number of observed cells of the metric.
+
+        """
+        return len(self.cells[metric][2])
+
+    def nbytes(self):
+        """
+        Return (int): Memory of the codes & values (bytes). Shared codes are counted once.
+
+        """
+        arrays = {id(arr): arr for metric_cells in self.cells.values() for arr in metric_cells}
+
+        return sum(arr.nbytes for arr in arrays.values())
+
+    def sparse_df(self, metric):
+        """
+        Args:
+            metric (str): Name of metric.
+
+        Return (pd.DataFrame): Pivot of the metric (platform-to-compiler x test) w/ sparse columns.
+
+        """
+        rows, cols, vals = self.cells[metric]
+        order = np.lexsort((rows, cols))
+        rows, cols, vals = rows[order], cols[order], vals[order]
+        bounds = np.searchsorted(cols, np.arange(len(self.tests) + 1))
+        sparse_cols = {}
+        for col_idx, test in enumerate(self.tests):
+            col_vals = np.full(len(self.pf_comps), np.nan)
+            col_vals[rows[bounds[col_idx]:bounds[col_idx + 1]]] = vals[bounds[col_idx]:bounds[col_idx + 1]]
+            sparse_cols[test] = pd.arrays.SparseArray(col_vals, fill_value=np.nan)
+
+        return pd.DataFrame(sparse_cols, index=self.pf_comps)
+
+    def dense(self, metric):
+        """
+        Dense view of a metric, as formerly generated w/in LoadData.generate_pivot_df.
+
+        Args:
+            metric (str): Name of metric.
+
+        Return (pd.DataFrame): Pivot dataframe of the metric featuring the test framework type,
+        number of tests, metric per test, platform & compiler per platform-to-compiler.
+
+        """
+        rows, cols, vals = self.cells[metric]
+        dense_vals = np.full((len(self.pf_comps), len(self.tests)), np.nan)
+        dense_vals[rows, cols] = vals
+        df = pd.DataFrame(dense_vals, index=self.pf_comps.rename(None), columns=self.tests.rename('test'))
+
+        # Test frequency, platform & compiler per platform-to-compiler
+        df.insert(0, 'Number of Tests', np.bincount(rows, minlength=len(self.pf_comps)))
+        df.insert(0, 'Test_Framework_Type', self.frameworks)
+        df = df[df['Number of Tests'] > 0].sort_values(by='Number of Tests', ascending=False, kind='stable')
+        pf_comp_parts = df.index.to_series().str.split(' + ', regex=False)
+        df['Platform'] = pf_comp_parts.str[0]
+        df['Compiler'] = pf_comp_parts.str[-1].where(pf_comp_parts.str.len() > 1, '')
+
+        return df
+
+    def save(self, pivot_path="dataframes/sparse_pivot.pkl"):
+        """
+        Persist sparse pivot as pickle file.
+
+        Args:
+            pivot_path (str): Pickle file to save the sparse pivot as.
+
+        Return: None
+
+        """
+        with open(pivot_path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return
+
+    @staticmethod
+    def load(pivot_path="dataframes/sparse_pivot.pkl"):
+        """
+        Args:
+            pivot_path (str): Pickle file of the sparse pivot.
+
+        Return (SparsePivot): Sparse pivot. None if it does not exist.
+
+        """
+        if not os.path.exists(pivot_path):
+            return None
+        with open(pivot_path, 'rb') as f:
+            return pickle.load(f)
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+
+class SpeedModel():
+    """
+    Additive log-time model of the test run times across platform-to-compilers.
+
+    log(run time) = overall cost + test cost + platform-to-compiler speed, fitted
+    on the observed (sparse) cells of the run time pivot table, such that run
+    times are predicted for tests not yet performed on a platform-to-compiler &
+    observed run times far from their prediction are flagged.
+
+    Note:
+    - The run time excludes the queue wait, such that the speed factors reflect the
+    platform-to-compilers rather than their batch queues (see LoadData.generate_speed_df).
+
+    """
+    # Non-test features of the pivot tables (see LoadData.generate_pivot_df)
+    PIVOT_META_COLS = ['Test_Framework_Type', 'Number of Tests', 'Platform', 'Compiler']
+
+    def __init__(self, n_iter=50, ridge=0.1, tol=1e-6):
+        """
+        Args:
+            n_iter (int): Maximum number of alternating least squares iterations.
+
+            ridge (float): Shrinkage of the test costs & platform speeds w/ few observations.
+
+            tol (float): Convergence tolerance of the fitted effects.
+
+        """
+        self.n_iter, self.ridge, self.tol = n_iter, ridge, tol
+
+    def fit(self, pivot_df):
+        """
+        Fit the model on the observed cells of a pivot table.
+
+        Args:
+            pivot_df (pd.DataFrame): Run time pivot table (platform-to-compiler x test).
+
+        Return (SpeedModel): Fitted model.
+
+        """
+        wall_df = pivot_df.drop(columns=self.PIVOT_META_COLS, errors='ignore').apply(pd.to_numeric, errors='coerce')
+        self.pf_comps, self.tests = wall_df.index, wall_df.columns
+        vals = wall_df.to_numpy(dtype=float)
+
+        # Observed cells (positive run times only)
+        pf_idx, test_idx = np.nonzero(np.isfinite(vals) & (vals > 0))
+        self.observed = vals
+        y = np.log(vals[pf_idx, test_idx])
+        n_pf, n_test = len(self.pf_comps), len(self.tests)
+        pf_counts = np.bincount(pf_idx, minlength=n_pf)
+        test_counts = np.bincount(test_idx, minlength=n_test)
+
+        # Alternating least squares of the test & platform-to-compiler effects
+        self.mu = y.mean() if len(y) else 0.0
+        test_eff, pf_eff = np.zeros(n_test), np.zeros(n_pf)
+        for _ in range(self.n_iter):
+            prev_test_eff, prev_pf_eff = test_eff, pf_eff
+            test_eff = np.bincount(test_idx, weights=y - self.mu - pf_eff[pf_idx], minlength=n_test) / (test_counts + self.ridge)
+            pf_eff = np.bincount(pf_idx, weights=y - self.mu - test_eff[test_idx], minlength=n_pf) / (pf_counts + self.ridge)
+            if max(np.abs(test_eff - prev_test_eff).max(initial=0), np.abs(pf_eff - prev_pf_eff).max(initial=0)) < self.tol:
+                break
+
+        # Platform-to-compiler speeds are centered, such that a speed factor of 1 is the typical platform-to-compiler
+        shift = pf_eff[pf_counts > 0].mean() if (pf_counts > 0).any() else 0.0
+        self.pf_eff, self.test_eff = pf_eff - shift, test_eff + shift
+
+        # Spread of the log residuals (robust)
+        resid = y - self.mu - self.test_eff[test_idx] - self.pf_eff[pf_idx]
+        self.resid_scale = 1.4826 * np.median(np.abs(resid - np.median(resid))) if len(resid) else 0.0
+
+        return self
+
+    def speed_factors(self):
+        """
+        Return (pd.Series): Relative run time factor per platform-to-compiler (> 1 is slower).
+
+        """
+        return pd.Series(np.exp(self.pf_eff), index=self.pf_comps, name='Speed Factor').sort_values()
+
+    def test_costs(self):
+        """
+        Return (pd.Series): Expected run time per test on the typical platform-to-compiler.
+
+        """
+        return pd.Series(np.exp(self.mu + self.test_eff), index=self.tests, name='Test Cost').sort_values(ascending=False)
+
+    def predict(self):
+        """
+        Return (pd.DataFrame): Expected run time of every test on every platform-to-compiler.
+
+        """
+        log_pred = self.mu + self.pf_eff[:, None] + self.test_eff[None, :]
+
+        return pd.DataFrame(np.exp(log_pred), index=self.pf_comps, columns=self.tests)
+
+    def missing(self):
+        """
+        Return (pd.DataFrame): Expected run time of the tests not performed per platform-to-compiler.
+
+        """
+        pred = self.predict()
+        pf_idx, test_idx = np.nonzero(~(np.isfinite(self.observed) & (self.observed > 0)))
+
+        return pd.DataFrame({'pf_2_comp': self.pf_comps[pf_idx],
+                             'test': self.tests[test_idx],
+                             'Predicted': pred.to_numpy()[pf_idx, test_idx]})
+
+    def anomalies(self, n_sigma=3.0):
+        """
+        Observed run times far from their prediction.
+
+        Args:
+            n_sigma (float): Threshold of the log residual in units of its robust spread.
+
+        Return (pd.DataFrame): Flagged cells ordered by their deviation.
+
+        """
+        pred = self.predict().to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_ratio = np.log(self.observed / pred)
+        pf_idx, test_idx = np.nonzero(np.abs(log_ratio) > n_sigma * max(self.resid_scale, 1e-12))
+        df = pd.DataFrame({'pf_2_comp': self.pf_comps[pf_idx],
+                           'test': self.tests[test_idx],
+                           'Observed': self.observed[pf_idx, test_idx],
+                           'Predicted': pred[pf_idx, test_idx],
+                           'Ratio': np.exp(log_ratio[pf_idx, test_idx])})
+
+        return df.reindex(df['Ratio'].apply(lambda r: abs(np.log(r))).sort_values(ascending=False).index).reset_index(drop=True)
+
+    def expected_total(self, pf_comp, tests=None):
+        """
+        Expected total run time of a set of tests on a platform-to-compiler (e.g. for HPC
+        allocation planning). A platform-to-compiler w/o observations is assumed typical.
+
+        Args:
+            pf_comp (str): Platform-to-compiler (e.g. 'Hera + intel').
+
+            tests (list): [Optional] Tests to perform. Default: All tests.
+
+        Return (float): Expected total run time.
+
+        """
+        tests = self.tests if tests is None else tests
+        test_costs = np.exp(self.mu + pd.Series(self.test_eff, index=self.tests).reindex(tests).fillna(0).to_numpy())
+        pf_factor = np.exp(pd.Series(self.pf_eff, index=self.pf_comps).get(pf_comp, 0.0))
+
+        return float(test_costs.sum() * pf_factor)
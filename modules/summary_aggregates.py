@@ -0,0 +1,242 @@
+import os
+import math
+import pickle
+import pandas as pd
+
+
+class QuantileSketch():
+    """
+    Mergeable quantile sketch w/ relative-error guarantees (log-bucketed histogram).
+
+    Values are counted within logarithmically spaced buckets, such that any quantile
+    is estimated within the relative accuracy & sketches of different platforms or
+    dates are merged by adding their bucket counts.
+
+    """
+    def __init__(self, rel_accuracy=0.01):
+        """
+        Args:
+            rel_accuracy (float): Relative accuracy of the estimated quantiles.
+
+        """
+        self.rel_accuracy = rel_accuracy
+        self.log_gamma = math.log((1 + rel_accuracy) / (1 - rel_accuracy))
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, val):
+        """
+        Args:
+            val (float): Value to count.
+
+        Return: None
+
+        """
+        if val > 0:
+            idx = math.ceil(math.log(val) / self.log_gamma)
+            self.buckets[idx] = self.buckets.get(idx, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.total += val
+        self.min = min(self.min, val)
+        self.max = max(self.max, val)
+
+        return
+
+    def merge(self, other):
+        """
+        Args:
+            other (QuantileSketch): Sketch of the same relative accuracy to merge in place.
+
+        Return (QuantileSketch): Merged sketch.
+
+        """
+        for idx, n in other.buckets.items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        return self
+
+    def quantile(self, q):
+        """
+        Args:
+            q (float): Quantile within [0, 1].
+
+        Return (float): Estimated quantile. NaN if sketch is empty.
+
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if seen > rank:
+                # Midpoint of bucket (in relative terms)
+                est = 2 * math.exp(idx * self.log_gamma) / (1 + math.exp(self.log_gamma))
+                return min(max(est, self.min), self.max)
+
+        return self.max
+
+    def summary(self):
+        """
+        Return (dict): Count, mean, median, 95th percentile, min & max.
+
+        """
+        return {'count': self.count,
+                'mean': self.total / self.count if self.count else math.nan,
+                'median': self.quantile(0.5),
+                'p95': self.quantile(0.95),
+                'min': self.min if self.count else math.nan,
+                'max': self.max if self.count else math.nan}
+
+
+class SummaryAggregates():
+    """
+    Incrementally maintained summary statistics of the log metrics per test across
+    platform-to-compilers & commit dates.
+
+    """
+    # Metrics as featured within the generated dataframes & scaling from the records.
+    METRICS = {'Wall Time (min)': ('Wall_Time', 1/60),
+               'Max Resident Set Size (MB)': ('Max_RSS', 1/(2**20))}
+
+    def __init__(self, aggregates_path="dataframes/summary_aggregates.pkl", rel_accuracy=0.01):
+        """
+        Args:
+            aggregates_path (str): Pickle file to load & persist the aggregates.
+
+            rel_accuracy (float): Relative accuracy of the quantile sketches.
+
+        """
+        self.aggregates_path = aggregates_path
+        self.rel_accuracy = rel_accuracy
+
+        # Sketches per (platform-to-compiler, date) & roll-ups, both keyed by (metric, framework, test),
+        # & the (commit, framework, filename description) of each log already counted
+        self.cells = {}
+        self.rollups = {}
+        self.ingested = set()
+        if os.path.exists(self.aggregates_path):
+            with open(self.aggregates_path, 'rb') as f:
+                self.cells, self.rollups, ingested = pickle.load(f)
+
+            # Aggregates saved w/ a key per record are reduced to a key per log
+            self.ingested = {key[:3] for key in ingested}
+
+    def _sketch(self, sketches, key):
+        sketch = sketches.get(key)
+        if sketch is None:
+            sketch = sketches[key] = QuantileSketch(self.rel_accuracy)
+
+        return sketch
+
+    def update(self, record_store):
+        """
+        Count the records of the newly ingested runs. Records of logs (commit, framework
+        & filename description) already counted are skipped.
+
+        Args:
+            record_store (TestRecordStore): Store of the parsed test records.
+
+        Return: None
+
+        """
+        new_logs = set()
+        for rid in range(len(record_store)):
+            rec = record_store.record(rid)
+            log_key = (rec['Commit'], rec['Test_Framework_Type'], rec['Filename_Description'])
+            if log_key in self.ingested:
+                continue
+            new_logs.add(log_key)
+
+            # Platform-to-compiler as featured within the generated dataframes
+            pf_comp = rec['Platform'] + ' + ' + rec['Compiler'] if rec['Compiler'] else rec['Platform']
+            date = rec['Commit'].split(' ')[0]
+            for metric, (col, scale) in self.METRICS.items():
+                val = rec[col]
+                if math.isnan(val):
+                    continue
+                key = (metric, rec['Test_Framework_Type'], rec['Test'])
+                self._sketch(self.cells.setdefault(key, {}), (pf_comp, date)).add(val*scale)
+                self._sketch(self.rollups, key).add(val*scale)
+        self.ingested |= new_logs
+
+        return
+
+    def summary(self, metric, framework, test, pf_comps=None, start_date=None, end_date=None):
+        """
+        Summary statistics of a test. W/o any selection, it is answered from the
+        roll-up of the test. Otherwise, the sketches of the selection are merged.
+
+        Args:
+            metric (str): 'Wall Time (min)' or 'Max Resident Set Size (MB)'.
+
+            framework (str): Test framework type (e.g. 'Regression Testing').
+
+            test (str): Name of test.
+
+            pf_comps (list): [Optional] Platform-to-compilers to select (e.g. ['Hera + intel']).
+
+            start_date (str): [Optional] First commit date to select (YYYY-MM-DD).
+
+            end_date (str): [Optional] Last commit date to select (YYYY-MM-DD).
+
+        Return (dict): Count, mean, median, 95th percentile, min & max.
+
+        """
+        if pf_comps is None and start_date is None and end_date is None:
+            return self.rollups.get((metric, framework, test), QuantileSketch(self.rel_accuracy)).summary()
+
+        merged = QuantileSketch(self.rel_accuracy)
+        for (pf_comp, date), sketch in self.cells.get((metric, framework, test), {}).items():
+            if pf_comps is not None and pf_comp not in pf_comps:
+                continue
+            if (start_date is not None and date < start_date) or (end_date is not None and date > end_date):
+                continue
+            merged.merge(sketch)
+
+        return merged.summary()
+
+    def summary_df(self, metric):
+        """
+        Summary statistics of all tests.
+
+        Args:
+            metric (str): 'Wall Time (min)' or 'Max Resident Set Size (MB)'.
+
+        Return (pd.DataFrame): Summary statistics per test framework type & test.
+
+        """
+        rows = {(framework, test): sketch.summary()
+                for (rollup_metric, framework, test), sketch in self.rollups.items() if rollup_metric == metric}
+        df = pd.DataFrame.from_dict(rows, orient='index', columns=['count', 'mean', 'median', 'p95', 'min', 'max'])
+        df.index = pd.MultiIndex.from_tuples(df.index, names=['Test_Framework_Type', 'Test'])
+
+        return df
+
+    def save(self):
+        """
+        Persist aggregates as pickle file.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        with open(self.aggregates_path, 'wb') as f:
+            pickle.dump((self.cells, self.rollups, self.ingested), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return
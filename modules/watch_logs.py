@@ -0,0 +1,152 @@
+import os
+import json
+import time
+from datetime import datetime
+from git import GitCommandError
+from generate_plots import GeneratePlots
+
+
+class WatchLogs():
+    """
+    Long-running watch mode polling the remote UFS-WM repo & processing only the new
+    commits made to the logs.
+
+    """
+    def __init__(self, data_wrapper, log_dir='/tests/logs', state_path="dataframes/watch_state.json", render=True):
+        """
+        Args:
+            data_wrapper (LoadData): Module for loading & preprocessing data. Construct w/
+                                     refresh=False, since the remote is fetched by the watch mode.
+
+            log_dir (str): Relative directory of the where the logs files are located in repository.
+
+            state_path (str): JSON file saving the last processed commit, such that
+                              the watch mode resumes after restarts.
+
+            render (bool): If True, the plots of the affected platforms are generated.
+
+        """
+        self.data_wrapper = data_wrapper
+        self.repo = data_wrapper.my_local_repo
+        self.branch = str(self.repo.active_branch)
+        self.log_dir = log_dir.strip('/')
+        self.state_path = state_path
+        self.render = render
+        self.state = {'last_sha': None, 'processed': []}
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+
+    def save_state(self):
+        """
+        Persist progress of watch mode.
+
+        Args:
+            None
+
+        Return: None
+
+        """
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+        return
+
+    def new_commits(self):
+        """
+        Fetch remote & list the commits made to the logs since the last processed commit.
+
+        Args:
+            None
+
+        Return (list): Commits from oldest to newest. If no commit was processed
+        yet, only the most recent commit made to the logs.
+
+        """
+        self.repo.remote().fetch()
+        remote_ref = f'origin/{self.branch}'
+        if self.state['last_sha'] is None:
+            return list(self.repo.iter_commits(remote_ref, max_count=1, paths=self.log_dir))
+
+        return list(reversed(list(self.repo.iter_commits(f"{self.state['last_sha']}..{remote_ref}", paths=self.log_dir))))
+
+    def process_commit(self, commit):
+        """
+        Ingest, parse, aggregate & render the logs changed within a commit.
+
+        Args:
+            commit (git.Commit): Commit made to the logs.
+
+        Return (list): Filenames of the processed logs.
+
+        """
+        commit_date = datetime.fromtimestamp(commit.committed_date)
+        selection = self.data_wrapper.selection
+        changed_logs = [fn for fn in commit.stats.files
+                        if os.path.dirname(fn) == self.log_dir and self.data_wrapper.is_relevant_log(os.path.basename(fn))
+                        and (selection is None or selection.accepts_log(os.path.basename(fn)))]
+
+        # Ingest the changed logs (deleted logs are skipped)
+        self.data_wrapper.log_files_corpus = {}
+        for log_path in changed_logs:
+            try:
+                self.data_wrapper.log_files_corpus[(os.path.basename(log_path), commit_date)] = self.repo.git.show(f'{commit.hexsha}:{log_path}')
+            except GitCommandError:
+                pass
+        if not self.data_wrapper.log_files_corpus:
+            return []
+        self.data_wrapper.log_archive.add_many((commit.hexsha, log_fn, log_date, txt)
+                                               for (log_fn, log_date), txt in self.data_wrapper.log_files_corpus.items())
+
+        # Parse & aggregate, then merge the commit's tests into the saved dataframes of all logs
+        self.data_wrapper.preprocess()
+        self.data_wrapper.map_metrics()
+        wall_time_df, test_sz_df = self.data_wrapper.generate_df(save=False)
+        self.data_wrapper.merge_into_pkl(wall_time_df, "wall_time_df", 'Wall Time (HH:MM:SS)')
+        self.data_wrapper.merge_into_pkl(test_sz_df, "test_sz_df", 'Max Resident Set Size (bytes)')
+
+        # Render only the affected platforms
+        if self.render:
+            GeneratePlots(wall_time_df, test_sz_df).generate_barplots_platform()
+
+        return sorted(fn for fn, _ in self.data_wrapper.log_files_corpus)
+
+    def poll(self):
+        """
+        Process the new commits made to the logs. Progress is saved after each commit.
+
+        Args:
+            None
+
+        Return (list): Hashes of the processed commits.
+
+        """
+        processed = []
+        for commit in self.new_commits():
+            log_fns = self.process_commit(commit)
+            print(f'Processed commit {commit.hexsha}: {log_fns}')
+            self.state['last_sha'] = commit.hexsha
+            self.state['processed'] = (self.state['processed'] + [commit.hexsha])[-100:]
+            self.save_state()
+            processed.append(commit.hexsha)
+
+        return processed
+
+    def run(self, interval=300):
+        """
+        Poll the remote every N seconds until interrupted.
+
+        Args:
+            interval (int): N number of seconds between polls.
+
+        Return: None
+
+        """
+        while True:
+            try:
+                self.poll()
+            except GitCommandError as e:
+                print(f'Polling remote failed, retrying in {interval}s:\n{e}')
+            time.sleep(interval)
@@ -0,0 +1,138 @@
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'modules'))
+import json
+import time
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+import pytest
+import http_log_source
+from http_log_source import HTTPLogSource
+
+# Logs served per filename
+LOGS = {'RegressionTests_hera.log': b'====START OF HERA REGRESSION TESTING LOG====\n',
+        'RegressionTests_orion.log': b'====START OF ORION REGRESSION TESTING LOG====\n',
+        'OpnReqTests_control_p8_hera.log': b'Tue Mar 12 03:57:40 UTC 2024\nStart Operation Requirement Test\n'}
+
+
+class StandInAPI(ThreadingHTTPServer):
+    """
+    Local stand-in of the GitHub contents API, recording the requests & connections it serves.
+
+    """
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.requests = Counter()
+        self.connections = set()
+        self.rate_limited = Counter()
+        self.rate_remaining = 5000
+        self.lock = threading.Lock()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-RateLimit-Remaining', str(self.server.rate_remaining))
+        self.send_header('X-RateLimit-Reset', str(int(time.time()) + 1))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        with self.server.lock:
+            self.server.requests[path] += 1
+            self.server.connections.add(self.client_address)
+            rate_limited = self.server.rate_limited[path] > 0
+            if rate_limited:
+                self.server.rate_limited[path] -= 1
+        if rate_limited:
+            return self.send(429, b'rate limited', {'Retry-After': '0'})
+
+        if path == '/repos/o/r/contents/tests/logs':
+            body = json.dumps([{'name': log_fn, 'type': 'file'} for log_fn in LOGS]).encode()
+        elif path == '/repos/o/r/commits':
+            body = json.dumps([{'sha': 'c30e3ef', 'commit': {'committer': {'date': '2024-03-12T06:17:43Z'}}}]).encode()
+        elif path.startswith('/repos/o/r/contents/tests/logs/') and path.rsplit('/', 1)[1] in LOGS:
+            body = LOGS[path.rsplit('/', 1)[1]]
+        else:
+            return self.send(404, b'not found')
+
+        etag = f'"{hash(body)}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self.send(304, headers={'ETag': etag})
+
+        return self.send(200, body, {'ETag': etag})
+
+
+@pytest.fixture
+def api():
+    server = StandInAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def log_source(api, tmp_path, **kwargs):
+    return HTTPLogSource(owner='o', repo='r', branch='develop', log_dir='/tests/logs', api_url=f'http://127.0.0.1:{api.server_port}',
+                         cache_dir=str(tmp_path / 'http_cache'), **kwargs)
+
+
+def test_unchanged_logs_read_from_cache(api, tmp_path):
+    with log_source(api, tmp_path, max_workers=2) as source:
+        corpus = source.read_logs()
+        assert source.n_not_modified == 0
+
+    # Reads of a new session are conditional on the persisted ETags
+    with log_source(api, tmp_path, max_workers=2) as source:
+        assert source.read_logs() == corpus
+        assert source.n_requests == len(LOGS) + 2
+        assert source.n_not_modified == len(LOGS) + 2
+    assert {log_fn for log_fn, _ in corpus} == set(LOGS)
+    assert corpus[('RegressionTests_hera.log', source.latest_commit[1])] == LOGS['RegressionTests_hera.log'].decode()[:-1]
+
+
+def test_rate_limited_requests_retried(api, tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(http_log_source.time, 'sleep', lambda sec: sleeps.append(sec))
+    api.rate_limited['/repos/o/r/contents/tests/logs/RegressionTests_orion.log'] = 2
+
+    with log_source(api, tmp_path, max_workers=1) as source:
+        corpus = source.read_logs()
+    assert len(corpus) == len(LOGS)
+    assert api.requests['/repos/o/r/contents/tests/logs/RegressionTests_orion.log'] == 3
+    assert sleeps == [0.0, 0.0]
+
+    # Workers wait for the rate limit's reset once few requests remain
+    api.rate_remaining = 1
+    sleeps.clear()
+    with log_source(api, tmp_path, max_workers=1, min_remaining=5) as source:
+        source.read_logs()
+    assert sleeps and all(0 < sec <= 1 for sec in sleeps)
+
+
+def test_requests_reuse_persistent_connections(api, tmp_path):
+    source = log_source(api, tmp_path, max_workers=1)
+    source.read_logs()
+    source.read_logs()
+
+    # Listing, latest commit & all logs over the connection of the caller & the one of the worker
+    assert sum(api.requests.values()) == 2*(len(LOGS) + 2)
+    assert len(api.connections) == 2
+    assert len(source.connections) == 2
+
+    source.close()
+    assert source.connections == []
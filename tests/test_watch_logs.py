@@ -0,0 +1,122 @@
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'modules'))
+import pandas as pd
+import pytest
+from git import Repo
+from load_data import LoadData
+from summary_aggregates import SummaryAggregates
+from history_db import HistoryDB
+from log_archive import LogArchive
+from watch_logs import WatchLogs
+
+
+def rt_log(platform, test_times):
+    """
+    Args:
+        platform (str): Platform of the log (e.g. 'hera').
+
+        test_times (dict): "[wall+wait, run]" times (MM:SS) per test (e.g. {'control_p8': ('05:00', '04:00')}).
+
+    Return (str): Text of a Regression Test log (as of 02/2024), as featured w/in 'git show'.
+
+    """
+    lines = [f'====START OF {platform.upper()} REGRESSION TESTING LOG====',
+             '',
+             'BASELINE DIRECTORY: /scratch/develop-20240301',
+             'COMPARISON DIRECTORY: /scratch/rt_1',
+             '',
+             "PASS -- COMPILE 's2swa_intel' [11:50, 11:49]"]
+    lines += [f"PASS -- TEST '{test}_intel' [{wallnwait}, {run}](1000 MB)" for test, (wallnwait, run) in test_times.items()]
+    lines += ['',
+              'Starting Date/Time: 20240312 03:57:40',
+              'Ending Date/Time: 20240312 06:17:43',
+              'Total Time: 02h:21m:24s',
+              '',
+              'Result: SUCCESS',
+              '',
+              f'====END OF {platform.upper()} REGRESSION TESTING LOG====']
+
+    return '\n'.join(lines)
+
+
+def commit_logs(repo, logs, message):
+    """
+    Commit logs to the tests directory of a repo & push them to its origin.
+
+    Args:
+        repo (git.Repo): Working repo.
+
+        logs (dict): Text per log filename.
+
+        message (str): Commit message.
+
+    Return (git.Commit): Pushed commit.
+
+    """
+    log_dir = os.path.join(repo.working_dir, 'tests', 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    for log_fn, txt in logs.items():
+        with open(os.path.join(log_dir, log_fn), 'w') as f:
+            f.write(txt + '\n')
+    repo.index.add([os.path.join('tests', 'logs', log_fn) for log_fn in logs])
+    commit = repo.index.commit(message)
+    repo.remote().push('HEAD:develop')
+
+    return commit
+
+
+@pytest.fixture
+def watch_env(tmp_path, monkeypatch):
+    """
+    Bare origin w/ an initial commit of two logs, a working repo pushing to it & a clone watched w/ WatchLogs.
+
+    """
+    origin = Repo.init(tmp_path / 'origin.git', bare=True, initial_branch='develop')
+    work = Repo.init(tmp_path / 'work', initial_branch='develop')
+    work.config_writer().set_value('user', 'name', 'rt').set_value('user', 'email', 'rt@example.com').release()
+    work.create_remote('origin', origin.working_dir)
+    commit_logs(work, {'RegressionTests_hera.log': rt_log('hera', {'control_p8': ('05:00', '04:00'), 'control_c48': ('03:00', '02:30')}),
+                       'RegressionTests_orion.log': rt_log('orion', {'control_p8': ('06:00', '05:00')})}, 'Initial logs')
+    local = Repo.clone_from(origin.working_dir, tmp_path / 'local', branch='develop')
+
+    # Module for loading & preprocessing data w/o the GitHub credentials (persisted under tmp_path/dataframes)
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('dataframes')
+    data_wrapper = LoadData.offline(file_index_path="dataframes/output_file_index.pkl")
+    data_wrapper.my_local_repo = local
+    data_wrapper.aggregates = SummaryAggregates("dataframes/summary_aggregates.pkl")
+    data_wrapper.history_db = HistoryDB("dataframes/history.db")
+    data_wrapper.log_archive = LogArchive("dataframes/log_archive.db")
+
+    return work, WatchLogs(data_wrapper, state_path="dataframes/watch_state.json", render=False)
+
+
+def test_poll_processes_latest_commit_once(watch_env):
+    work, watch = watch_env
+
+    assert watch.poll() == [work.head.commit.hexsha]
+    assert watch.poll() == []
+    wall_time_df = pd.read_pickle("dataframes/wall_time_df.pkl")
+    assert sorted(wall_time_df['Platform']) == ['Hera', 'Hera', 'Orion']
+
+
+def test_poll_merges_only_new_commit_tests(watch_env):
+    work, watch = watch_env
+    watch.poll()
+
+    # Commit changing only the Orion log
+    commit = commit_logs(work, {'RegressionTests_orion.log': rt_log('orion', {'control_p8': ('10:00', '09:00'), 'regional_control': ('02:00', '01:00')})}, 'Orion logs')
+    assert watch.poll() == [commit.hexsha]
+    assert watch.state['last_sha'] == commit.hexsha
+    assert sorted(log_fn for log_fn, _ in watch.data_wrapper.log_files_corpus) == ['RegressionTests_orion.log']
+
+    # Orion's tests replaced & added, Hera's tests kept as of the initial commit
+    wall_time_df = pd.read_pickle("dataframes/wall_time_df.pkl").set_index(['Platform', 'Test'])
+    assert len(wall_time_df) == 4
+    assert wall_time_df.loc[('Orion', 'control_p8'), 'Run Time (min)'] == 9
+    assert wall_time_df.loc[('Orion', 'regional_control'), 'Run Time (min)'] == 1
+    assert wall_time_df.loc[('Hera', 'control_p8'), 'Run Time (min)'] == 4
+    assert wall_time_df.loc[('Hera', 'control_c48'), 'Run Time (min)'] == 2.5
+    test_sz_df = pd.read_pickle("dataframes/test_sz_df.pkl")
+    assert sorted(test_sz_df['Platform']) == ['Hera', 'Hera', 'Orion', 'Orion']